@@ -11,6 +11,7 @@ import pygame
 # Local Module Imports - Game-specific modules
 import constants as c # Game constants and configurations, like colors, sizes, and player settings
 import circleshape as cs # Base class for circular shapes, which the Asteroid class extends
+import spawn_module as sp # Decides the spawn interval and the largest asteroid size allowed
 
 
 class Asteroid(cs.CircleShape):
@@ -25,8 +26,17 @@ class Asteroid(cs.CircleShape):
         - position (pygame.Vector2): Current position of the asteroid
         - velocity (pygame.Vector2): Current velocity vector
         - radius (float): Radius of the asteroid (determines its size)
+        rng: Random number source used when splitting (the global random module unless a game sets its own)
+        particles (ParticleSystem): Where debris goes when the asteroid is hit (None for no debris)
     """
 
+    # Random number source shared by all asteroids in the current game
+    # (setup_game_objects replaces it with a seeded random.Random so games can be reproduced)
+    rng = random
+
+    # Particle system debris is emitted into when an asteroid is hit (setup_game_objects sets it; None emits nothing)
+    particles = None
+
     def __init__(self, x, y, radius):
         """
         Initialize a new asteroid.
@@ -49,6 +59,19 @@ class Asteroid(cs.CircleShape):
         """
         pygame.draw.circle(screen, (c.BACKGROUND_COLOR), self.position, self.radius, 2)
 
+    def cached_image(self, sprite_cache):
+        """
+        Return the pre-rendered outline for an asteroid of this size.
+        
+        Args:
+            sprite_cache (SpriteCache): Cache of pre-rendered images
+        
+        Returns:
+            pygame.Surface: Image drawn the same way as draw() does, centered in the surface
+        """
+
+        return sprite_cache.circle(self.radius, c.BACKGROUND_COLOR)
+
     def update(self, dt):
         """
         Update the asteroid's position based on its velocity and time elapsed.
@@ -57,7 +80,8 @@ class Asteroid(cs.CircleShape):
             dt (float): Delta time - seconds elapsed since last frame
         """
 
-        self.position += self.velocity * dt
+        # Move by velocity (store-backed asteroids are moved in bulk by the entity store, and update_game_state doesn't call this for them)
+        self.integrate(dt)
 
     def split(self):
         """
@@ -76,31 +100,42 @@ class Asteroid(cs.CircleShape):
         - Move 20% faster than the original asteroid
         """
         
+        # Read the asteroid's state once (for store-backed asteroids each read copies a row out of the store)
+        position = self.position
+        velocity = self.velocity
+        radius = self.radius
+
         # Generate a random angle between 20 - 50 degress for the split
-        random_angle = random.uniform(20, 50)
+        random_angle = self.rng.uniform(20, 50)
 
         # Create two new velocity vectors by rotating the original velocity
         # in opposite directions by the random angle
-        split_vector1 = self.velocity.rotate(random_angle)     # Rotate clockwise
-        split_vector2 = self.velocity.rotate(-random_angle)    # Rotate counter-clockwise
+        split_vector1 = velocity.rotate(random_angle)     # Rotate clockwise
+        split_vector2 = velocity.rotate(-random_angle)    # Rotate counter-clockwise
 
         # Calculate the size of the new smaller asteroids
-        new_radius = self.radius - c.ASTEROID_MIN_RADIUS
+        new_radius = radius - c.ASTEROID_MIN_RADIUS
+
+        # Scatter debris from where the asteroid was (particles have their own random source,
+        # so the game's random sequence is the same with or without them)
+        if self.particles is not None:
+            self.particles.burst(position, velocity, radius)
 
         # Destroy the original asteroid
         self.kill()
 
         # If this was already a minimal-sized asteroid, don't create new ones
-        if self.radius <= c.ASTEROID_MIN_RADIUS:
+        if radius <= c.ASTEROID_MIN_RADIUS:
             return
 
         # Create first new asteroid at the same position as the original
-        new_asteroid1 = Asteroid(self.position[0], self.position[1], new_radius)
+        # ('Asteroid.create' reuses a previously destroyed asteroid when a pool is set up)
+        new_asteroid1 = Asteroid.create(position[0], position[1], new_radius)
         # Set velocity: same direction as split_vector but 20$ faster
         new_asteroid1.velocity = split_vector1 * 1.2
 
         # Create second new asteroid at the same position as the original
-        new_asteroid2 = Asteroid(self.position[0], self.position[1], new_radius) 
+        new_asteroid2 = Asteroid.create(position[0], position[1], new_radius)
         # Set veolicty: same direction as split_vector2 but 20% faster
         new_asteroid2.velocity = split_vector2 * 1.2     
 
@@ -111,6 +146,7 @@ class AsteroidField(pygame.sprite.Sprite):
     
     This class handles periodic spawning of new asteroids from the edges
     of the screen, controlling their initial position, size, and velocity.
+    How often asteroids spawn, and how big they may be, is left to its spawn scheduler.
     It inherits from pygame.sprite.Sprite to integrate with the game's
     sprite management system.
     """
@@ -146,16 +182,28 @@ class AsteroidField(pygame.sprite.Sprite):
         ],
     ]
 
-    def __init__(self):
+    def __init__(self, rng=None, scheduler=None, entity_group=None, camera=None):
         """
         Initialize the AsteroidField manager.
     
         Initializes the sprite and sets up a timer to track when new
         asteroids should be spawned.
+    
+        Args:
+            rng: Random number source for spawn positions, speeds, and sizes
+                 (None uses the global random module)
+            scheduler (SpawnScheduler): Decides the spawn interval and allowed sizes (None creates one from the constants)
+            entity_group (pygame.sprite.Group): Group whose size is checked against the scheduler's
+                                                entity budget (None counts no objects)
+            camera (Camera): In a scrolling world, the view asteroids spawn around (None spawns around the screen)
         """
 
         pygame.sprite.Sprite.__init__(self, self.containers) # Initialize as a sprite in the game containers
         self.spawn_timer = 0.0 # Timer to track when to spawn new asteroids
+        self.rng = rng if rng is not None else random # Random number source for spawning
+        self.scheduler = scheduler if scheduler is not None else sp.SpawnScheduler() # Spawn interval and size decisions
+        self.entity_group = entity_group # Live objects counted against the entity budget
+        self.camera = camera # View whose edges asteroids spawn at, in a scrolling world
 
     def spawn(self, radius, position, velocity):
         """
@@ -173,7 +221,7 @@ class AsteroidField(pygame.sprite.Sprite):
         Asteroid class constructor.
         """
 
-        asteroid = Asteroid(position.x, position.y, radius) # Create a new asteroid
+        asteroid = Asteroid.create(position.x, position.y, radius) # Create (or reuse) an asteroid
         asteroid.velocity = velocity # Set its velocity
         # Note: The asteroid is automatically added to the game's asteroid container
 
@@ -182,38 +230,50 @@ class AsteroidField(pygame.sprite.Sprite):
         Update the asteroid field state and potentially spawn new asteroids.
     
         This method is called once per frame to manage the spawning of new asteroids
-        based on elapsed time and configured spawn rate.
+        based on elapsed time and the scheduler's current spawn interval.
     
         Args:
             dt (float): Delta time - seconds elapsed since last frame
         """
 
-        # Add elpsed time to the spawn timer
+        # Add elpsed time to the spawn timer (and move the difficulty curve along)
         self.spawn_timer += dt
+        self.scheduler.advance(dt)
 
         # Check if it's time to spawn a new asteroid
-        if self.spawn_timer > c.ASTEROID_SPAWN_RATE:
+        if self.spawn_timer > self.scheduler.interval():
             self.spawn_timer = 0 # Reset the timer
 
+            # Ask the scheduler how big this asteroid may be, given how many objects are alive
+            # (0 means the entity budget is used up, so this spawn is skipped)
+            max_kind = self.scheduler.decide(len(self.entity_group) if self.entity_group is not None else 0)
+            if max_kind == 0:
+                return
+
             # Select a random edge (contains direction vector and position function)
-            edge = random.choice(self.edges)
+            edge = self.rng.choice(self.edges)
 
             # Generate a random speed between 40 - 100 pixels per second
-            speed = random.randint(40, 100)
+            speed = self.rng.randint(40, 100)
 
             # Create a velocity using the edge's direction and random speed
             velocity = edge[0] * speed
 
             # Add some randomness to the direction by rotating -30 to +30 degrees
-            velocity = velocity.rotate(random.randint(-30, 30))
+            velocity = velocity.rotate(self.rng.randint(-30, 30))
 
             # Generate a position alone the chosen edge (parameter between 0-1)
             # edge[1] is a function that maps a 0-1 value to a position on that edge
-            position = edge[1](random.uniform(0, 1))
+            position = edge[1](self.rng.uniform(0, 1))
+
+            # In a scrolling world, the edges are those of the view, wherever the camera is
+            if self.camera is not None:
+                position += self.camera.offset
 
             # Determine the asteroid size (small, medium, large)
-            # This picks a random integer between 1 and ASTEROID_KINDS (typically 3)
-            kind = random.randint(1, c.ASTEROID_KINDS)
+            # This picks a random integer between 1 and the largest size the scheduler allows
+            # (ASTEROID_KINDS, typically 3, unless the entity budget is nearly used up)
+            kind = self.rng.randint(1, max_kind)
 
             # Spawn the asteroid with calculated properties:
             # - Radius is the minimum radius multiplied by the kind (1, 2, or 3)
@@ -0,0 +1,393 @@
+# benchmark.py:
+# This module times the real game code under seeded, repeatable stress scenarios.
+# It runs headless, reports frames per second and time per entity for each scenario,
+# and can save the results as a baseline file or compare a new run against one.
+# Usage:
+#   python benchmark.py                      Run every scenario and print the results
+#   python benchmark.py --save-baseline      Also write the results to the baseline file
+#   python benchmark.py --compare            Compare the results against the baseline file
+#   python benchmark.py --sprite-groups      Use pygame sprite groups instead of the entity registry
+#                                            (save a baseline with it, then --compare without it to see the difference)
+
+# Standard Library Imports
+import argparse # Used to read command-line options
+import json # Baselines are stored as JSON
+import os # Used to check whether the baseline file exists
+import random # Seeded so every scenario builds the same scene each run
+import sys # Used to return a failing exit code when a regression is found
+import time # perf_counter provides high-resolution timestamps
+
+# Third-Party Imports - External game libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import asteroid_module as a # Asteroid-related classes and functionality
+import entity_store as es # Array-backed storage for object positions, velocities, and radii
+import game_systems as gs # Game running functionality
+import headless_module as hm # Windowless, fixed-timestep game simulation
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import particle_module as pt # Ring-buffer particles for asteroid debris and ship exhaust
+import player_module as p # Player-related classes and functionality
+import render_module as rm # Pre-rendered sprite images for batched drawing
+import world_module as wd # Scrolling world with chunked asteroids and a following camera
+
+
+def new_game(seed, use_store=False):
+    """
+    Create a fresh headless game with the player parked far outside the play area.
+
+    Moving the player away keeps asteroid hits from ending the game in the middle of a benchmark.
+
+    Args:
+        seed (int): Seed for the global random module
+        use_store (bool): If True, objects keep their state in an entity store
+
+    Returns:
+        HeadlessSimulation: The new game
+    """
+
+    random.seed(seed)
+    simulation = hm.HeadlessSimulation(entity_store=es.EntityStore() if use_store else None)
+    simulation.player_character.position = pygame.Vector2(-100000, -100000)
+    return simulation
+
+
+def add_asteroids(count):
+    """
+    Scatter asteroids of every size across the screen with random velocities.
+
+    Args:
+        count (int): Number of asteroids to create
+    """
+
+    for _ in range(count):
+        asteroid = a.Asteroid(
+            random.uniform(0, c.SCREEN_WIDTH),
+            random.uniform(0, c.SCREEN_HEIGHT),
+            c.ASTEROID_MIN_RADIUS * random.randint(1, c.ASTEROID_KINDS),
+        )
+        asteroid.velocity = pygame.Vector2(random.uniform(40, 100), 0).rotate(random.uniform(0, 360))
+
+
+def add_shots(count, shots_group):
+    """
+    Scatter shots across the screen, each flying in a random direction at shot speed.
+
+    Args:
+        count (int): Number of shots to create
+        shots_group (pygame.sprite.Group): Group of all player shot objects
+    """
+
+    for _ in range(count):
+        shot = p.Shot(random.uniform(0, c.SCREEN_WIDTH), random.uniform(0, c.SCREEN_HEIGHT), c.SHOT_RADIUS)
+        shot.velocity = pygame.Vector2(0, c.PLAYER_SHOOT_SPEED).rotate(random.uniform(0, 360))
+        shots_group.add(shot)
+
+
+# --- Scenarios ---
+# Each scenario builds its own seeded scene, then times only the game code being measured.
+# It returns (frames, entity_updates, seconds), where entity_updates is the number of
+# entities processed summed over every timed frame.
+
+def collision_storm(seed, use_store, asteroids=300, shots=300, frames=30):
+    """Full update_game_state frames over a crowded field of asteroids and shots."""
+
+    simulation = new_game(seed, use_store)
+    add_asteroids(asteroids)
+    add_shots(shots, simulation.shots_group)
+
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        entity_updates += len(simulation.updatable_group)
+        gs.update_game_state(simulation.updatable_group, simulation.asteroids_group, simulation.shots_group,
+                             simulation.player_character, c.FIXED_TIMESTEP, simulation.despawn_policy)
+    return frames, entity_updates, time.perf_counter() - start
+
+
+def crowd(seed, use_store, asteroids=10000, shots=200, frames=30):
+    """The collision storm at ten thousand asteroids, where moving, culling, and testing objects in bulk pays off."""
+
+    return collision_storm(seed, use_store, asteroids, shots, frames)
+
+
+def split_cascade(seed, use_store, asteroids=400):
+    """Split the largest asteroids over and over until every piece is destroyed."""
+
+    simulation = new_game(seed, use_store)
+    for _ in range(asteroids):
+        a.Asteroid(random.uniform(0, c.SCREEN_WIDTH), random.uniform(0, c.SCREEN_HEIGHT), c.ASTEROID_MAX_RADIUS)
+
+    rounds = 0
+    splits = 0
+    start = time.perf_counter()
+    while simulation.asteroids_group:
+        for asteroid in simulation.asteroids_group.sprites():
+            asteroid.split()
+            splits += 1
+        rounds += 1
+    return rounds, splits, time.perf_counter() - start
+
+
+def spawn_run(seed, use_store, frames=c.FRAME_RATE * 120):
+    """Two simulated minutes of AsteroidField spawning, movement, and despawning (no collisions)."""
+
+    simulation = new_game(seed, use_store)
+
+    # The update and despawn steps of update_game_state, without shooting or collisions
+    store = simulation.player_character.store
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        entity_updates += len(simulation.updatable_group)
+        if store is not None:
+            store.integrate(c.FIXED_TIMESTEP)
+            gs.update_objects(simulation.updatable_group, c.FIXED_TIMESTEP, skip_group=simulation.asteroids_group)
+        else:
+            simulation.updatable_group.update(c.FIXED_TIMESTEP)
+        simulation.despawn_policy.apply(simulation.asteroids_group, simulation.shots_group, store)
+    return frames, entity_updates, time.perf_counter() - start
+
+
+def group_churn(seed, use_store, asteroids=500, shots=500, frames=60):
+    """Group bookkeeping alone: every frame, update and draw loops over the groups, then every object is killed and replaced."""
+
+    simulation = new_game(seed, use_store)
+    add_asteroids(asteroids)
+    add_shots(shots, simulation.shots_group)
+
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        entity_updates += len(simulation.updatable_group)
+
+        # The group work of a frame, without the per-object game logic: one loop for updates, one for drawing
+        for sprite in simulation.updatable_group:
+            pass
+        for sprite in simulation.drawable_group:
+            pass
+
+        # Replace every asteroid and shot, as kill() and create() would over many frames of play
+        for asteroid in simulation.asteroids_group.sprites():
+            asteroid.kill()
+            a.Asteroid.create(asteroid.position[0], asteroid.position[1], asteroid.radius)
+        for shot in simulation.shots_group.sprites():
+            shot.kill()
+            simulation.shots_group.add(p.Shot.create(shot.position[0], shot.position[1], shot.radius))
+        for cls in (a.Asteroid, p.Shot):
+            if cls.pool is not None:
+                cls.pool.recycle()
+    return frames, entity_updates, time.perf_counter() - start
+
+
+def render_only(seed, use_store, asteroids=300, shots=300, frames=60):
+    """render_screen passes over a static scene of asteroids and shots, drawing every shape."""
+
+    simulation = new_game(seed, use_store)
+    add_asteroids(asteroids)
+    add_shots(shots, simulation.shots_group)
+
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        entity_updates += len(simulation.drawable_group)
+        gs.render_screen(simulation.screen, simulation.drawable_group)
+    return frames, entity_updates, time.perf_counter() - start
+
+
+def render_cached(seed, use_store, asteroids=300, shots=300, frames=60):
+    """render_screen passes over the same scene as render_only, blitting pre-rendered images."""
+
+    simulation = new_game(seed, use_store)
+    add_asteroids(asteroids)
+    add_shots(shots, simulation.shots_group)
+    sprite_cache = rm.SpriteCache()
+
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        entity_updates += len(simulation.drawable_group)
+        gs.render_screen(simulation.screen, simulation.drawable_group, sprite_cache)
+    return frames, entity_updates, time.perf_counter() - start
+
+
+def large_world(seed, use_store, asteroids=20000, frames=300):
+    """Full frames, drawn through the camera, while the player flies through a scrolling world of sleeping asteroids.
+
+    Time per entity counts every asteroid in the world, so it falls as the world grows if only the awake area costs anything.
+    A scrolling world never uses the entity store, so 'use_store' is ignored.
+    """
+
+    random.seed(seed)
+    world = wd.World()
+    # Thrust and shoot for a second and a half, then turn for a third of a second, over and over
+    steering = inp.ScriptedInput([{pygame.K_w: True, pygame.K_SPACE: True}] * 90 + [{pygame.K_a: True}] * 20, loop=True)
+    simulation = hm.HeadlessSimulation(input_source=steering, seed=seed, world=world)
+    world.populate(asteroids, random)
+    sprite_cache = rm.SpriteCache()
+
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        entity_updates += len(world)
+        # Asteroid hits are ignored, so the player keeps flying for every frame
+        gs.update_game_state(simulation.updatable_group, simulation.asteroids_group, simulation.shots_group,
+                             simulation.player_character, c.FIXED_TIMESTEP, simulation.despawn_policy)
+        steering.advance()
+        gs.render_screen(simulation.screen, simulation.drawable_group, sprite_cache, world.camera)
+    return frames, entity_updates, time.perf_counter() - start
+
+
+def particle_storm(seed, use_store, bursts=12, frames=300):
+    """Asteroids bursting into debris every frame, with every particle moved and drawn, until the ring is full and recycling.
+
+    Time per entity counts the live particles, so it shows the cost of one particle's update and draw.
+    """
+
+    simulation = new_game(seed, use_store)
+    particles = pt.ParticleSystem(seed=seed)
+
+    entity_updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        # Largest asteroids hit at random spots, as many as the emission budget lets through
+        for _ in range(bursts):
+            position = pygame.Vector2(random.uniform(0, c.SCREEN_WIDTH), random.uniform(0, c.SCREEN_HEIGHT))
+            velocity = pygame.Vector2(random.uniform(-100, 100), random.uniform(-100, 100))
+            particles.burst(position, velocity, c.ASTEROID_MAX_RADIUS)
+        particles.update(c.FIXED_TIMESTEP)
+        entity_updates += particles.live_count()
+        gs.render_screen(simulation.screen, simulation.drawable_group, particles=particles)
+    return frames, entity_updates, time.perf_counter() - start
+
+
+# Every scenario, in the order they are run and reported
+SCENARIOS = {
+    "collision_storm": collision_storm,
+    "crowd": crowd,
+    "split_cascade": split_cascade,
+    "spawn_run": spawn_run,
+    "group_churn": group_churn,
+    "render_only": render_only,
+    "render_cached": render_cached,
+    "large_world": large_world,
+    "particle_storm": particle_storm,
+}
+
+
+def run_benchmarks(names, seed=0, repeats=3, use_store=False):
+    """
+    Run the chosen scenarios and keep the fastest of several repeats.
+
+    Args:
+        names (iterable): Scenario names from SCENARIOS
+        seed (int): Seed used to build every scene
+        repeats (int): Number of times each scenario is run
+        use_store (bool): If True, objects keep their state in an entity store
+
+    Returns:
+        dict: For each scenario, its frames per second and microseconds per entity
+    """
+
+    results = {}
+    for name in names:
+        best = None
+        for _ in range(repeats):
+            frames, entity_updates, seconds = SCENARIOS[name](seed, use_store)
+            if best is None or seconds < best[2]:
+                best = (frames, entity_updates, seconds)
+
+        frames, entity_updates, seconds = best
+        results[name] = {
+            "fps": round(frames / seconds, 2),
+            "us_per_entity": round(seconds / max(entity_updates, 1) * 1e6, 4),
+        }
+    return results
+
+
+def compare(results, baseline, tolerance=c.BENCHMARK_TOLERANCE):
+    """
+    Compare results against a baseline and describe each scenario's change.
+
+    Args:
+        results (dict): Output of run_benchmarks
+        baseline (dict): Previously saved output of run_benchmarks
+        tolerance (float): Fractional slowdown allowed before a scenario counts as a regression
+
+    Returns:
+        tuple: (report lines, True if any scenario regressed)
+    """
+
+    lines = []
+    regressed = False
+
+    for name, result in results.items():
+        if name not in baseline:
+            lines.append(f"{name:>16}: no baseline")
+            continue
+
+        # Per-entity time is the fairest comparison, since scenes can differ in size between versions
+        ratio = result["us_per_entity"] / baseline[name]["us_per_entity"]
+        status = "ok"
+        if ratio > 1 + tolerance:
+            status = "REGRESSION"
+            regressed = True
+        elif ratio < 1 - tolerance:
+            status = "faster"
+
+        lines.append(f"{name:>16}: {ratio:6.2f}x baseline time per entity  {status}")
+
+    return lines, regressed
+
+
+def main():
+    """
+    Run the benchmarks from the command line.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the Asteroids game code with seeded stress scenarios.")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run: " + ", ".join(SCENARIOS) + " (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed used to build every scene")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per scenario (the fastest is kept)")
+    parser.add_argument("--entity-store", action="store_true", help="keep object state in an entity store")
+    parser.add_argument("--sprite-groups", action="store_true", help="use pygame sprite groups instead of the entity registry")
+    parser.add_argument("--baseline", default=c.BENCHMARK_BASELINE_PATH, help="baseline file to save or compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results to the baseline file")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline file")
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error("unknown scenario(s): " + ", ".join(unknown))
+
+    # Read by game_systems.setup when each scenario creates its game
+    c.USE_ENTITY_REGISTRY = not args.sprite_groups
+
+    results = run_benchmarks(names, args.seed, args.repeats, args.entity_store)
+
+    for name, result in results.items():
+        print(f"{name:>16}: {result['fps']:>12.2f} frames/s  {result['us_per_entity']:>10.4f} us/entity")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline found at {args.baseline}")
+            sys.exit(1)
+
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        lines, regressed = compare(results, baseline)
+        print("\n".join(lines))
+        if regressed:
+            sys.exit(1)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
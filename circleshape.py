@@ -1,25 +1,135 @@
 # circleshape.py:
 # Copied directly from boot.dev as part of the guided Asteroids project
 # Used as a base class for the Asteroid, Player, and Shot classes
+# Extended so objects can optionally keep their state in a shared entity store (see entity_store.py)
 
 import pygame
 
 # Base class for game objects
 class CircleShape(pygame.sprite.Sprite):
+    # EntityStore that new objects are allocated in (None keeps state on each object);
+    # each object remembers its own store, so objects of two games never read each other's arrays
+    store = None
+    # ObjectPool that recycles killed objects of a sub-class (None always constructs new ones)
+    pool = None
+
+    @classmethod
+    def create(cls, *args):
+        # Reuse a killed object from the class's pool if there is one, otherwise construct a new one
+        if cls.pool is not None:
+            return cls.pool.acquire(*args)
+        return cls(*args)
+
     def __init__(self, x, y, radius):
         if hasattr(self, "containers"):
             super().__init__(self.containers)
         else:
             super().__init__()
 
-        self.position = pygame.Vector2(x, y)
-        self.velocity = pygame.Vector2(0, 0)
-        self.radius = radius
+        # Slot in the entity store, or None when the object holds its own vectors
+        self.slot = None
+
+        # Store-backed objects keep these vectors too, to hold their final state once killed
+        self._position = pygame.Vector2(x, y)
+        self._velocity = pygame.Vector2(0, 0)
+        self._radius = radius
+
+        # The store this object's state lives in (an instance attribute, so it no longer follows the class's)
+        self.store = type(self).store
+        if self.store is not None:
+            self.slot = self.store.allocate(self, x, y, radius)
+
+    # Store-backed objects hand out copies of their array rows, so in-place edits
+    # like 'self.position += offset' go through the setters below
+    # (rows are read with item() and written as plain floats: unpacking a row or assigning
+    # a pygame.Vector2 to it goes through NumPy's slow generic sequence handling)
+    @property
+    def position(self):
+        if self.slot is None:
+            return self._position
+        positions = self.store.positions
+        return pygame.Vector2(positions.item(self.slot, 0), positions.item(self.slot, 1))
+
+    @position.setter
+    def position(self, value):
+        if self.slot is None:
+            self._position = value
+        else:
+            self.store.positions[self.slot] = (value[0], value[1])
+
+    @property
+    def velocity(self):
+        if self.slot is None:
+            return self._velocity
+        velocities = self.store.velocities
+        return pygame.Vector2(velocities.item(self.slot, 0), velocities.item(self.slot, 1))
+
+    @velocity.setter
+    def velocity(self, value):
+        if self.slot is None:
+            self._velocity = value
+        else:
+            self.store.velocities[self.slot] = (value[0], value[1])
+
+    @property
+    def radius(self):
+        if self.slot is None:
+            return self._radius
+        return self.store.radii.item(self.slot)
+
+    @radius.setter
+    def radius(self, value):
+        if self.slot is None:
+            self._radius = value
+        else:
+            self.store.radii[self.slot] = value
+
+    def reset(self, x, y, radius):
+        # Bring a killed object back as if it were newly constructed (used by ObjectPool)
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+
+        self.store = type(self).store
+        if self.store is not None:
+            self.slot = self.store.allocate(self, x, y, radius)
+        else:
+            # Reuse the existing vectors instead of allocating new ones
+            self._position.update(x, y)
+            self._velocity.update(0, 0)
+            self._radius = radius
+
+    def kill(self):
+        was_alive = self.alive()
+
+        # Copy the final state out of the store before freeing the slot,
+        # so a killed object can still be read (e.g. by Asteroid.split)
+        slot = self.slot
+        if slot is not None:
+            store = self.store
+            self._position.update(store.positions.item(slot, 0), store.positions.item(slot, 1))
+            self._velocity.update(store.velocities.item(slot, 0), store.velocities.item(slot, 1))
+            self._radius = store.radii.item(slot)
+            store.release(slot)
+            self.slot = None
+        super().kill()
+
+        # Hand the object back to its pool (only once, even if kill is called again)
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+    def integrate(self, dt):
+        # Store-backed objects are moved in one batch by EntityStore.integrate
+        if self.slot is None:
+            self.position += self.velocity * dt
 
     def draw(self, screen):
         # sub-classes must override
         pass
 
+    def cached_image(self, sprite_cache):
+        # sub-classes may return a pre-rendered image; None means draw() is used instead
+        return None
+
     def update(self, dt):
         # sub-classes must override
         pass
@@ -28,3 +138,18 @@ class CircleShape(pygame.sprite.Sprite):
         distance = self.position.distance_to(target.position)
         return distance <= self.radius + target.radius
 
+    def check_swept_collisions(self, target, dt):
+        # Continuous test: did the two circles touch at any moment during the last 'dt' seconds?
+        # Both are assumed to have moved in a straight line at their current velocities
+        motion = (self.velocity - target.velocity) * dt
+        start = (self.position - target.position) - motion
+
+        # Fraction of the step (0 to 1) at which the circles were closest
+        length_squared = motion.length_squared()
+        closest_time = 0.0
+        if length_squared > 0:
+            closest_time = max(0.0, min(1.0, -start.dot(motion) / length_squared))
+
+        closest = start + motion * closest_time
+        reach = self.radius + target.radius
+        return closest.length_squared() <= reach * reach
@@ -0,0 +1,287 @@
+# collision_module.py:
+# This module handles collision detection between groups of circular game objects.
+# It offers two approaches: a uniform grid (broad phase) so that only nearby pairs need the
+# exact circle test from CircleShape.check_collisions, and a batched NumPy test that checks
+# every pair of two groups at once using squared distances.
+
+# Standard Library Imports
+import math
+
+# Third-Party Imports - External libraries
+import numpy as np
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class SpatialHash:
+    """
+    A uniform grid that buckets circular objects by the cells their bounding boxes overlap.
+
+    The grid is meant to be cleared and refilled once per frame. Each inserted item
+    remembers its insertion order, so queries return candidates in the same order
+    they were inserted (which keeps collision results identical to a plain nested loop).
+
+    Attributes:
+        cell_size (float): Width and height of each grid cell, in pixels
+        cells (dict): Maps (column, row) tuples to lists of item indices
+        items (list): Every inserted item, in insertion order
+    """
+
+    def __init__(self, cell_size=c.COLLISION_CELL_SIZE):
+        """
+        Initialize an empty spatial hash.
+
+        Args:
+            cell_size (float): Width and height of each grid cell, in pixels
+        """
+
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = []
+
+    def clear(self):
+        """
+        Remove every item from the grid so it can be refilled for the next frame.
+        """
+
+        self.cells.clear()
+        self.items.clear()
+
+    def cell_range(self, position, radius):
+        """
+        Yield the (column, row) keys of every cell touched by a circle's bounding box.
+
+        Args:
+            position (pygame.Vector2): Center of the circle
+            radius (float): Radius of the circle
+
+        Yields:
+            tuple: (column, row) key of each overlapped cell
+        """
+
+        # Convert the bounding box corners into grid coordinates
+        min_col = math.floor((position[0] - radius) / self.cell_size)
+        max_col = math.floor((position[0] + radius) / self.cell_size)
+        min_row = math.floor((position[1] - radius) / self.cell_size)
+        max_row = math.floor((position[1] + radius) / self.cell_size)
+
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                yield (col, row)
+
+    def insert(self, item, position, radius):
+        """
+        Add an item to every cell its bounding box overlaps.
+
+        Args:
+            item: The object to store (usually a CircleShape)
+            position (pygame.Vector2): Center of the item
+            radius (float): Radius of the item
+        """
+
+        index = len(self.items)
+        self.items.append(item)
+
+        for key in self.cell_range(position, radius):
+            # setdefault creates the cell's list the first time the cell is used
+            self.cells.setdefault(key, []).append(index)
+
+    def query(self, position, radius):
+        """
+        Find every item stored in the cells a circle's bounding box overlaps.
+
+        Args:
+            position (pygame.Vector2): Center of the query circle
+            radius (float): Radius of the query circle
+
+        Returns:
+            list: Candidate items in insertion order, without duplicates.
+                  Candidates still need an exact collision test.
+        """
+
+        found = set()
+        for key in self.cell_range(position, radius):
+            found.update(self.cells.get(key, ()))
+
+        # Sorting the indices restores insertion order
+        return [self.items[index] for index in sorted(found)]
+
+
+def build_spatial_hash(sprites, spatial_hash=None, swept_dt=0.0):
+    """
+    Fill a spatial hash with every sprite in a group.
+
+    Args:
+        sprites (iterable): CircleShape objects to insert, e.g. a pygame.sprite.Group
+        spatial_hash (SpatialHash): Existing grid to reuse; a new one is created if None
+        swept_dt (float): If above zero, each sprite covers the whole path it moved during
+                          the last 'swept_dt' seconds instead of just its current circle
+
+    Returns:
+        SpatialHash: The filled grid
+    """
+
+    if spatial_hash is None:
+        spatial_hash = SpatialHash()
+    else:
+        spatial_hash.clear()
+
+    for sprite in sprites:
+        spatial_hash.insert(sprite, *swept_bounds(sprite, sweep_time(sprite, swept_dt)))
+
+    return spatial_hash
+
+
+def sweep_time(sprite, swept_dt):
+    """
+    Find how much of the last step a sprite existed for, which is how far back it can be swept.
+
+    A shot fired during the step (after the update, so its age is still 0) never was anywhere behind
+    its starting point, so it is not swept at all. Objects without an age are swept over the whole step.
+
+    Args:
+        sprite (CircleShape): The sprite to sweep
+        swept_dt (float): Length of the step, in seconds
+
+    Returns:
+        float: Seconds of the step to sweep the sprite over
+    """
+
+    return min(swept_dt, getattr(sprite, "age", swept_dt))
+
+
+def sweep_times(sprites, swept_dt):
+    """
+    Find how much of the last step each sprite existed for (see sweep_time).
+
+    Args:
+        sprites (sequence): CircleShape objects, e.g. the shots
+        swept_dt (float): Length of the step, in seconds
+
+    Returns:
+        numpy.ndarray: Seconds of the step to sweep each sprite over
+    """
+
+    return np.fromiter((sweep_time(sprite, swept_dt) for sprite in sprites), dtype=np.float64, count=len(sprites))
+
+
+def swept_bounds(sprite, swept_dt):
+    """
+    Find a circle that contains a sprite along the whole path it moved during the last step.
+
+    Args:
+        sprite (CircleShape): The sprite to bound
+        swept_dt (float): Length of the step, in seconds (0 gives the sprite's current circle)
+
+    Returns:
+        tuple: (center, radius) of the bounding circle
+    """
+
+    if swept_dt <= 0:
+        return sprite.position, sprite.radius
+
+    # The path runs from (position - travel) to position; its midpoint is the center of the bound
+    half_travel = sprite.velocity * (swept_dt / 2)
+    return sprite.position - half_travel, sprite.radius + half_travel.length()
+
+
+def circle_arrays(circles):
+    """
+    Gather the positions, velocities, and radii of circular objects into NumPy arrays.
+
+    Store-backed sprites are read straight from their entity store rows.
+
+    Args:
+        circles: A group or sequence of CircleShape objects, or a ready-made
+                 (positions, velocities, radii) tuple of arrays, which is returned unchanged
+
+    Returns:
+        tuple: (positions, velocities, radii) arrays with shapes (N, 2), (N, 2), and (N,)
+    """
+
+    if isinstance(circles, tuple):
+        return circles
+
+    sprites = list(circles)
+    store = sprites[0].store if sprites else None
+
+    if store is not None and all(sprite.slot is not None for sprite in sprites):
+        slots = np.fromiter((sprite.slot for sprite in sprites), dtype=np.intp, count=len(sprites))
+        return store.positions[slots], store.velocities[slots], store.radii[slots]
+
+    positions = np.array([tuple(sprite.position) for sprite in sprites], dtype=np.float64).reshape(-1, 2)
+    velocities = np.array([tuple(sprite.velocity) for sprite in sprites], dtype=np.float64).reshape(-1, 2)
+    radii = np.fromiter((sprite.radius for sprite in sprites), dtype=np.float64, count=len(sprites))
+
+    return positions, velocities, radii
+
+
+def colliding_pairs(circles_a, circles_b, swept_dt=0.0, chunk_pairs=c.COLLISION_CHUNK_PAIRS):
+    """
+    Find every overlapping pair between two sets of circles with a few array operations.
+
+    Distances are compared squared, so no square roots are taken. The rows of the pair matrix
+    are processed in chunks of about 'chunk_pairs' pairs, which bounds the temporary memory used
+    no matter how large the groups grow.
+
+    Args:
+        circles_a: First set of circles (a group, a sequence of sprites, or a tuple from circle_arrays)
+        circles_b: Second set of circles, in the same forms
+        swept_dt (float or numpy.ndarray): If above zero, each pair is tested over the whole of the last 'swept_dt' seconds,
+                          assuming both circles moved in a straight line at their current velocities
+                          (an array gives each circle of 'circles_b' its own length, e.g. from sweep_times)
+        chunk_pairs (int): Approximate number of pairs tested per chunk
+
+    Returns:
+        tuple: (rows, columns) index arrays of the overlapping pairs, sorted by row, then by column
+    """
+
+    positions_a, velocities_a, radii_a = circle_arrays(circles_a)
+    positions_b, velocities_b, radii_b = circle_arrays(circles_b)
+
+    count_a = len(radii_a)
+    count_b = len(radii_b)
+    if count_a == 0 or count_b == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    chunk_rows = max(1, chunk_pairs // count_b)
+    rows = []
+    columns = []
+
+    # One sweep length per column, broadcast over the rows of every chunk
+    swept = np.any(np.asarray(swept_dt) > 0)
+    if swept and np.ndim(swept_dt) == 1:
+        swept_dt = np.asarray(swept_dt)[None, :, None]
+
+    for start in range(0, count_a, chunk_rows):
+        stop = min(start + chunk_rows, count_a)
+
+        # Broadcasting (rows, 1, 2) against (1, B, 2) gives every pairwise offset in the chunk at once
+        offsets = positions_a[start:stop, None, :] - positions_b[None, :, :]
+
+        if swept:
+            # Relative motion during the step, and the offset at the start of the step
+            motion = (velocities_a[start:stop, None, :] - velocities_b[None, :, :]) * swept_dt
+            offsets -= motion
+
+            # Fraction of the step (0 to 1) at which each pair was closest
+            length_squared = np.einsum("abi,abi->ab", motion, motion)
+            projection = -np.einsum("abi,abi->ab", offsets, motion)
+            closest_time = np.clip(
+                np.divide(projection, length_squared, out=np.zeros_like(projection), where=length_squared > 0), 0.0, 1.0
+            )
+            offsets += motion * closest_time[:, :, None]
+
+        distance_squared = np.einsum("abi,abi->ab", offsets, offsets)
+        reach = radii_a[start:stop, None] + radii_b[None, :]
+
+        # nonzero() walks the chunk row by row, so the pairs come out already sorted
+        chunk_rows_hit, chunk_columns_hit = (distance_squared <= reach * reach).nonzero()
+        rows.append(chunk_rows_hit + start)
+        columns.append(chunk_columns_hit)
+
+    if len(rows) == 1:
+        return rows[0], columns[0]
+    return np.concatenate(rows), np.concatenate(columns)
@@ -0,0 +1,71 @@
+# conftest.py:
+# Shared pytest setup for the test_*.py modules that sit next to the game modules they cover.
+# Tests never open a window or play sound (SDL's dummy drivers are used), and the fixtures
+# below play short seeded headless games whose outcome can be compared between game modes.
+# Run every test with: python -m pytest
+
+# Standard Library Imports
+import os # Selects SDL's dummy video and audio drivers before pygame starts
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Third-Party Imports - External libraries
+import pygame
+import pytest
+
+# Local Module Imports - Game-specific modules
+import headless_module as hm # Windowless, fixed-timestep game simulation
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+
+
+# Keys held by the scripted player: fly forward while shooting, then turn while shooting, over and over
+PLAYER_SCRIPT = [{pygame.K_w: True, pygame.K_SPACE: True}] * 50 + [{pygame.K_a: True, pygame.K_SPACE: True}] * 30
+
+
+@pytest.fixture
+def new_game():
+    """
+    Return a function that creates a seeded headless game driven by the scripted player.
+
+    Keyword arguments are passed on to HeadlessSimulation (e.g. entity_store or world).
+    """
+
+    def create(seed=1, **options):
+        return hm.HeadlessSimulation(input_source=inp.ScriptedInput(PLAYER_SCRIPT, loop=True), seed=seed, **options)
+
+    return create
+
+
+@pytest.fixture
+def play_game(new_game):
+    """
+    Return a function that plays a seeded headless game and summarizes how it went.
+
+    The summary holds the frames played, the game's stats, and every asteroid's position and radius
+    in group order, so two games that played out identically have equal summaries.
+    """
+
+    def play(seed=1, steps=2000, **options):
+        simulation = new_game(seed, **options)
+        simulation.run(steps)
+        return game_outcome(simulation)
+
+    return play
+
+
+def game_outcome(simulation):
+    """
+    Summarize a game's state for comparisons.
+
+    Args:
+        simulation (HeadlessSimulation): The game to summarize
+
+    Returns:
+        tuple: Frames played, stats, and (x, y, radius) of every asteroid in group order
+    """
+
+    asteroids = [(round(asteroid.position.x, 6), round(asteroid.position.y, 6), asteroid.radius)
+                 for asteroid in simulation.asteroids_group]
+    return simulation.frame, simulation.stats.as_dict(), asteroids
@@ -20,9 +20,123 @@ PLAYER_SPEED = 200 # Player's movement speed, in pixels per second
 SHOT_RADIUS = 5 # Radius of a player's shot (bullet), in pixels
 PLAYER_SHOOT_SPEED = 500 # Speed of a player's shot, in pixels per second
 PLAYER_SHOOT_COOLDOWN = 0.3 # Time between player's shots, in seconds
+SHOT_LIFETIME = None # Maximum time a shot stays in play, in seconds (None means shots live until they leave the screen)
+
+# --- Despawn Settings ---
+DESPAWN_MARGIN = ASTEROID_MAX_RADIUS * 2 # Distance past the screen edge before shots and asteroids are removed, in pixels
 
 # --- Game Logic ---
 FRAME_RATE = 60 # Used for consistent game speed across hardware, in frames per second
+FAST_STARTUP = True # Start only the pygame subsystems the game uses and load optional modules on first use
+STARTUP_REPORT = False # Print how long each phase of startup took
+SIMULATION_RATE = 60 # Fixed simulation steps per second, independent of the frame rate
+FIXED_TIMESTEP = 1 / SIMULATION_RATE # Seconds simulated per step
+MAX_CATCHUP_STEPS = 5 # Most simulation steps run in one frame; extra time is dropped so slow frames can't snowball
+EPISODE_MAX_FRAMES = FRAME_RATE * 60 * 5 # Frame limit for one headless episode (five simulated minutes)
+USE_ENTITY_STORE = False # Keep positions, velocities, and radii in shared NumPy arrays instead of on each object (faster with thousands of long-lived objects; slower to create, destroy, and draw each one)
+ENTITY_STORE_CAPACITY = 1024 # Starting number of slots in the entity store (grows automatically)
+USE_ENTITY_REGISTRY = True # Keep each object in one typed bucket (with views for the updatable and drawable groups) instead of three pygame sprite groups
+USE_OBJECT_POOLS = True # Recycle destroyed shots and asteroids instead of constructing new ones
+POOL_MAX_SIZE = 512 # Most destroyed objects of each kind kept for reuse
+USE_SWEPT_COLLISIONS = False # Test each shot's whole path during a step against moving asteroids (catches hits at low tick rates)
+COLLISION_CELL_SIZE = ASTEROID_MAX_RADIUS * 2 # Width/height of a collision grid cell, in pixels (fits the largest asteroid)
+USE_BATCH_COLLISIONS = True # Test all shot/asteroid and asteroid/player pairs in a few NumPy operations instead of the collision grid
+COLLISION_CHUNK_PAIRS = 65536 # Most pairs tested at once by a batched collision check (bounds its temporary memory)
+GAME_SEED = None # Seed for the game's random number source (None picks a new seed every game)
+REPLAY_RECORD_PATH = None # File each game's seed and key presses are recorded to, for exact headless playback (None disables recording)
+
+# --- Spawn Scheduler Settings ---
+SPAWN_ENTITY_BUDGET = 300 # Most live objects that asteroid spawning may lead to; near it only small asteroids spawn, at it spawns are skipped (None means no limit)
+SPAWN_DIFFICULTY_CURVE = "constant" # How the time between spawns changes over a game: "constant", "linear", or "exponential"
+SPAWN_MIN_INTERVAL = 0.3 # Time between asteroid spawns once the difficulty curve has fully ramped up, in seconds
+SPAWN_RAMP_TIME = 120.0 # Time the difficulty curve takes to ramp up, in seconds
+SPAWN_FRAME_FEEDBACK = False # Slow down spawning while frames take longer than SPAWN_FRAME_TIME_BUDGET (depends on machine speed, so recorded replays may not reproduce)
+SPAWN_FRAME_TIME_BUDGET = 1 / FRAME_RATE # Frame work time above which spawning slows down, when SPAWN_FRAME_FEEDBACK is on, in seconds
+SPAWN_MAX_THROTTLE = 4.0 # Largest factor slow frames can stretch the time between spawns by
+SPAWN_FRAME_TIME_SMOOTHING = 0.05 # Weight of each new frame time in the smoothed average that drives throttling
+SPAWN_HISTORY = 64 # Number of recent spawn decisions kept for inspection
+
+# --- World Settings ---
+USE_SCROLLING_WORLD = False # Play in a world larger than the screen, with a camera following the player (the entity store, pipelined rendering, and dirty rects are not used with it)
+WORLD_WIDTH = SCREEN_WIDTH * 8 # Width of the scrolling world, in pixels
+WORLD_HEIGHT = SCREEN_HEIGHT * 8 # Height of the scrolling world, in pixels
+WORLD_CHUNK_SIZE = 512 # Width/height of a world chunk, in pixels
+WORLD_AWAKE_MARGIN = DESPAWN_MARGIN # Distance past the edge of the view whose chunks are fully simulated, in pixels (must reach past where asteroids spawn)
+WORLD_DROWSY_CHUNKS = 2 # Rings of chunks beyond the awake area that are simulated less often; chunks further out sleep
+WORLD_DROWSY_INTERVAL = 8 # Simulation steps between updates of the drowsy chunks (each update covers all of them)
+WORLD_INITIAL_ASTEROIDS = 400 # Sleeping asteroids scattered over the world when a game starts
+WORLD_ENTITY_BUDGET = 3000 # Most asteroids in the whole world that spawning may lead to (replaces SPAWN_ENTITY_BUDGET)
+
+# --- Rendering Settings ---
+USE_SPRITE_CACHE = False # Draw objects by copying pre-rendered images instead of drawing each shape every frame (no faster than drawing the thin outlines: see the render_only and render_cached benchmarks)
+OUTLINE_WIDTH = 2 # Thickness of the outlines of the player, asteroids, and shots, in pixels
+SPRITE_PADDING = 2 # Extra space around a pre-rendered image so outlines are not clipped, in pixels
+SHIP_EXTENT = 1.25 # Farthest corner of the ship's triangle from its center, as a multiple of its radius
+SHIP_ROTATION_STEPS = 120 # Number of pre-rendered ship rotations (one every 3 degrees)
+PIPELINED_RENDERING = False # Simulate each frame on a worker thread while the main thread draws the previous one (adds one frame of display latency; dirty rects are not used)
+USE_DIRTY_RECTS = False # Clear and update only the screen areas sprites covered, instead of the whole screen
+DIRTY_RECT_MAX_FRACTION = 0.3 # Fraction of the screen that can change before a full flip is used instead
+SPRITE_COLORKEY = (255, 0, 255) # Color treated as transparent in pre-rendered images (must differ from every outline color)
+
+# --- Profiler Settings ---
+PROFILER_HISTORY = 600 # Number of recent frames kept for percentile summaries (10 seconds at 60 FPS)
+PROFILER_GROUP_NAMES = ("updatable", "drawable", "asteroids", "shots") # Sprite groups whose sizes are recorded
+PROFILER_FONT_SIZE = 20 # Height of the overlay text, in pixels
+PROFILER_EXPORT_PATH = None # File for rolling profile exports, '.json' or '.csv' (None disables exporting)
+
+# --- Background Task Settings ---
+BACKGROUND_FLUSH_INTERVAL = 10.0 # Seconds between background writes of the profile export and replay recording
+SNAPSHOT_PATH = None # File a snapshot of the game is written to in the background (None disables periodic snapshots)
+SNAPSHOT_INTERVAL = 30.0 # Seconds between background snapshots
+CONTROL_HOST = "127.0.0.1" # Address the control socket listens on (local connections only)
+CONTROL_PORT = None # TCP port for the line-based control socket, e.g. 8765 (None disables it)
+
+# --- Multiplayer Settings ---
+SERVER_HOST = "127.0.0.1" # Address the game server listens on (local connections only)
+SERVER_PORT = 8766 # UDP port the game server listens on
+SERVER_TICK_RATE = 30 # Server simulation steps (and snapshots sent to each client) per second
+SERVER_SNAPSHOT_HISTORY = 32 # Snapshots remembered per client, as bases for delta compression
+SERVER_INPUT_BACKLOG = 4 # Most unapplied inputs kept per client; older ones are dropped so a client can't fall behind
+SERVER_CLIENT_TIMEOUT = 5.0 # Seconds without a packet before a client is dropped
+NET_INPUT_REDUNDANCY = 4 # Inputs repeated in every client packet, so one lost packet loses no key presses
+NET_POSITION_SCALE = 8 # Position precision sent over the network, in steps per pixel
+NET_VELOCITY_SCALE = 4 # Velocity precision sent over the network, in steps per pixel per second
+NET_COMPRESSION_LEVEL = 6 # zlib level for snapshot packets (0 to 9)
+
+# --- Training Environment Settings ---
+ENV_NEAREST_ASTEROIDS = 8 # Number of nearest asteroids described in each observation
+ENV_MAX_STEPS = EPISODE_MAX_FRAMES # Steps after which a training episode is cut off (truncated)
+ENV_REWARD_PER_HIT = 1.0 # Reward for each asteroid hit by a shot
+ENV_REWARD_PER_STEP = 0.01 # Reward for each step survived
+ENV_REWARD_GAME_OVER = -10.0 # Reward (penalty) when an asteroid hits the player
+
+# --- Benchmark Settings ---
+BENCHMARK_BASELINE_PATH = "benchmark_baseline.json" # File that benchmark results are saved to and compared against
+BENCHMARK_TOLERANCE = 0.10 # Fractional slowdown per entity allowed before a benchmark counts as a regression
+
+# --- Soak Test Settings ---
+SOAK_DURATION = 60 * 30 # Simulated seconds a soak test plays for (half an hour)
+SOAK_SAMPLE_INTERVAL = 60.0 # Simulated seconds between samples of memory, group sizes, and step times
+SOAK_WARMUP = 120.0 # Simulated seconds before the baseline sample (pools and caches fill up first)
+SOAK_MEMORY_GROWTH_LIMIT = 4 * 1024 * 1024 # Bytes of Python memory that may be added above the baseline before a soak fails
+SOAK_FRAME_TIME_DRIFT_LIMIT = 1.5 # Largest ratio of a sample's median step time to the baseline's before a soak fails
+SOAK_TOP_ALLOCATIONS = 10 # Allocation sites listed when a soak fails
+SOAK_TRACE_DEPTH = 1 # Stack frames tracemalloc records per allocation (more find callers too, but run slower)
+
+# --- Particle Settings ---
+USE_PARTICLES = True # Draw debris when asteroids are hit and exhaust while the ship moves (not with dirty rects or pipelined rendering)
+PARTICLE_CAPACITY = 4096 # Most particles alive at once; new particles overwrite the oldest once this many exist
+PARTICLE_FRAME_BUDGET = 512 # Most particles emitted in one simulation step; further emissions that step are dropped
+PARTICLE_SIZE = 2 # Width and height of a particle, in pixels
+PARTICLE_FADE_LEVELS = 16 # Brightness steps a particle fades through, from the asset color to the background
+PARTICLE_DRAG = 0.3 # Fraction of a particle's speed left after one second
+PARTICLES_PER_SPLIT = 10 # Debris particles per asteroid size step (ASTEROID_MIN_RADIUS) when an asteroid is hit
+PARTICLE_DEBRIS_SPEED = (40, 160) # Lowest and highest debris speed, in pixels per second
+PARTICLE_DEBRIS_LIFETIME = (0.4, 1.0) # Shortest and longest debris lifetime, in seconds
+PARTICLE_THRUST_RATE = 90 # Exhaust particles per second while the ship moves
+PARTICLE_THRUST_SPEED = (60, 140) # Lowest and highest exhaust speed, in pixels per second
+PARTICLE_THRUST_LIFETIME = (0.15, 0.4) # Shortest and longest exhaust lifetime, in seconds
+PARTICLE_THRUST_SPREAD = 15 # Largest angle exhaust leaves either side of straight back, in degrees
 
 # --- Visual Settings ---
 BACKGROUND_COLOR = (0, 0, 0) # RGB color for the background (black)
@@ -0,0 +1,130 @@
+# entity_store.py:
+# This module handles array-backed storage for circular game objects.
+# Instead of every sprite owning its own pygame.Vector2 position and velocity, the store keeps
+# them in contiguous NumPy arrays so movement and collision tests run as a few batched operations.
+
+# Third-Party Imports - External libraries
+import numpy as np
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class EntityStore:
+    """
+    Structure-of-arrays storage for the position, velocity, and radius of game objects.
+
+    Each stored object is given a slot (row index). Sprites keep their slot number and read or write
+    their state through it, while the store can move every object at once with a single array operation.
+    Released slots are reused, and the arrays double in size whenever they run out of room.
+
+    Attributes:
+        positions (numpy.ndarray): (capacity, 2) array of x, y positions
+        velocities (numpy.ndarray): (capacity, 2) array of x, y velocities
+        radii (numpy.ndarray): (capacity,) array of radii
+        alive (numpy.ndarray): (capacity,) boolean array marking slots currently in use
+        owners (list): The sprite stored in each slot (None for free slots)
+    """
+
+    def __init__(self, capacity=c.ENTITY_STORE_CAPACITY):
+        """
+        Initialize an empty entity store.
+
+        Args:
+            capacity (int): Number of slots to allocate up front
+        """
+
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.radii = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.owners = [None] * capacity
+
+        # Free slots are kept as a stack, lowest index on top, so low slots are reused first
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    @property
+    def capacity(self):
+        """Total number of slots currently allocated."""
+
+        return len(self.radii)
+
+    @property
+    def count(self):
+        """Number of slots currently in use."""
+
+        return self.capacity - len(self.free_slots)
+
+    def grow(self):
+        """
+        Double the capacity of every array, keeping the existing data.
+        """
+
+        old_capacity = self.capacity
+        new_capacity = old_capacity * 2
+
+        self.positions = np.resize(self.positions, (new_capacity, 2))
+        self.velocities = np.resize(self.velocities, (new_capacity, 2))
+        self.radii = np.resize(self.radii, new_capacity)
+        self.alive = np.resize(self.alive, new_capacity)
+
+        # np.resize fills the new rows by repeating old data, so clear them explicitly
+        self.positions[old_capacity:] = 0
+        self.velocities[old_capacity:] = 0
+        self.radii[old_capacity:] = 0
+        self.alive[old_capacity:] = False
+
+        self.owners.extend([None] * old_capacity)
+        self.free_slots.extend(range(new_capacity - 1, old_capacity - 1, -1))
+
+    def allocate(self, owner, x, y, radius):
+        """
+        Reserve a slot for a new object.
+
+        Args:
+            owner (CircleShape): The sprite that will use this slot
+            x (float): Initial x position
+            y (float): Initial y position
+            radius (float): Radius of the object
+
+        Returns:
+            int: The slot index assigned to the object
+        """
+
+        if not self.free_slots:
+            self.grow()
+
+        # Free slots always have zero velocity (see release and grow), so only the position and radius are written
+        slot = self.free_slots.pop()
+        self.positions[slot] = (x, y)
+        self.radii[slot] = radius
+        self.alive[slot] = True
+        self.owners[slot] = owner
+
+        return slot
+
+    def release(self, slot):
+        """
+        Free a slot so it can be reused by a future object.
+
+        The velocity is zeroed so the batched movement step leaves free slots untouched.
+
+        Args:
+            slot (int): The slot index to free
+        """
+
+        self.velocities[slot] = (0, 0)
+        self.alive[slot] = False
+        self.owners[slot] = None
+        self.free_slots.append(slot)
+
+    def integrate(self, dt):
+        """
+        Move every stored object by its velocity in one vectorized step.
+
+        Args:
+            dt (float): Delta time - seconds elapsed since last frame
+        """
+
+        # Free slots have zero velocity, so the whole array can be updated without a mask
+        self.positions += self.velocities * dt
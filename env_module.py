@@ -0,0 +1,304 @@
+# env_module.py:
+# This module wraps the game as a training environment for agents, in the style of Gym.
+# reset(seed) starts a game and step(action) advances it by one fixed step. Observations are built
+# straight from the game objects (the player plus the nearest asteroids, relative to the player),
+# so nothing is ever rendered. BatchedAsteroidsEnv steps many games in one process and returns
+# every observation, reward, and done flag as one NumPy array.
+# Run directly for a throughput check: python env_module.py --envs 64 --steps 200
+
+# Standard Library Imports
+import argparse # Used to read command-line options when run directly
+import numbers # Recognizes NumPy integers as seeds, as well as Python ints
+import time # Used to measure steps per second
+
+# Third-Party Imports - External libraries
+import numpy as np
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import collision_module as col # Gathers object positions, velocities, and radii into arrays
+import headless_module as hm # Windowless, fixed-timestep game simulation
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+
+
+# Number of actions: every combination of the keys in input_module.ACTION_KEYS (W, S, A, D, Space),
+# so an action is the same bitmask that replays store
+ACTION_COUNT = 1 << len(inp.ACTION_KEYS)
+
+# Player features at the start of each observation: x, y, sin(rotation), cos(rotation), shot timer
+PLAYER_FEATURES = 5
+# Features for each of the nearest asteroids: x, y, velocity x, velocity y (relative to the player), and radius
+ASTEROID_FEATURES = 5
+
+
+def observation_size(nearest=c.ENV_NEAREST_ASTEROIDS):
+    """
+    Length of one observation vector.
+
+    Args:
+        nearest (int): Number of asteroids included in each observation
+
+    Returns:
+        int: Number of floats in an observation
+    """
+
+    return PLAYER_FEATURES + nearest * ASTEROID_FEATURES
+
+
+class AsteroidsEnv:
+    """
+    One game, driven one fixed step at a time by an agent's actions.
+
+    Attributes:
+        nearest (int): Number of asteroids included in each observation
+        max_steps (int): Steps after which an episode is cut off (truncated)
+        simulation (HeadlessSimulation): The game currently being played (None before the first reset)
+        input_source (ActionInput): Holds the keys of the current action
+        steps (int): Steps taken in the current episode
+    """
+
+    def __init__(self, nearest=c.ENV_NEAREST_ASTEROIDS, max_steps=c.ENV_MAX_STEPS, dt=c.FIXED_TIMESTEP):
+        """
+        Initialize the environment. Call reset() before the first step().
+
+        Args:
+            nearest (int): Number of asteroids included in each observation
+            max_steps (int): Steps after which an episode is cut off
+            dt (float): Seconds simulated per step
+        """
+
+        self.nearest = nearest
+        self.max_steps = max_steps
+        self.dt = dt
+        self.simulation = None
+        self.input_source = inp.ActionInput()
+        self.steps = 0
+        self.destroyed = 0 # Asteroids destroyed so far this episode, for per-step rewards
+
+    def reset(self, seed=None):
+        """
+        Start a new game.
+
+        Args:
+            seed (int): Seed for the game's random number source, a Python or NumPy integer (None gives an unreproducible game)
+
+        Returns:
+            numpy.ndarray: The first observation, shaped (observation_size(nearest),)
+        """
+
+        # random.Random only accepts Python ints, so NumPy integers (e.g. from np.arange) are converted
+        if seed is not None:
+            seed = int(seed)
+
+        self.input_source.set_action(0)
+        self.simulation = hm.HeadlessSimulation(input_source=self.input_source, dt=self.dt, seed=seed)
+        self.steps = 0
+        self.destroyed = 0
+
+        return self.observe()
+
+    def step(self, action):
+        """
+        Hold the action's keys for one fixed step.
+
+        Args:
+            action (int): Bitmask of held keys, from 0 to ACTION_COUNT - 1
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info), where 'terminated' means an asteroid
+                   hit the player and 'truncated' means the episode reached 'max_steps'
+        """
+
+        reward, terminated, truncated, info = self.advance(action)
+        return self.observe(), reward, terminated, truncated, info
+
+    def advance(self, action):
+        """
+        Like step(), but without building the observation (for callers that fill their own arrays).
+
+        Args:
+            action (int): Bitmask of held keys, from 0 to ACTION_COUNT - 1
+
+        Returns:
+            tuple: (reward, terminated, truncated, info)
+        """
+
+        self.input_source.set_action(action)
+        terminated = self.simulation.step()
+        self.steps += 1
+
+        # Reward hits, a little for every step survived, and a penalty for being hit
+        destroyed = self.simulation.stats.asteroids_destroyed
+        reward = c.ENV_REWARD_PER_HIT * (destroyed - self.destroyed) + c.ENV_REWARD_PER_STEP
+        if terminated:
+            reward += c.ENV_REWARD_GAME_OVER
+        self.destroyed = destroyed
+
+        truncated = not terminated and self.steps >= self.max_steps
+        info = {"steps": self.steps, "asteroids_destroyed": destroyed}
+
+        return reward, terminated, truncated, info
+
+    def observe(self, out=None):
+        """
+        Describe the game from the player's point of view.
+
+        The player's position is given in screen coordinates; the nearest asteroids (closest first)
+        are given relative to the player. Unused asteroid slots are left as zeros (radius 0).
+
+        Args:
+            out (numpy.ndarray): Optional float32 row to fill instead of allocating a new one
+
+        Returns:
+            numpy.ndarray: The observation, shaped (observation_size(nearest),)
+        """
+
+        if out is None:
+            out = np.zeros(observation_size(self.nearest), dtype=np.float32)
+        else:
+            out[:] = 0
+
+        player = self.simulation.player_character
+        position = player.position
+        rotation = np.radians(player.rotation)
+        out[:PLAYER_FEATURES] = (position[0], position[1], np.sin(rotation), np.cos(rotation), player.shot_timer)
+
+        asteroids = self.simulation.asteroids_group
+        if not asteroids:
+            return out
+
+        positions, velocities, radii = col.circle_arrays(asteroids)
+        offsets = positions - (position[0], position[1])
+        distance_squared = np.einsum("ij,ij->i", offsets, offsets)
+
+        # Partial sort: only the nearest few need to be found and ordered
+        count = min(self.nearest, len(radii))
+        nearest = np.argpartition(distance_squared, count - 1)[:count] if count < len(radii) else np.arange(count)
+        nearest = nearest[np.argsort(distance_squared[nearest], kind="stable")]
+
+        features = out[PLAYER_FEATURES:].reshape(self.nearest, ASTEROID_FEATURES)
+        features[:count, 0:2] = offsets[nearest]
+        features[:count, 2:4] = velocities[nearest]
+        features[:count, 4] = radii[nearest]
+
+        return out
+
+
+class BatchedAsteroidsEnv:
+    """
+    Many independent games stepped together, with observations and results batched into arrays.
+
+    Finished episodes reset automatically: the observation returned for a finished game is the first
+    observation of its next episode, and the last observation of the finished one is put in its info.
+
+    Attributes:
+        envs (list): The AsteroidsEnv for each game
+        num_envs (int): Number of games
+        observations (numpy.ndarray): (num_envs, observation_size) array, reused every step
+        next_seeds (list): Seed each game uses for its next automatic reset (None if unseeded)
+    """
+
+    def __init__(self, num_envs, nearest=c.ENV_NEAREST_ASTEROIDS, max_steps=c.ENV_MAX_STEPS, dt=c.FIXED_TIMESTEP):
+        """
+        Initialize the games. Call reset() before the first step().
+
+        Args:
+            num_envs (int): Number of games to run side by side
+            nearest (int): Number of asteroids included in each observation
+            max_steps (int): Steps after which an episode is cut off
+            dt (float): Seconds simulated per step
+        """
+
+        self.num_envs = num_envs
+        self.envs = [AsteroidsEnv(nearest, max_steps, dt) for _ in range(num_envs)]
+        self.observations = np.zeros((num_envs, observation_size(nearest)), dtype=np.float32)
+        self.next_seeds = [None] * num_envs
+
+    def reset(self, seed=None):
+        """
+        Start a new game in every environment.
+
+        Args:
+            seed (int or list): One seed per environment, or a single seed that environment i uses as
+                                seed + i (None gives unreproducible games); NumPy integers and arrays work too
+
+        Returns:
+            numpy.ndarray: First observations, shaped (num_envs, observation_size)
+        """
+
+        if seed is None:
+            seeds = [None] * self.num_envs
+        elif isinstance(seed, numbers.Integral):
+            seeds = [int(seed) + index for index in range(self.num_envs)]
+        else:
+            seeds = [None if env_seed is None else int(env_seed) for env_seed in seed]
+
+        for index, (env, env_seed) in enumerate(zip(self.envs, seeds)):
+            env.reset(env_seed)
+            env.observe(self.observations[index])
+            # Later episodes of this environment continue from seeds no other environment uses
+            self.next_seeds[index] = None if env_seed is None else env_seed + self.num_envs
+
+        return self.observations.copy()
+
+    def step(self, action_batch):
+        """
+        Apply one action to each game and advance them all by one fixed step.
+
+        Args:
+            action_batch: One action bitmask per environment (sequence or integer array)
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, infos), where the first four are arrays
+                   with one entry per environment and 'infos' is a list of dictionaries
+        """
+
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        infos = []
+
+        for index, (env, action) in enumerate(zip(self.envs, np.asarray(action_batch).tolist())):
+            rewards[index], terminated[index], truncated[index], info = env.advance(action)
+
+            if terminated[index] or truncated[index]:
+                # Keep the last observation of the finished episode, then start the next one
+                info["final_observation"] = env.observe()
+                env.reset(self.next_seeds[index])
+                if self.next_seeds[index] is not None:
+                    self.next_seeds[index] += self.num_envs
+
+            env.observe(self.observations[index])
+            infos.append(info)
+
+        return self.observations.copy(), rewards, terminated, truncated, infos
+
+
+def main():
+    """
+    Step a batch of environments with random actions and report throughput.
+    """
+
+    parser = argparse.ArgumentParser(description="Measure the throughput of batched Asteroids environments.")
+    parser.add_argument("--envs", type=int, default=64, help="number of environments stepped together")
+    parser.add_argument("--steps", type=int, default=200, help="batched steps to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first environment")
+    args = parser.parse_args()
+
+    env = BatchedAsteroidsEnv(args.envs)
+    env.reset(args.seed)
+    actions = np.random.default_rng(args.seed).integers(0, ACTION_COUNT, size=(args.steps, args.envs))
+
+    start = time.perf_counter()
+    episodes = 0
+    for action_batch in actions:
+        _, _, terminated, truncated, _ = env.step(action_batch)
+        episodes += int(terminated.sum() + truncated.sum())
+    elapsed = time.perf_counter() - start
+
+    total = args.steps * args.envs
+    print(f"{total} environment steps in {elapsed:.3f}s ({total / max(elapsed, 1e-9):.0f} steps/s), {episodes} episodes finished")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# episode_runner.py:
+# This module runs many independent headless games ("episodes") at the same time.
+# Each episode runs in its own worker process with its own seeded random number source, so game
+# state stored on classes (like Asteroid.containers) is never shared between games.
+# Episodes can also branch from one saved snapshot: each restores the same world, then continues with its own seed.
+# Run directly for a results table: python episode_runner.py --episodes 8 --workers 4
+
+# Standard Library Imports
+import argparse # Used to read command-line options when run directly
+import concurrent.futures # Used to spread episodes across a pool of worker processes
+
+# Third-Party Imports - External game libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import headless_module as hm # Windowless, fixed-timestep game simulation
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import startup_module as st # Lazy imports and startup timing
+
+# Only needed when episodes branch from a snapshot, so it is loaded on first use
+snap = st.lazy_import("snapshot_module") # Binary capture and restore of the whole game state
+
+
+# Names of the built-in input scripts an episode can use
+INPUT_SCRIPTS = {
+    "none": [],                                   # Never press anything
+    "spin": [[pygame.K_d, pygame.K_SPACE]],       # Turn clockwise while firing
+}
+
+# Columns of the result table, in display order
+RESULT_COLUMNS = ["seed", "frames", "asteroids_destroyed", "peak_asteroids", "peak_shots", "peak_entities", "game_over"]
+
+
+def run_episode(seed, max_frames=c.EPISODE_MAX_FRAMES, dt=c.FIXED_TIMESTEP, script="spin", snapshot_path=None):
+    """
+    Play one complete headless game and return its stats.
+
+    Runs inside a worker process. The game gets its own random.Random seeded with 'seed',
+    so the same seed always produces the same episode.
+
+    Args:
+        seed (int): Random seed for this episode
+        max_frames (int): Upper limit on the number of frames to simulate
+        dt (float): Seconds simulated per frame
+        script (str): Name of the input script from INPUT_SCRIPTS
+        snapshot_path (str): Snapshot file to start from instead of a new game (None starts fresh);
+                             the random source is re-seeded with 'seed' after restoring, so branches differ
+
+    Returns:
+        dict: The episode's seed, stats, and whether it ended in a game over
+    """
+
+    input_source = inp.ScriptedInput(INPUT_SCRIPTS[script], loop=True)
+    simulation = hm.HeadlessSimulation(input_source=input_source, dt=dt, seed=seed)
+
+    if snapshot_path is not None:
+        # Every worker maps the same file, so the checkpoint is shared rather than copied per episode
+        simulation.restore(snap.Snapshot.load(snapshot_path))
+        simulation.asteroid_field.rng.seed(seed)
+
+    simulation.run(max_frames)
+
+    result = {"seed": seed}
+    result.update(simulation.stats.as_dict())
+    result["game_over"] = simulation.game_over
+
+    return result
+
+
+def run_episodes(seeds, max_frames=c.EPISODE_MAX_FRAMES, dt=c.FIXED_TIMESTEP, script="spin", workers=None, snapshot_path=None):
+    """
+    Run one episode per seed across a pool of worker processes.
+
+    Args:
+        seeds (iterable): Random seed for each episode
+        max_frames (int): Upper limit on the number of frames per episode
+        dt (float): Seconds simulated per frame
+        script (str): Name of the input script from INPUT_SCRIPTS
+        workers (int): Number of worker processes (None uses one per CPU core)
+        snapshot_path (str): Snapshot file every episode branches from (None starts each from a new game)
+
+    Returns:
+        list: One result dictionary per episode, in the same order as 'seeds'
+    """
+
+    seeds = list(seeds)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        # pool.map keeps results in the same order as the seeds
+        results = pool.map(
+            run_episode,
+            seeds,
+            [max_frames] * len(seeds),
+            [dt] * len(seeds),
+            [script] * len(seeds),
+            [snapshot_path] * len(seeds),
+        )
+        return list(results)
+
+
+def format_results(results):
+    """
+    Lay out episode results as a plain-text table.
+
+    Args:
+        results (list): Result dictionaries from run_episode
+
+    Returns:
+        str: The table, one row per episode
+    """
+
+    rows = [RESULT_COLUMNS] + [[str(result[column]) for column in RESULT_COLUMNS] for result in results]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(RESULT_COLUMNS))]
+
+    return "\n".join("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+
+
+def main():
+    """
+    Run a batch of episodes from the command line and print the result table.
+    """
+
+    parser = argparse.ArgumentParser(description="Run many headless Asteroids episodes in parallel.")
+    parser.add_argument("--episodes", type=int, default=8, help="number of episodes to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first episode (others count up from it)")
+    parser.add_argument("--frames", type=int, default=c.EPISODE_MAX_FRAMES, help="maximum frames per episode")
+    parser.add_argument("--script", choices=sorted(INPUT_SCRIPTS), default="spin", help="input script for every episode")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU core)")
+    parser.add_argument("--snapshot", default=None, help="snapshot file every episode branches from")
+    args = parser.parse_args()
+
+    seeds = range(args.seed, args.seed + args.episodes)
+    results = run_episodes(seeds, args.frames, script=args.script, workers=args.workers, snapshot_path=args.snapshot)
+
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@
 
 
 # Standard Library Imports 
-import sys # Used for systen-level operations like exiting the game
+import os # Used to select SDL's dummy drivers for headless runs
+import random # Default random number source when a game isn't given its own
 
 # Third-Party Imports - External game libraries
 import pygame
@@ -12,17 +13,30 @@ import pygame
 import constants as c # Game constants and configurations, like colors, sizes, and player settings
 import player_module as p # Player-related classes and functionality
 import asteroid_module as a # Asteroid-related classes and functionality
+import circleshape as cs # Base class for circular shapes, which holds the shared entity store
+import collision_module as col # Spatial hash broad phase for collision detection
+import profiler_module as prof # Optional per-section frame timing
+import render_module as rm # Pre-rendered sprite images for batched drawing
+import pool_module as pm # Recycling of destroyed asteroids and shots
+import registry_module as rg # Typed entity buckets that stand in for the pygame sprite groups
+import spawn_module as sp # Decides the spawn interval and the largest asteroid size allowed
 
 
-def setup():
+def setup(headless=False):
     """
     Initialize pygame and create essential game components.
     
     This function:
-    - Initializes the pygame library
+    - Initializes the pygame library (with 'c.FAST_STARTUP', only the subsystems the game uses:
+      the display, which also brings up events, for a window, and nothing at all when headless)
     - Creates the game window with dimensions from constants
+      (or an off-screen surface with SDL's dummy drivers when running headless)
     - Sets up a clock for managing frame rate
-    - Creates sprite groups for organizing game objects
+    - Creates sprite groups for organizing game objects (with 'c.USE_ENTITY_REGISTRY', typed
+      entity buckets, plus views over them for the updatable and drawable groups)
+    
+    Args:
+        headless (bool): If True, no window is opened and nothing is shown on screen
     
     Returns:
         tuple: Contains:
@@ -34,15 +48,35 @@ def setup():
             - shots_group: sprite group specifically for player shots
     """
 
+    if headless:
+        # Tell SDL not to use a real display or sound device (must happen before pygame.init)
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
     # Initialize pygame library
-    pygame.init()
+    if not c.FAST_STARTUP:
+        # Every subsystem, including audio and joysticks the game never uses
+        pygame.init()
+    elif not headless:
+        # Just the display (SDL starts the event subsystem along with it)
+        pygame.display.init()
+    # Headless fast starts need no subsystems: surfaces, drawing, vectors, and sprites work without them
 
-    # Create game window using dimensions from constants
-    screen = pygame.display.set_mode((c.SCREEN_WIDTH, c.SCREEN_HEIGHT))
+    if headless:
+        # Off-screen surface with the same size as the window, so rendering code still works
+        screen = pygame.Surface((c.SCREEN_WIDTH, c.SCREEN_HEIGHT))
+    else:
+        # Create game window using dimensions from constants
+        screen = pygame.display.set_mode((c.SCREEN_WIDTH, c.SCREEN_HEIGHT))
 
     # Create clock to manage game's frame rate
     clock = pygame.time.Clock()
 
+    if c.USE_ENTITY_REGISTRY:
+        # Each object joins just one bucket for its type; updatable and drawable are views over the buckets
+        updatable_group, drawable_group, asteroids_group, shots_group = rg.EntityRegistry().groups()
+        return screen, clock, updatable_group, drawable_group, asteroids_group, shots_group
+
     # Create sprite groups to organize and manage different types of game objects
     updatable_group = pygame.sprite.Group()  # Objects that need logic updates each frame
     drawable_group = pygame.sprite.Group()   # Objects that need to be drawn each frame
@@ -52,80 +86,178 @@ def setup():
     return screen, clock, updatable_group, drawable_group, asteroids_group, shots_group
 
 
-def setup_game_objects(updatable_group, drawable_group, asteroids_group, shots_group):
+def setup_game_objects(updatable_group, drawable_group, asteroids_group, shots_group, entity_store=None, use_pools=c.USE_OBJECT_POOLS, rng=None, world=None, particles=None):
     """
     Create and initialize all game objects and assign them to appropriate sprite groups.
     
     This function:
+    - Selects where object positions, velocities, and radii are stored
     - Sets up class containers for automatic sprite group assignment
-    - Creates the player character at the center of the screen
+    - Sets up object pools so destroyed asteroids and shots are recycled (if enabled)
+    - Gives asteroid spawning and splitting the game's random number source
+    - Creates the player character at the center of the screen (or of the world)
     - Configures asteroid class sprite group assignments
+    - In a scrolling world, attaches the world to the game and scatters its starting asteroids
     - Creates the asteroid field that will manage asteroid spawning
     - Sets up shot class sprite group assignments
+    - Points asteroid debris and ship exhaust at the particle system (if one is given)
     
     Args:
         updatable_group (pygame.sprite.Group): Group of all objects that need updating each frame
         drawable_group (pygame.sprite.Group): Group of all objects that need to be drawn
         asteroids_group (pygame.sprite.Group): Group of all asteroid objects
         shots_group (pygame.sprite.Group): Group of all player shot objects
+        entity_store (EntityStore): Array-backed storage shared by all objects (None keeps state on each object)
+        use_pools (bool): If True, destroyed asteroids and shots are reused instead of constructing new ones
+        rng (random.Random): Random number source for this game, e.g. random.Random(seed) for a reproducible game
+                             (None uses the global random module)
+        world (World): A scrolling world larger than the screen to play in (None plays on one screen)
+        particles (ParticleSystem): Where asteroid debris and ship exhaust are emitted (None emits no particles)
     
     Returns:
         tuple: Contains:
             - player_character: The player's ship object
             - asteroid_field: Manager object that handles asteroid spawning
+    
+    Raises:
+        ValueError: If both a world and an entity store are given (the store would move every asteroid in the world each step)
     """
+
+    if world is not None and entity_store is not None:
+        raise ValueError("A scrolling world cannot be used with an entity store")
     
+    # New CircleShapes (player, asteroids, shots) are allocated in the entity store, if one is given (each keeps its own)
+    cs.CircleShape.store = entity_store
+
+    # With an entity registry (see setup), objects join only their own type's bucket,
+    # and the updatable and drawable views pick them up from there
+    registry = getattr(updatable_group, "registry", None)
+
     # Configure Player class to automatically add instances to these sprite groups
-    p.Player.containers = (updatable_group, drawable_group)
-    # Create player at the center of the screen
-    player_character = p.Player((c.SCREEN_WIDTH / 2), (c.SCREEN_HEIGHT / 2))
+    p.Player.containers = (updatable_group, drawable_group) if registry is None else registry.players
+    # Create player at the center of the screen (or of the world)
+    if world is None:
+        player_character = p.Player((c.SCREEN_WIDTH / 2), (c.SCREEN_HEIGHT / 2))
+    else:
+        player_character = p.Player((world.width / 2), (world.height / 2))
 
     # Configure Asteroid class to automatically add instances to these sprite groups
-    a.Asteroid.containers = (asteroids_group, updatable_group, drawable_group)
+    a.Asteroid.containers = (asteroids_group, updatable_group, drawable_group) if registry is None else asteroids_group
+    # Asteroids split using this game's random number source
+    a.Asteroid.rng = rng if rng is not None else random
+
+    # Give each game fresh pools, so objects from a previous game are never reused in this one
+    a.Asteroid.pool = pm.ObjectPool(a.Asteroid) if use_pools else None
+    p.Shot.pool = pm.ObjectPool(p.Shot) if use_pools else None
 
     # Configure AsteroidField class to automatically add to updatable_group for spawning logic
-    a.AsteroidField.containers = (updatable_group)
-    # Create the asteroid field manager
-    asteroid_field = a.AsteroidField()
+    a.AsteroidField.containers = (updatable_group) if registry is None else registry.fields
+
+    if world is None:
+        # Create the asteroid field manager; its spawn scheduler counts every updated object against the entity budget
+        asteroid_field = a.AsteroidField(rng, entity_group=updatable_group)
+    else:
+        # The world is updated before the asteroid field, so the camera has moved before asteroids spawn around it
+        world.attach(player_character, asteroids_group, shots_group, a.AsteroidField.containers)
+        world.populate(c.WORLD_INITIAL_ASTEROIDS, rng if rng is not None else random)
+        # Spawning is limited by every asteroid in the world, awake or not, so the world cannot fill up forever
+        scheduler = sp.SpawnScheduler(entity_budget=c.WORLD_ENTITY_BUDGET)
+        asteroid_field = a.AsteroidField(rng, scheduler=scheduler, entity_group=world, camera=world.camera)
 
     # Configure Shot call to automatically add instances to these sprite groups
-    p.Shot.containers = (shots_group, updatable_group, drawable_group)
+    p.Shot.containers = (shots_group, updatable_group, drawable_group) if registry is None else shots_group
+
+    # Asteroids hit by shots scatter debris, and the moving ship leaves exhaust, in the particle system
+    a.Asteroid.particles = particles
+    p.Player.particles = particles
 
     return player_character, asteroid_field
 
 
-def handle_events():
+# Class attributes that tie objects to one game: sprite containers, object pools, the entity store,
+# the asteroids' random number source, and the particle system. Several games in one process each keep their own copy
+# (from class_bindings) and put it back with apply_class_bindings before running.
+CLASS_BINDINGS = (
+    (cs.CircleShape, "store"),
+    (p.Player, "containers"),
+    (a.Asteroid, "containers"),
+    (a.Asteroid, "rng"),
+    (a.Asteroid, "pool"),
+    (a.AsteroidField, "containers"),
+    (p.Shot, "containers"),
+    (p.Shot, "pool"),
+    (a.Asteroid, "particles"),
+    (p.Player, "particles"),
+)
+
+
+def class_bindings():
+    """
+    Record the class-level settings of the game set up most recently by setup_game_objects.
+    
+    Returns:
+        dict: Maps each (class, attribute name) in CLASS_BINDINGS to its current value
+    """
+
+    return {(cls, name): getattr(cls, name) for cls, name in CLASS_BINDINGS}
+
+
+def apply_class_bindings(bindings):
+    """
+    Point the classes back at one game's groups, pools, store, and random number source.
+    
+    Args:
+        bindings (dict): Settings recorded by class_bindings
+    """
+
+    for (cls, name), value in bindings.items():
+        setattr(cls, name, value)
+
+
+def handle_events(profiler=None):
     """
     Process all pygame events in the event queue.
     
     This function:
     - Retrieves all pending events from pygame's event queue
     - Handles system events like window close (QUIT)
+    - Toggles the profiler overlay when F3 is pressed (if a profiler is given)
     - Can be expanded to handle additional event types (keyboard, mouse, etc.)
     
+    Args:
+        profiler (FrameProfiler): Frame profiler whose overlay F3 shows and hides (None ignores F3)
+    
     Returns:
-        None: This function doesn't return a value, but may terminate the program
-              if a QUIT event is detected.
+        bool: True if a QUIT event was detected (the user closed the window), otherwise False.
     
     Note: 
-        Calling sys.exit() when a QUIT event is detected ensures the game
-        terminates cleanly when the user closes the window.
+        Quitting is reported to the caller instead of exiting here, so the game loop
+        can stop its background tasks and clean up before the program ends.
     """
 
+    quit_requested = False
+
     # Iterate through all pending pygame events
     for event in pygame.event.get():
         # Check if user has clicked the window close button
         if event.type == pygame.QUIT:
-            # Exit the program cleanly
-            sys.exit()
+            # Let the game loop shut down cleanly
+            quit_requested = True
 
+        # Show or hide the frame profiler overlay
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and profiler is not None:
+            profiler.toggle_overlay()
 
-def update_game_state(updatable_group, asteroids_group, shots_group, player_character, dt):
+    return quit_requested
+
+
+def update_game_state(updatable_group, asteroids_group, shots_group, player_character, dt, despawn_policy=None, stats=None, profiler=None, swept=c.USE_SWEPT_COLLISIONS):
     """
     Update the game state for the current frame.
     
     This function:
     - Updates all game objects with the elapsed time
+    - Removes shots and asteroids that have left the play area (if a despawn policy is given)
     - Handles player shooting input
     - Detects and resolves collisions between:
       - Shots and asteroids
@@ -137,51 +269,204 @@ def update_game_state(updatable_group, asteroids_group, shots_group, player_char
         shots_group (pygame.sprite.Group): Group of all player shot objects
         player_character (Player): The player's ship object
         dt (float): Delta time - seconds elapsed since last frame
+        despawn_policy (DespawnPolicy): Rules for culling off-screen or expired objects (None disables culling)
+        stats (GameStats): Counters to update with this frame's results (None skips counting)
+        profiler (FrameProfiler): Records how long the update, despawn, input, and collision steps take (None skips timing)
+        swept (bool): If True, shots are tested along their whole path during this step, not just where they end up
     
     Returns:
-        None: This function updates the game state in-place.
-              May terminate the program if the player is destroyed.
+        bool: True if the player was hit by an asteroid (game over), otherwise False.
     """
     
     # Update all game objects with the time elapsed since last frame
-    updatable_group.update(dt)
+    with prof.section(profiler, "update"):
+        # Move every store-backed object in one vectorized step
+        # (before the sprite updates, so asteroids spawned during them don't move until next frame)
+        if player_character.store is not None:
+            player_character.store.integrate(dt)
+            # Moving is all an asteroid's update() does, so store-backed asteroids are not updated one by one
+            update_objects(updatable_group, dt, skip_group=asteroids_group)
+        else:
+            updatable_group.update(dt)
+
+    # --- Despawn Logic ---
+    # Remove objects that can no longer interact with the player, so the groups don't grow forever
+    if despawn_policy is not None:
+        with prof.section(profiler, "despawn"):
+            despawn_policy.apply(asteroids_group, shots_group, player_character.store)
 
     # --- Shooting Logic ---
-    # Check is space key is pressed
-    if pygame.key.get_pressed()[pygame.K_SPACE]:
-        # Tell the player object to create a new shot
-        # Append shot to 'shots_group'
-        player_character.shoot(shots_group)
+    with prof.section(profiler, "input"):
+        # Check is space key is pressed (read from the player's input source, so scripted input works too)
+        if player_character.input_source.get_pressed()[pygame.K_SPACE]:
+            # Tell the player object to create a new shot
+            # Append shot to 'shots_group'
+            player_character.shoot(shots_group)
 
     # --- Collision Handling ---
-    for asteroid in asteroids_group:
-        # Check for collisions between each asteroid and all shots
-        for shot in shots_group:
-            if shot.check_collisions(asteroid) == True:
-                # Shot hit an asteroid - remove the shot
-                shot.kill()
-                # Split the asteroid (which may create smaller asteroids)
-                asteroid.split()
+    with prof.section(profiler, "collision"):
+        game_over = handle_collisions(asteroids_group, shots_group, player_character, stats, dt if swept else 0.0)
+
+    if stats is not None:
+        stats.record_frame(updatable_group, asteroids_group, shots_group)
+
+    # --- Object Recycling ---
+    # Objects destroyed this frame become available for reuse only now, once nothing else this frame can touch them
+    for pool in (a.Asteroid.pool, p.Shot.pool):
+        if pool is not None:
+            pool.recycle()
+
+    return game_over
+
+
+def update_objects(updatable_group, dt, skip_group=None):
+    """
+    Call update() on every updatable object, except those in 'skip_group'.
+    
+    Objects are gathered before any is updated, so objects created during the updates wait until
+    the next frame (as with pygame.sprite.Group.update). An entity view leaves out the whole
+    skipped bucket without visiting its objects.
+    
+    Args:
+        updatable_group (pygame.sprite.Group): Group of all objects that need updating each frame
+        dt (float): Delta time - seconds elapsed since last frame
+        skip_group (pygame.sprite.Group): Objects that must not be updated (None updates everything)
+    """
+
+    if skip_group is None:
+        updatable_group.update(dt)
+        return
+
+    buckets = getattr(updatable_group, "buckets", None)
+    if buckets is not None:
+        sprites = [sprite for bucket in buckets if bucket is not skip_group for sprite in bucket.items]
+    else:
+        sprites = [sprite for sprite in updatable_group.sprites() if sprite not in skip_group]
+
+    for sprite in sprites:
+        sprite.update(dt)
+
+
+def handle_collisions(asteroids_group, shots_group, player_character, stats=None, swept_dt=0.0, batched=c.USE_BATCH_COLLISIONS):
+    """
+    Detect and resolve collisions between shots, asteroids, and the player.
+    
+    This function:
+    - Finds the shots that overlap each asteroid, either with batched NumPy tests over every pair
+      (always used when objects live in an entity store) or with a spatial hash broad phase
+      followed by the exact circle test on nearby pairs
+    - With 'swept_dt', tests each shot's whole path during the last step against each
+      moving asteroid, so fast shots cannot skip over small asteroids between frames
+      (shots fired this step are not swept back to where they never were)
+    - Checks every asteroid against the player
+    
+    Asteroids are visited in group order and their candidate shots in shot group order,
+    so a shot overlapping two asteroids still only destroys the first one it is tested against.
+    
+    Args:
+        asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+        shots_group (pygame.sprite.Group): Group of all player shot objects
+        player_character (Player): The player's ship object
+        stats (GameStats): Counters to update when asteroids are destroyed (None skips counting)
+        swept_dt (float): Length of the last step for swept shot tests (0 uses point-in-time tests)
+        batched (bool): If True, use the batched NumPy tests instead of the spatial hash
+    
+    Returns:
+        bool: True if any asteroid hit the player (game over), otherwise False.
+    """
+
+    asteroids = asteroids_group.sprites()
+    shots = shots_group.sprites()
+
+    if batched or player_character.store is not None:
+        # Nothing can collide without asteroids (common early in a game), so skip the array setup
+        if not asteroids:
+            return False
+
+        # Batched path: all asteroid/shot pairs and all asteroid/player pairs in one array operation each
+        asteroid_arrays = col.circle_arrays(asteroids)
+        hit_pairs = []
+        if shots:
+            # Each shot is swept back only over the part of the step it existed for
+            shot_sweeps = col.sweep_times(shots, swept_dt) if swept_dt > 0 else 0.0
+            hit_rows, hit_columns = col.colliding_pairs(asteroid_arrays, shots, shot_sweeps)
+            hit_pairs = zip(hit_rows.tolist(), hit_columns.tolist())
+        player_rows, _ = col.colliding_pairs(asteroid_arrays, [player_character])
+
+        # The game ends at the first asteroid (in group order) touching the player,
+        # after that asteroid's own shots have been dealt with
+        last_row = player_rows[0] if len(player_rows) else len(asteroids)
+
+        for row, column in hit_pairs:
+            if row > last_row:
+                break
+            resolve_shot_hit(asteroids[row], shots[column], stats)
+
+        return len(player_rows) > 0
+
+    # Broad phase: bucket every shot (or, when swept, its whole path) into the grid once for this frame
+    shot_grid = col.build_spatial_hash(shots, swept_dt=swept_dt)
+
+    for asteroid in asteroids:
+        # Collect the shots touching this asteroid
+        nearby_shots = shot_grid.query(*col.swept_bounds(asteroid, swept_dt))
+        if swept_dt > 0:
+            hit_shots = [shot for shot in nearby_shots if shot.check_swept_collisions(asteroid, col.sweep_time(shot, swept_dt)) == True]
+        else:
+            hit_shots = [shot for shot in nearby_shots if shot.check_collisions(asteroid) == True]
+
+        for shot in hit_shots:
+            resolve_shot_hit(asteroid, shot, stats)
 
         # Check for collision between asteroid and player        
         if asteroid.check_collisions(player_character) == True:
             # Player was hit by an asteroid - game over
-            print("Game over!")
-            sys.exit() # Exit the program
+            return True
+
+    return False
 
 
-def render_screen(screen, drawable_group):
+def resolve_shot_hit(asteroid, shot, stats=None):
+    """
+    Destroy a shot and split the asteroid it hit.
+    
+    Args:
+        asteroid (Asteroid): The asteroid that was hit
+        shot (Shot): The shot that hit it
+        stats (GameStats): Counters to update (None skips counting)
+    """
+
+    # Skip shots already used up on an earlier asteroid this frame
+    if not shot.alive():
+        return
+
+    # Shot hit an asteroid - remove the shot
+    shot.kill()
+    # Split the asteroid (which may create smaller asteroids)
+    asteroid.split()
+
+    if stats is not None:
+        stats.asteroids_destroyed += 1
+
+
+def render_screen(screen, drawable_group, sprite_cache=None, camera=None, particles=None):
     """
     Render all game objects to the screen.
     
     This function:
     - Clears the screen with the background color
     - Draws all sprites from the drawable group to the screen
+      (with a sprite cache, pre-rendered images are copied into place in one batched blits call)
+    - With a camera, draws only the sprites that overlap its view, shifted from world to screen coordinates
+    - With a particle system, draws every particle in one bulk pass underneath the sprites
     - Note: Does not call pygame.display.flip() or update() - this should be done elsewhere
     
     Args:
         screen (pygame.Surface): The main display surface to render onto
         drawable_group (pygame.sprite.Group): Group of all sprites that need to be drawn
+        sprite_cache (SpriteCache): Pre-rendered images to blit instead of drawing each shape (None draws every shape)
+        camera (Camera): The view of a scrolling world to draw (None draws the group in screen coordinates)
+        particles (ParticleSystem): Debris and exhaust to draw (None draws no particles)
     
     Returns:
         None: This function updates the screen surface in-place but doesn't return a value.
@@ -190,9 +475,38 @@ def render_screen(screen, drawable_group):
     # Fill the enite screen with the background color (erasing previous frame)
     screen.fill(c.BACKGROUND_COLOR)
 
+    # Particles go underneath, so debris never covers the ship or the asteroids
+    if particles is not None:
+        particles.draw(screen, camera.offset if camera is not None else None)
+
+    if camera is not None:
+        # Skip everything outside the view, then draw the rest relative to the camera
+        visible_sprites = camera.visible(drawable_group)
+        with camera.screen_positions(visible_sprites):
+            rm.draw_sprites(screen, visible_sprites, sprite_cache)
+        return
+
     # Draw each sprite in the drawable group to the screen
-    for sprite in drawable_group:
-        sprite.draw(screen)
+    # (rm.draw_sprites blits cached images in one batch when a sprite cache is given)
+    rm.draw_sprites(screen, drawable_group, sprite_cache)
     
     # Note: This function doesn't update the display - pygame.display.flip() 
-    # or pygame.display.update() should be called after this function
\ No newline at end of file
+    # or pygame.display.update() should be called after this function
+
+
+def group_sizes(updatable_group, drawable_group, asteroids_group, shots_group):
+    """
+    Count the sprites in each of the game's groups.
+    
+    Args:
+        updatable_group (pygame.sprite.Group): Group of all objects that need updating each frame
+        drawable_group (pygame.sprite.Group): Group of all objects that need to be drawn
+        asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+        shots_group (pygame.sprite.Group): Group of all player shot objects
+    
+    Returns:
+        dict: Group names (matching constants.PROFILER_GROUP_NAMES) mapped to their sizes
+    """
+
+    sizes = (len(updatable_group), len(drawable_group), len(asteroids_group), len(shots_group))
+    return dict(zip(c.PROFILER_GROUP_NAMES, sizes))
@@ -0,0 +1,193 @@
+# headless_module.py:
+# This module runs the Asteroids game logic without a window.
+# Every step advances the game by a fixed amount of time as fast as the CPU allows,
+# with key presses supplied by a scripted or null input source instead of the keyboard.
+# Run directly for a quick speed check: python headless_module.py --frames 10000
+
+# Standard Library Imports
+import random # Each seeded game gets its own random.Random
+import time # Used to measure how fast the simulation runs
+
+# Local Module Imports - Game-specific modules
+import startup_module as st # Lazy imports and startup timing (imported first, so its timer covers the rest)
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import asteroid_module as a # Asteroid-related classes and functionality
+import game_systems as gs # Game running functionality
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import lifetime_module as lm # Despawn rules for off-screen and expired objects
+import player_module as p # Player-related classes and functionality
+import stats_module as sm # Per-game counters such as frames survived and asteroids destroyed
+
+# Only needed for snapshots and the command line, so they are loaded on first use
+snap = st.lazy_import("snapshot_module") # Binary capture and restore of the whole game state
+argparse = st.lazy_import("argparse") # Used to read command-line options when run directly
+
+
+class HeadlessSimulation:
+    """
+    A complete game that is stepped by hand with a fixed timestep and no display.
+
+    Attributes:
+        dt (float): Seconds simulated per step
+        input_source: Where the player's key presses come from (NullInput by default)
+        despawn_policy (DespawnPolicy): Rules for removing off-screen objects
+        frame (int): Number of steps simulated so far
+        game_over (bool): True once an asteroid has hit the player
+        stats (GameStats): Frames survived, asteroids destroyed, and peak object counts
+        seed (int or None): Seed of this game's random number source
+        screen (pygame.Surface): Off-screen surface, available for optional rendering
+        updatable_group, drawable_group, asteroids_group, shots_group (pygame.sprite.Group): The game's sprite groups
+        player_character (Player): The player's ship object
+        asteroid_field (AsteroidField): Manager object that handles asteroid spawning
+        world (World): The scrolling world the game is played in (None when it fits on one screen)
+    """
+
+    def __init__(self, input_source=None, dt=c.FIXED_TIMESTEP, despawn_policy=None, entity_store=None, seed=None, world=None):
+        """
+        Initialize pygame without a window and create a fresh game.
+
+        Args:
+            input_source: Object with get_pressed() and advance() methods (None means no input)
+            dt (float): Seconds simulated per step
+            despawn_policy (DespawnPolicy): Rules for removing off-screen objects (None uses the defaults)
+            entity_store (EntityStore): Optional array-backed storage for all objects
+            seed (int): Seed for this game's own random number source (None uses the global random module)
+            world (World): A scrolling world larger than the screen to play in (None plays on one screen)
+        """
+
+        self.dt = dt
+        self.input_source = input_source if input_source is not None else inp.NullInput()
+        self.world = world
+        if despawn_policy is None:
+            despawn_policy = lm.DespawnPolicy() if world is None else lm.DespawnPolicy(width=world.width, height=world.height)
+        self.despawn_policy = despawn_policy
+        self.frame = 0
+        self.game_over = False
+        self.stats = sm.GameStats()
+
+        # Same setup as the windowed game, but without opening a window
+        (self.screen, _, self.updatable_group, self.drawable_group,
+         self.asteroids_group, self.shots_group) = gs.setup(headless=True)
+
+        # A seeded random.Random makes every spawn and split reproducible from the seed alone
+        self.seed = seed
+        rng = random.Random(seed) if seed is not None else None
+
+        self.player_character, self.asteroid_field = gs.setup_game_objects(
+            self.updatable_group, self.drawable_group, self.asteroids_group, self.shots_group, entity_store, rng=rng, world=world
+        )
+
+        # Replace the keyboard with the chosen input source
+        self.player_character.input_source = self.input_source
+
+        # Remember this game's class-level settings, so several simulations can take turns in one process
+        self.bindings = gs.class_bindings()
+
+    def step(self):
+        """
+        Advance the game by one fixed timestep.
+
+        Returns:
+            bool: True if the game is over after this step
+        """
+
+        if self.game_over:
+            return True
+
+        gs.apply_class_bindings(self.bindings)
+        self.game_over = gs.update_game_state(
+            self.updatable_group, self.asteroids_group, self.shots_group,
+            self.player_character, self.dt, self.despawn_policy, self.stats
+        )
+
+        # Move the input script on to the next frame
+        self.input_source.advance()
+        self.frame += 1
+
+        return self.game_over
+
+    def snapshot(self):
+        """
+        Capture the complete state of the game.
+
+        Returns:
+            Snapshot: The player, asteroid field, objects (including a scrolling world's chunks), stats, and random number state
+        """
+
+        gs.apply_class_bindings(self.bindings)
+        return snap.Snapshot.capture(
+            self.player_character, self.asteroid_field, self.asteroids_group, self.shots_group, self.stats, self.world
+        )
+
+    def restore(self, snapshot):
+        """
+        Return the game to a captured state, e.g. to roll back or to branch several games from one checkpoint.
+
+        The input source is left as it is, so a branch can continue with different key presses.
+
+        Args:
+            snapshot (Snapshot): State captured from this or another headless game (with a scrolling world only if this game has one)
+        """
+
+        gs.apply_class_bindings(self.bindings)
+        snapshot.restore(
+            self.player_character, self.asteroid_field, self.asteroids_group, self.shots_group, self.stats, self.world
+        )
+        self.frame = self.stats.frames
+        self.game_over = False
+
+    def run(self, max_frames):
+        """
+        Step the game until it ends or 'max_frames' steps have been simulated.
+
+        Args:
+            max_frames (int): Upper limit on the number of steps
+
+        Returns:
+            int: Number of frames simulated during this call
+        """
+
+        start_frame = self.frame
+
+        while self.frame - start_frame < max_frames:
+            if self.step():
+                break
+
+        return self.frame - start_frame
+
+
+def main():
+    """
+    Run a headless game from the command line and report simulation speed.
+    """
+
+    st.timer.mark("imports")
+
+    parser = argparse.ArgumentParser(description="Run the Asteroids game logic without a window.")
+    parser.add_argument("--frames", type=int, default=10000, help="maximum number of frames to simulate")
+    parser.add_argument("--dt", type=float, default=c.FIXED_TIMESTEP, help="seconds simulated per frame")
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible game")
+    parser.add_argument("--startup-report", action="store_true", help="print how long each startup phase took")
+    args = parser.parse_args()
+
+    simulation = HeadlessSimulation(dt=args.dt, seed=args.seed)
+    st.timer.mark("game setup")
+    if args.startup_report or c.STARTUP_REPORT:
+        print(st.timer.report())
+
+    start = time.perf_counter()
+    frames = simulation.run(args.frames)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {frames} frames in {elapsed:.3f}s ({frames / max(elapsed, 1e-9):.0f} frames/s)")
+    # Report how many shots and asteroids were recycled instead of constructed
+    for name, cls in (("Asteroid", a.Asteroid), ("Shot", p.Shot)):
+        if cls.pool is not None:
+            print(f"{name} pool: {cls.pool.stats()}")
+
+    if simulation.game_over:
+        print("Game over!")
+
+
+if __name__ == "__main__":
+    main()
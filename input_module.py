@@ -0,0 +1,196 @@
+# input_module.py:
+# This module handles where the player's key presses come from.
+# The live game reads the real keyboard, while headless runs can feed in no input at all
+# or a scripted sequence of key presses, one entry per simulated frame.
+
+# Third-Party Imports - External game libraries
+import pygame
+
+
+class KeyState:
+    """
+    A read-only set of pressed keys that can be indexed like pygame.key.get_pressed().
+
+    Example:
+        keys = KeyState({pygame.K_w, pygame.K_SPACE})
+        keys[pygame.K_w]  # True
+        keys[pygame.K_a]  # False
+    """
+
+    def __init__(self, pressed=()):
+        """
+        Initialize the key state.
+
+        Args:
+            pressed (iterable): pygame key constants that are held down
+        """
+
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# Shared empty key state used whenever nothing is pressed
+NO_KEYS = KeyState()
+
+# Every key the game reacts to, in bit order for compact input masks (bit 0 is W, bit 4 is Space)
+ACTION_KEYS = (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, pygame.K_SPACE)
+
+
+def to_bitmask(keys):
+    """
+    Pack the game's action keys into a single integer, one bit per key.
+
+    Args:
+        keys: Any key state indexable by pygame key constants (e.g. pygame.key.get_pressed() or KeyState)
+
+    Returns:
+        int: Bitmask with bit i set when ACTION_KEYS[i] is held
+    """
+
+    mask = 0
+    for bit, key in enumerate(ACTION_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def from_bitmask(mask):
+    """
+    Unpack a bitmask made by to_bitmask back into a key state.
+
+    Args:
+        mask (int): Bitmask with bit i set when ACTION_KEYS[i] is held
+
+    Returns:
+        KeyState: The held keys
+    """
+
+    return KeyState(key for bit, key in enumerate(ACTION_KEYS) if mask & (1 << bit))
+
+
+class KeyboardInput:
+    """
+    Reads the real keyboard through pygame. Used by the windowed game.
+    """
+
+    def get_pressed(self):
+        """Return the current state of every key on the keyboard."""
+
+        return pygame.key.get_pressed()
+
+    def advance(self):
+        """Move to the next frame (the keyboard is always live, so there is nothing to do)."""
+
+        pass
+
+
+class NullInput:
+    """
+    An input source where no key is ever pressed. Useful for pure simulation runs.
+    """
+
+    def get_pressed(self):
+        """Return a key state with nothing pressed."""
+
+        return NO_KEYS
+
+    def advance(self):
+        """Move to the next frame (nothing changes)."""
+
+        pass
+
+
+class ActionInput:
+    """
+    Holds whatever keys an outside controller (such as a training agent) chose for the current step.
+
+    Attributes:
+        keys (KeyState): The keys held this step
+    """
+
+    # Every possible combination of ACTION_KEYS, indexed by bitmask, built once and shared
+    KEY_STATES = [from_bitmask(mask) for mask in range(1 << len(ACTION_KEYS))]
+
+    def __init__(self):
+        """
+        Initialize with no keys held.
+        """
+
+        self.keys = NO_KEYS
+
+    def set_action(self, mask):
+        """
+        Choose the keys for the next step.
+
+        Args:
+            mask (int): Bitmask of held keys, as made by to_bitmask
+        """
+
+        self.keys = self.KEY_STATES[mask]
+
+    def get_pressed(self):
+        """Return the keys chosen for this step."""
+
+        return self.keys
+
+    def advance(self):
+        """Keys stay held until the controller chooses new ones."""
+
+
+class ScriptedInput:
+    """
+    Plays back a fixed sequence of key presses, one entry per frame.
+
+    Once the script runs out, no keys are reported as pressed, unless the script loops.
+
+    Attributes:
+        frames (list): A KeyState for each scripted frame
+        frame (int): Index of the current frame in the script
+        loop (bool): If True, the script starts over after its last frame
+    """
+
+    def __init__(self, frames, loop=False):
+        """
+        Initialize a scripted input source.
+
+        Args:
+            frames (iterable): For each frame, an iterable of pygame key constants held down that frame
+            loop (bool): If True, the script starts over after its last frame
+        """
+
+        self.frames = [KeyState(pressed) for pressed in frames]
+        self.frame = 0
+        self.loop = loop
+
+    def get_pressed(self):
+        """Return the key state for the current frame."""
+
+        if self.loop and self.frames:
+            return self.frames[self.frame % len(self.frames)]
+        if self.frame < len(self.frames):
+            return self.frames[self.frame]
+        return NO_KEYS
+
+    def advance(self):
+        """Move to the next frame of the script."""
+
+        self.frame += 1
+
+    @classmethod
+    def from_bitmasks(cls, masks, loop=False):
+        """
+        Build a script from per-frame bitmasks (as stored in replays).
+
+        Args:
+            masks (iterable): One to_bitmask value per frame
+            loop (bool): If True, the script starts over after its last frame
+
+        Returns:
+            ScriptedInput: The script
+        """
+
+        script = cls([], loop)
+        script.frames = [from_bitmask(mask) for mask in masks]
+        return script
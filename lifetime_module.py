@@ -0,0 +1,135 @@
+# lifetime_module.py:
+# This module handles removing game objects that are no longer useful.
+# Shots and asteroids that drift far outside the play area (or shots that outlive their
+# time-to-live) are killed, which releases them from every sprite group they belong to.
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class DespawnPolicy:
+    """
+    Decides when shots and asteroids should be removed from the game and keeps count of removals.
+
+    An object is culled once its whole circle is further than 'margin' pixels outside the play area
+    (the screen, or the whole world in a scrolling-world game).
+    Shots can also be given a maximum lifetime, after which they are removed even if on screen.
+
+    Attributes:
+        margin (float): Distance beyond the play area's edges, in pixels, before objects are culled
+        shot_lifetime (float or None): Maximum age of a shot, in seconds (None disables the limit)
+        width (float): Width of the play area, in pixels
+        height (float): Height of the play area, in pixels
+        culled_asteroids (int): Number of asteroids removed for leaving the play area
+        culled_shots (int): Number of shots removed for leaving the play area
+        expired_shots (int): Number of shots removed for exceeding their lifetime
+    """
+
+    def __init__(self, margin=c.DESPAWN_MARGIN, shot_lifetime=c.SHOT_LIFETIME, width=c.SCREEN_WIDTH, height=c.SCREEN_HEIGHT):
+        """
+        Initialize a despawn policy.
+
+        Args:
+            margin (float): Distance beyond the play area's edges, in pixels, before objects are culled
+            shot_lifetime (float or None): Maximum age of a shot, in seconds (None disables the limit)
+            width (float): Width of the play area, in pixels
+            height (float): Height of the play area, in pixels
+        """
+
+        self.margin = margin
+        self.shot_lifetime = shot_lifetime
+        self.width = width
+        self.height = height
+
+        # Counters for how many objects this policy has removed
+        self.culled_asteroids = 0
+        self.culled_shots = 0
+        self.expired_shots = 0
+
+    @property
+    def total_culled(self):
+        """Total number of objects removed by this policy."""
+
+        return self.culled_asteroids + self.culled_shots + self.expired_shots
+
+    def is_outside(self, sprite):
+        """
+        Check whether a sprite has left the play area plus the margin.
+
+        Args:
+            sprite (CircleShape): The object to check
+
+        Returns:
+            bool: True if the whole circle is beyond the margin on any side
+        """
+
+        # Growing the margin by the radius means the entire circle must be past the edge
+        limit = self.margin + sprite.radius
+        x, y = sprite.position
+
+        return (x < -limit or x > self.width + limit
+                or y < -limit or y > self.height + limit)
+
+    def outside_slots(self, store):
+        """
+        Check every object in an entity store against the play area at once.
+
+        Args:
+            store (EntityStore): Array-backed storage of the objects to check
+
+        Returns:
+            numpy.ndarray: One flag per slot, True for objects whose whole circle is beyond the margin (False for free slots)
+        """
+
+        limit = self.margin + store.radii
+        x = store.positions[:, 0]
+        y = store.positions[:, 1]
+
+        return store.alive & ((x < -limit) | (x > self.width + limit) | (y < -limit) | (y > self.height + limit))
+
+    def apply(self, asteroids_group, shots_group, store=None):
+        """
+        Kill every asteroid and shot that should no longer be in the game.
+
+        Calling kill() removes a sprite from all of its groups at once,
+        so updatable, drawable, and collision groups are all released together.
+        Objects are killed in group order either way, so the result does not depend on the store.
+
+        Args:
+            asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+            shots_group (pygame.sprite.Group): Group of all player shot objects
+            store (EntityStore): Storage the objects live in, tested in one vectorized pass (None reads each sprite)
+
+        Returns:
+            int: Number of objects removed during this call
+        """
+
+        removed = 0
+
+        # With a store, every object is tested at once and each object's flag is looked up by its slot
+        # (and the asteroids aren't visited at all when nothing has left the play area)
+        outside = self.outside_slots(store) if store is not None else None
+
+        if outside is None:
+            culled = [asteroid for asteroid in asteroids_group if self.is_outside(asteroid)]
+        elif outside.any():
+            culled = [asteroid for asteroid in asteroids_group if outside[asteroid.slot]]
+        else:
+            culled = []
+
+        for asteroid in culled:
+            asteroid.kill()
+            self.culled_asteroids += 1
+            removed += 1
+
+        for shot in shots_group:
+            if self.shot_lifetime is not None and shot.age >= self.shot_lifetime:
+                shot.kill()
+                self.expired_shots += 1
+                removed += 1
+            elif self.is_outside(shot) if outside is None else outside[shot.slot]:
+                shot.kill()
+                self.culled_shots += 1
+                removed += 1
+
+        return removed
@@ -0,0 +1,116 @@
+# loop_module.py:
+# This module handles separating the game's simulation rate from its rendering rate.
+# Real time is collected in an accumulator and spent in fixed-size simulation steps, so every
+# physics step is the same length no matter how long a frame took to draw. Rendering then blends
+# each object's last two simulated positions, so motion stays smooth between steps.
+
+# Standard Library Imports
+import contextlib # Used to build the temporary interpolation context manager
+
+# Third-Party Imports - External game libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class FixedStepClock:
+    """
+    Turns variable real frame times into a whole number of fixed simulation steps.
+
+    Attributes:
+        step (float): Seconds simulated per step
+        max_steps (int): Most steps run for one frame; time beyond this is dropped so a slow
+                         frame cannot snowball into ever more catch-up work
+        accumulator (float): Real time not yet simulated, in seconds
+        dropped_time (float): Total real time discarded because of the catch-up cap, in seconds
+    """
+
+    def __init__(self, step=c.FIXED_TIMESTEP, max_steps=c.MAX_CATCHUP_STEPS):
+        """
+        Initialize the clock with nothing accumulated.
+
+        Args:
+            step (float): Seconds simulated per step
+            max_steps (int): Most steps run for one frame
+        """
+
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def advance(self, frame_time):
+        """
+        Add a frame's real time and work out how many simulation steps to run.
+
+        Args:
+            frame_time (float): Real seconds elapsed since the last frame
+
+        Returns:
+            int: Number of fixed steps to simulate this frame
+        """
+
+        self.accumulator += frame_time
+
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            # Too far behind: run the maximum and forget the rest
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = self.step * steps + self.accumulator % self.step
+
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """How far (from 0 to 1) real time has moved past the last simulated state toward the next one."""
+
+        return self.accumulator / self.step
+
+
+def snapshot_positions(sprites):
+    """
+    Record where each sprite is right now.
+
+    Args:
+        sprites (iterable): Sprites to record, e.g. the drawable group
+
+    Returns:
+        dict: Maps each sprite to its (x, y) position
+    """
+
+    return {sprite: tuple(sprite.position) for sprite in sprites}
+
+
+@contextlib.contextmanager
+def interpolated_positions(sprites, previous_positions, alpha):
+    """
+    Temporarily move sprites part of the way back toward their previous positions for drawing.
+
+    Inside the 'with' block, each sprite sits at previous + (current - previous) * alpha.
+    Sprites with no previous position (created during the last step) stay where they are.
+    Every sprite is put back at its real simulated position when the block ends.
+
+    Args:
+        sprites (iterable): Sprites about to be drawn
+        previous_positions (dict): Positions from snapshot_positions, taken before the last step
+        alpha (float): Blend factor from FixedStepClock.alpha
+    """
+
+    moved = []
+    for sprite in sprites:
+        previous = previous_positions.get(sprite)
+        if previous is None:
+            continue
+
+        current = sprite.position
+        moved.append((sprite, current))
+        sprite.position = pygame.Vector2(previous).lerp(current, alpha)
+
+    try:
+        yield
+    finally:
+        for sprite, current in moved:
+            sprite.position = current
@@ -2,14 +2,21 @@
 # This file initalizes the game, handles the game loop, and ensures proper resource cleanup
 
 # Standard Library Imports 
+import asyncio # Runs the game loop and its background tasks
 import sys # Used for systen-level operations like exiting the game
+import traceback # Used to print where an unexpected error happened
+
+# Startup timing begins here, before the heavy imports below, so the report can include them
+import startup_module as st # Lazy imports and startup timing
 
 # Third-Party Imports - External game libraries
 import pygame
 
 # Local Module Imports - Game-specific modules
 import constants as c # Game constants and configurations, like colors, sizes, and player settings
-import game_systems as gs # Game running functionality
+import session_module as sess # The asyncio-driven game loop and its background tasks
+
+st.timer.mark("imports")
 
 
 def main():
@@ -18,64 +25,41 @@ def main():
     """
 
     print("Starting Asteroids!")
-
-    # --- GAME SETUP ---
-    # Initialize the game screen, clock, and sprite groups for game objects
-    # 'gs.setup()' is responsible for setting up everything Pygame needs
-    screen, clock, updatable_group, drawable_group, asteroids_group, shots_group = gs.setup()
-
-    # Create the player character and initial asteroid field
-    # All objects are added to the necessary groups for updates and rendering
-    player_character, asteroid_field = gs.setup_game_objects(updatable_group, drawable_group, asteroids_group, shots_group)
-    
-    # 'dt' (delta time): Measures the time between frames to allow for frame-independent motion
-    dt = 0
+    exit_code = 0 # Becomes 1 if the game stops because of an error, so scripts running it can tell
 
     try:
-        # --- GAME LOOP ---
-        # The core loop that runs the game, processing events, rendering, and updating game logic
-        # This will run continuously
-        while True:
-            # 1. Handles events, specifically the player quitting the game
-            #    This ensures the player can interact with the game properly
-            gs.handle_events()
-
-            # 2. Render all game objects on the screen
-            #    Drawable objects from the 'drawable_group' are drawn to the 'screen' surface
-            gs.render_screen(screen, drawable_group)
-
-            # 3. Update the game's logic and state
-            #    Handles object movement, collisions, and interactions between:
-            #    - 'updatable_group' (all objects needing logic updates),
-            #    - 'asteroids_group' (asteroids moving and splitting),
-            #    - 'shots_group' (player bullets),
-            #    - 'player_character'.
-            #    The game's delta time ('dt') ensures movements and updates are frame-independent
-            gs.update_game_state(updatable_group, asteroids_group, shots_group, player_character, dt)
+        # --- GAME SETUP ---
+        # Initialize the game screen, sprite groups, and every game object
+        # 'sess.GameSession()' is responsible for setting up the whole game
+        session = sess.GameSession()
 
-            # 4. Update the game's display with the most recent rendered frame
-            #    Flips the off-screen buffer to the screen, making the most recent rendering visible
-            pygame.display.flip()
-
-            # 5. Control the game's frame rate and calculate delta time ('dt')
-            #    - 'clock.time(c.FRAME_RATE)': Ensures the game runs at a consistent FPS
-            #    - Divide by 100 to convert milliseconds into seconds for use in delta-time calculations
-            dt = clock.tick(c.FRAME_RATE) / 1000  # Frame time in seconds
+        # --- GAME LOOP ---
+        # Runs frames on an asyncio event loop until the game ends
+        # Each frame handles events, updates the game logic in fixed steps, and renders
+        # Between frames, background tasks (exports, snapshots, the control socket) get their turn
+        # Closing the window, a game over, or a 'quit' command all end the loop cleanly
+        reason = asyncio.run(session.run())
+        print(reason)
+        if session.replay is not None:
+            print(f"Replay saved to {c.REPLAY_RECORD_PATH} (seed {session.seed}, {len(session.replay.masks)} steps)")
 
     except Exception as e:
         # Catch and handle unecpected errors that may occur during the game loop
         # Print an error message to indicate what went wrong,
-        # along with the exception fetails for debugging
+        # along with the exception fetails and the full traceback for debugging
         print("An error occurred during the game loop!")
         print(f"Error details: {e}")
+        traceback.print_exc()
+        exit_code = 1
 
     finally:
         # Ensure proper cleanup of game resources, even if an error occurs
         # - `pygame.quit()` ensures Pygame shuts down cleanly
-        # - `sys.exit()` terminates the program safely
+        # - `sys.exit()` terminates the program safely, reporting whether an error stopped it
+        # (the session has already cancelled its background tasks and written its final exports)
         print("Exiting game. Cleaning up resources.")
         pygame.quit()
-        sys.exit()
+        sys.exit(exit_code)
     
 
 if __name__ == "__main__":
@@ -0,0 +1,753 @@
+# multiplayer_module.py:
+# This module runs a shared, server-authoritative game for several players over UDP.
+# The server simulates one world headless, with one ship per connected client, and after every tick
+# sends each client a snapshot of the world, delta-compressed against the newest snapshot that client
+# has acknowledged (see netcode_module.py). Clients send their key presses, move their own ship right
+# away (prediction), and when a snapshot arrives, snap their ship to the server's version and re-apply
+# the key presses the server has not seen yet (reconciliation).
+# Run directly for a loopback demo with simulated clients: python multiplayer_module.py --clients 4
+# Or run just the server: python multiplayer_module.py --serve
+
+# Standard Library Imports
+import argparse # Used to read command-line options when run directly
+import asyncio # Drives the server's tick loop, the clients, and the UDP sockets
+import collections # deque holds pending inputs; OrderedDict holds snapshot history
+import random # Seeds the world and the simulated clients' key presses
+import time # Used to measure tick processing time and bandwidth
+
+# Third-Party Imports - External game libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import asteroid_module as a # Asteroid-related classes and functionality
+import collision_module as col # Batched circle overlap tests
+import game_systems as gs # Game running functionality
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import lifetime_module as lm # Despawn rules for off-screen and expired objects
+import netcode_module as nc # Quantized, delta-compressed snapshots and packet formats
+import player_module as p # Player-related classes and functionality
+import stats_module as sm # Per-game counters such as frames survived and asteroids destroyed
+
+
+# Maps each networked class to its snapshot kind
+KINDS = {p.Player: nc.KIND_PLAYER, a.Asteroid: nc.KIND_ASTEROID, p.Shot: nc.KIND_SHOT}
+
+
+def resolve_collisions(asteroids_group, shots_group, players, stats=None):
+    """
+    Resolve shot hits, then find every player touching an asteroid.
+
+    The single-player game ends at the first hit (see game_systems.handle_collisions);
+    here the other players keep playing, so every hit player is reported.
+
+    Args:
+        asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+        shots_group (pygame.sprite.Group): Group of all player shot objects
+        players (list): Every player's ship
+        stats (GameStats): Counters to update when asteroids are destroyed (None skips counting)
+
+    Returns:
+        list: Indexes (into 'players') of the players hit by an asteroid
+    """
+
+    asteroids = asteroids_group.sprites()
+    if not asteroids:
+        return []
+
+    asteroid_arrays = col.circle_arrays(asteroids)
+
+    shots = shots_group.sprites()
+    if shots:
+        hit_rows, hit_columns = col.colliding_pairs(asteroid_arrays, shots)
+        for row, column in zip(hit_rows.tolist(), hit_columns.tolist()):
+            gs.resolve_shot_hit(asteroids[row], shots[column], stats)
+
+    if not players:
+        return []
+
+    _, player_columns = col.colliding_pairs(asteroid_arrays, players)
+    return sorted(set(player_columns.tolist()))
+
+
+class ServerWorld:
+    """
+    The one authoritative game the server runs, with a ship for every connected client.
+
+    Attributes:
+        dt (float): Seconds simulated per tick
+        tick (int): Number of ticks simulated
+        players (dict): Maps each player's network id to its ship
+        net_ids (dict): Maps every object in the last snapshot to its network id
+        deaths (int): Number of times any player was hit (hit players respawn at the center)
+        stats (GameStats): Counters for the whole world
+    """
+
+    def __init__(self, seed=None, dt=1 / c.SERVER_TICK_RATE):
+        """
+        Create the world: groups, asteroid field, and no players yet.
+
+        Args:
+            seed (int): Seed for the world's random number source (None gives an unreproducible world)
+            dt (float): Seconds simulated per tick
+        """
+
+        self.dt = dt
+        self.tick = 0
+
+        (_, _, self.updatable_group, self.drawable_group,
+         self.asteroids_group, self.shots_group) = gs.setup(headless=True)
+
+        starting_player, self.asteroid_field = gs.setup_game_objects(
+            self.updatable_group, self.drawable_group, self.asteroids_group, self.shots_group, rng=random.Random(seed)
+        )
+        # Players join with their clients, so the single-player ship is not needed
+        starting_player.kill()
+
+        # Remember this world's class-level settings, in case other games share the process
+        self.bindings = gs.class_bindings()
+
+        self.players = {}
+        self.net_ids = {}
+        self.next_id = 1
+        self.deaths = 0
+        self.despawn_policy = lm.DespawnPolicy()
+        self.stats = sm.GameStats()
+
+    def new_id(self):
+        """Return a network id that has never been used in this world."""
+
+        net_id = self.next_id
+        self.next_id += 1
+        return net_id
+
+    def add_player(self):
+        """
+        Add a ship for a new client at the center of the screen.
+
+        Returns:
+            int: The new player's network id
+        """
+
+        gs.apply_class_bindings(self.bindings)
+        player = p.Player(c.SCREEN_WIDTH / 2, c.SCREEN_HEIGHT / 2)
+        player.input_source = inp.ActionInput()
+
+        net_id = self.new_id()
+        self.players[net_id] = player
+        self.net_ids[player] = net_id
+        return net_id
+
+    def remove_player(self, net_id):
+        """
+        Remove a departed client's ship.
+
+        Args:
+            net_id (int): The player's network id
+        """
+
+        player = self.players.pop(net_id, None)
+        if player is not None:
+            player.kill()
+
+    def step(self):
+        """
+        Advance the world by one tick, using the keys each player's input source currently holds.
+        """
+
+        gs.apply_class_bindings(self.bindings)
+        players = list(self.players.values())
+
+        self.updatable_group.update(self.dt)
+        self.despawn_policy.apply(self.asteroids_group, self.shots_group)
+
+        for player in players:
+            if player.input_source.get_pressed()[pygame.K_SPACE]:
+                player.shoot(self.shots_group)
+
+        # A hit player starts over at the center instead of ending the game for everyone
+        for index in resolve_collisions(self.asteroids_group, self.shots_group, players, self.stats):
+            player = players[index]
+            player.position = pygame.Vector2(c.SCREEN_WIDTH / 2, c.SCREEN_HEIGHT / 2)
+            player.velocity = pygame.Vector2(0, 0)
+            player.rotation = 0
+            self.deaths += 1
+
+        self.stats.record_frame(self.updatable_group, self.asteroids_group, self.shots_group)
+        for pool in (a.Asteroid.pool, p.Shot.pool):
+            if pool is not None:
+                pool.recycle()
+
+        self.tick += 1
+
+    def capture(self):
+        """
+        Take a quantized snapshot of every player, asteroid, and shot.
+
+        Objects keep their network id for as long as they stay alive. A pooled object that is
+        killed and later reused shows up as a new object with a new id.
+
+        Returns:
+            numpy.ndarray: netcode_module.ENTITY_DTYPE records, sorted by id
+        """
+
+        sprites = self.drawable_group.sprites()
+        if not sprites:
+            self.net_ids = {}
+            return nc.empty_snapshot()
+
+        # Objects missing from this snapshot have died, so their ids are forgotten
+        live_ids = {}
+        for sprite in sprites:
+            net_id = self.net_ids.get(sprite)
+            live_ids[sprite] = net_id if net_id is not None else self.new_id()
+        self.net_ids = live_ids
+
+        positions, velocities, radii = col.circle_arrays(sprites)
+        return nc.quantize(
+            np.fromiter(live_ids.values(), dtype=np.uint32, count=len(sprites)),
+            np.array([KINDS[type(sprite)] for sprite in sprites]),
+            positions, velocities, radii,
+            np.array([getattr(sprite, "rotation", 0.0) for sprite in sprites], dtype=float),
+        )
+
+
+class ClientConnection:
+    """
+    What the server knows about one client.
+
+    Attributes:
+        address (tuple): The client's (host, port)
+        player_id (int): Network id of the client's ship
+        inputs (collections.deque): (sequence, key bitmask) pairs received but not yet applied, oldest first
+        next_sequence (int): Sequence number of the next new input expected
+        last_applied (int): Sequence number of the last input applied to the ship
+        ack_tick (int): Newest snapshot tick the client has confirmed (NO_BASE if none)
+        history (collections.OrderedDict): Snapshots sent to this client by tick, oldest first
+        bytes_sent (int): Total snapshot bytes sent
+        full_snapshots (int): Snapshots sent whole
+        delta_snapshots (int): Snapshots sent as differences
+        last_heard (float): Event loop time of the last packet from the client
+    """
+
+    def __init__(self, address, player_id, now):
+        """
+        Initialize a connection for a newly joined client.
+
+        Args:
+            address (tuple): The client's (host, port)
+            player_id (int): Network id of the client's ship
+            now (float): Current event loop time
+        """
+
+        self.address = address
+        self.player_id = player_id
+        self.inputs = collections.deque()
+        self.next_sequence = 1
+        self.last_applied = 0
+        self.ack_tick = nc.NO_BASE
+        self.history = collections.OrderedDict()
+        self.bytes_sent = 0
+        self.full_snapshots = 0
+        self.delta_snapshots = 0
+        self.last_heard = now
+
+    def receive_inputs(self, ack_tick, sequence, masks, now):
+        """
+        Queue the new inputs from an input packet and note the client's newest snapshot.
+
+        Args:
+            ack_tick (int): Newest snapshot tick the client has (NO_BASE if none)
+            sequence (int): Sequence number of the newest input in the packet
+            masks (list): Key bitmasks, oldest first
+            now (float): Current event loop time
+        """
+
+        self.last_heard = now
+        if ack_tick != nc.NO_BASE and (self.ack_tick == nc.NO_BASE or ack_tick > self.ack_tick):
+            self.ack_tick = ack_tick
+
+        # Inputs are repeated across packets, so only the ones not seen before are queued
+        first = sequence - len(masks) + 1
+        for offset, mask in enumerate(masks):
+            if first + offset >= self.next_sequence:
+                self.inputs.append((first + offset, mask))
+                self.next_sequence = first + offset + 1
+
+        # A client sending faster than the tick rate would fall further and further behind
+        while len(self.inputs) > c.SERVER_INPUT_BACKLOG:
+            self.inputs.popleft()
+
+    def base_snapshot(self):
+        """
+        Find the snapshot to encode the next one against, forgetting ones the client no longer needs.
+
+        Returns:
+            tuple: (base tick, base snapshot), or (NO_BASE, None) to send the next snapshot whole
+        """
+
+        # Everything older than the acknowledged snapshot is no longer needed as a base
+        while self.history and self.ack_tick != nc.NO_BASE and next(iter(self.history)) < self.ack_tick:
+            self.history.popitem(last=False)
+
+        base = self.history.get(self.ack_tick)
+        if base is None:
+            return nc.NO_BASE, None
+        return self.ack_tick, base
+
+    def remember(self, tick, snapshot):
+        """
+        Keep a sent snapshot as a possible base for later ones.
+
+        Args:
+            tick (int): Tick the snapshot was taken on
+            snapshot (numpy.ndarray): The snapshot
+        """
+
+        self.history[tick] = snapshot
+        while len(self.history) > c.SERVER_SNAPSHOT_HISTORY:
+            self.history.popitem(last=False)
+
+
+class GameServer(asyncio.DatagramProtocol):
+    """
+    Runs the world at a fixed tick rate and streams snapshots to every connected client.
+
+    Attributes:
+        world (ServerWorld): The authoritative game
+        connections (dict): Maps each client address to its ClientConnection
+        busy_time (float): Seconds spent simulating and encoding, summed over every tick
+        encode_time (float): Seconds of 'busy_time' spent capturing and encoding snapshots
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialize a server with a fresh world and no clients.
+
+        Args:
+            seed (int): Seed for the world's random number source
+        """
+
+        self.world = ServerWorld(seed)
+        self.connections = {}
+        self.transport = None
+        self.started = None
+        self.busy_time = 0.0
+        self.encode_time = 0.0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, address):
+        """
+        Handle a packet from a client: inputs (joining on the first one) or a goodbye.
+
+        Args:
+            data (bytes): The packet
+            address (tuple): The sender's (host, port)
+        """
+
+        if data[:4] == nc.BYE_MAGIC:
+            connection = self.connections.pop(address, None)
+            if connection is not None:
+                self.world.remove_player(connection.player_id)
+            return
+
+        try:
+            ack_tick, sequence, masks = nc.unpack_input(data)
+        except ValueError:
+            return # Not one of ours; ignore it
+
+        now = asyncio.get_running_loop().time()
+        connection = self.connections.get(address)
+        if connection is None:
+            connection = ClientConnection(address, self.world.add_player(), now)
+            self.connections[address] = connection
+
+        connection.receive_inputs(ack_tick, sequence, masks, now)
+
+    def tick(self):
+        """
+        Apply one input per client, simulate one tick, and send every client its snapshot.
+        """
+
+        # Each ship uses its client's next input; without one, it keeps the keys it last had
+        for connection in self.connections.values():
+            if connection.inputs:
+                connection.last_applied, mask = connection.inputs.popleft()
+                self.world.players[connection.player_id].input_source.set_action(mask)
+
+        self.world.step()
+
+        encode_start = time.perf_counter()
+        tick = self.world.tick
+        snapshot = self.world.capture()
+
+        # Clients usually share a base tick, so each distinct base is encoded only once
+        encoded_by_base = {}
+        for connection in self.connections.values():
+            base_tick, base = connection.base_snapshot()
+            encoded = encoded_by_base.get(base_tick)
+            if encoded is None:
+                encoded = encoded_by_base[base_tick] = nc.encode_snapshot(snapshot, base)
+
+            packet = nc.pack_snapshot(tick, base_tick, connection.player_id, connection.last_applied, encoded)
+            self.transport.sendto(packet, connection.address)
+
+            connection.remember(tick, snapshot)
+            connection.bytes_sent += len(packet)
+            if base is None:
+                connection.full_snapshots += 1
+            else:
+                connection.delta_snapshots += 1
+
+        self.encode_time += time.perf_counter() - encode_start
+
+    def drop_silent_clients(self, now):
+        """
+        Remove clients that have not sent anything for 'c.SERVER_CLIENT_TIMEOUT' seconds.
+
+        Args:
+            now (float): Current event loop time
+        """
+
+        for address, connection in list(self.connections.items()):
+            if now - connection.last_heard > c.SERVER_CLIENT_TIMEOUT:
+                del self.connections[address]
+                self.world.remove_player(connection.player_id)
+
+    async def run(self, duration=None):
+        """
+        Tick at 'c.SERVER_TICK_RATE' until cancelled or until 'duration' seconds have passed.
+
+        Args:
+            duration (float): Seconds to run (None runs until cancelled)
+        """
+
+        loop = asyncio.get_running_loop()
+        period = 1 / c.SERVER_TICK_RATE
+        self.started = loop.time()
+        next_tick = self.started
+
+        while duration is None or loop.time() - self.started < duration:
+            tick_start = time.perf_counter()
+            self.tick()
+            self.drop_silent_clients(loop.time())
+            self.busy_time += time.perf_counter() - tick_start
+
+            # Sleep until the next tick is due (or not at all, if this one ran long)
+            next_tick += period
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    def report(self):
+        """
+        Describe the server's tick rate and the bandwidth sent to each client.
+
+        Returns:
+            str: The report, one line per item
+        """
+
+        elapsed = max(asyncio.get_running_loop().time() - self.started, 1e-9)
+        ticks = self.world.tick
+        lines = [
+            f"Server: {ticks} ticks in {elapsed:.1f}s ({ticks / elapsed:.1f} ticks/s, target {c.SERVER_TICK_RATE})",
+            f"  {1000 * self.busy_time / max(ticks, 1):.2f} ms per tick ({ticks / max(self.busy_time, 1e-9):.0f} ticks/s possible), "
+            f"{1000 * self.encode_time / max(ticks, 1):.2f} ms of it capturing and encoding",
+            f"  {len(self.world.drawable_group)} objects, {len(self.world.players)} players, {self.world.deaths} player hits, "
+            f"{self.world.stats.asteroids_destroyed} asteroids hit",
+        ]
+        for connection in self.connections.values():
+            lines.append(
+                f"  client {connection.address[1]} (player {connection.player_id}): {connection.bytes_sent / elapsed / 1024:.1f} KiB/s, "
+                f"{connection.full_snapshots} full and {connection.delta_snapshots} delta snapshots"
+            )
+        return "\n".join(lines)
+
+
+class PredictedPlayer(p.Player):
+    """
+    A client's own copy of its ship, moved by local key presses before the server confirms them.
+
+    It is never part of a game's sprite groups, entity store, or pools, so it can live in the same
+    process as the server (as it does in the loopback demo) without joining the server's world.
+    """
+
+    containers = () # Joins no sprite groups
+    store = None # Keeps its own position and velocity
+    pool = None # Never recycled
+    particles = None # Emits no exhaust
+
+
+class GameClient(asyncio.DatagramProtocol):
+    """
+    Sends key presses to the server, predicts its own ship, and rebuilds the world from snapshots.
+
+    Attributes:
+        dt (float): Seconds the server simulates per tick (and the client predicts per input)
+        player_id (int): Network id of this client's ship (None until the first snapshot)
+        world (numpy.ndarray): The newest snapshot of the world
+        latest_tick (int): Tick of the newest snapshot (NO_BASE if none)
+        history (collections.OrderedDict): Recent snapshots by tick, usable as delta bases
+        predicted (PredictedPlayer): This client's ship, including inputs the server has not applied yet
+        pending (collections.deque): (sequence, key bitmask) pairs sent but not yet applied by the server
+        bytes_received (int): Total snapshot bytes received
+        snapshots (int): Snapshots decoded
+        full_snapshots (int): Snapshots of 'snapshots' that were sent whole rather than as differences
+        corrections (list): Distance, in pixels, the predicted ship moved on each reconciliation
+        dropped (int): Snapshots that could not be decoded because their base was missing
+    """
+
+    def __init__(self, dt=1 / c.SERVER_TICK_RATE):
+        """
+        Initialize a client that has not heard from the server yet.
+
+        Args:
+            dt (float): Seconds the server simulates per tick
+        """
+
+        self.dt = dt
+        self.transport = None
+        self.player_id = None
+        self.world = nc.empty_snapshot()
+        self.latest_tick = nc.NO_BASE
+        self.history = collections.OrderedDict()
+
+        self.predicted = PredictedPlayer(c.SCREEN_WIDTH / 2, c.SCREEN_HEIGHT / 2)
+        self.predicted.input_source = inp.ActionInput()
+        self.sequence = 0
+        self.pending = collections.deque()
+        self.recent_masks = collections.deque(maxlen=c.NET_INPUT_REDUNDANCY)
+
+        self.bytes_received = 0
+        self.snapshots = 0
+        self.full_snapshots = 0
+        self.corrections = []
+        self.dropped = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def predict(self, mask):
+        """Move the predicted ship by one tick with the given keys held."""
+
+        self.predicted.input_source.set_action(mask)
+        self.predicted.update(self.dt)
+
+    def send_input(self, mask):
+        """
+        Send this tick's keys to the server and apply them to the predicted ship right away.
+
+        Args:
+            mask (int): Bitmask of held keys, as made by input_module.to_bitmask
+        """
+
+        self.sequence += 1
+        self.pending.append((self.sequence, mask))
+        self.recent_masks.append(mask)
+        self.predict(mask)
+
+        self.transport.sendto(nc.pack_input(self.latest_tick, self.sequence, list(self.recent_masks)))
+
+    def close(self):
+        """Tell the server this client is leaving, then close the socket."""
+
+        if self.transport is not None:
+            self.transport.sendto(nc.BYE_MAGIC)
+            self.transport.close()
+
+    def datagram_received(self, data, address):
+        """
+        Decode a snapshot and reconcile the predicted ship with it.
+
+        Args:
+            data (bytes): The packet
+            address (tuple): The server's (host, port)
+        """
+
+        try:
+            tick, base_tick, player_id, last_input, removed, changed, added, body = nc.unpack_snapshot(data)
+        except ValueError:
+            return
+
+        # Packets can arrive out of order; an older snapshot adds nothing
+        if self.latest_tick != nc.NO_BASE and tick <= self.latest_tick:
+            return
+
+        base = None
+        if base_tick != nc.NO_BASE:
+            base = self.history.get(base_tick)
+            if base is None:
+                self.dropped += 1
+                return
+
+        snapshot = nc.decode_snapshot(body, removed, changed, added, base)
+        self.bytes_received += len(data)
+        self.snapshots += 1
+        if base is None:
+            self.full_snapshots += 1
+
+        self.history[tick] = snapshot
+        while len(self.history) > c.SERVER_SNAPSHOT_HISTORY:
+            self.history.popitem(last=False)
+        self.latest_tick = tick
+        self.world = snapshot
+        self.player_id = player_id
+
+        self.reconcile(snapshot, last_input)
+
+    def reconcile(self, snapshot, last_input):
+        """
+        Snap the predicted ship to the server's version, then re-apply the inputs the server has not seen.
+
+        Args:
+            snapshot (numpy.ndarray): The newest snapshot
+            last_input (int): Sequence number of the last input the server applied
+        """
+
+        row = np.searchsorted(snapshot["id"], self.player_id)
+        if row >= len(snapshot) or snapshot["id"][row] != self.player_id:
+            return
+
+        while self.pending and self.pending[0][0] <= last_input:
+            self.pending.popleft()
+
+        predicted_position = pygame.Vector2(self.predicted.position)
+
+        position, _, _, rotation = nc.dequantize(snapshot[row])
+        self.predicted.position = pygame.Vector2(position)
+        self.predicted.rotation = rotation
+        for _, mask in self.pending:
+            self.predict(mask)
+
+        self.corrections.append(predicted_position.distance_to(self.predicted.position))
+
+    def report(self, elapsed):
+        """
+        Describe the bandwidth received and how well prediction matched the server.
+
+        Args:
+            elapsed (float): Seconds the client has been running
+
+        Returns:
+            str: The report
+        """
+
+        corrections = self.corrections or [0.0]
+        return (
+            f"client (player {self.player_id}): {self.bytes_received / max(elapsed, 1e-9) / 1024:.1f} KiB/s, "
+            f"{self.snapshots} snapshots ({self.full_snapshots} full, {self.dropped} dropped), {len(self.world)} objects, "
+            f"prediction error mean {np.mean(corrections):.3f}px max {np.max(corrections):.2f}px"
+        )
+
+
+async def drive_client(client, rng, period):
+    """
+    Play as a simulated client: hold a random set of keys, changing them every half second or so.
+
+    Args:
+        client (GameClient): The client to drive
+        rng (random.Random): Source of the key choices
+        period (float): Seconds between inputs (one per server tick)
+    """
+
+    mask = 0
+    while True:
+        if rng.random() < period * 2:
+            mask = rng.randrange(1 << len(inp.ACTION_KEYS))
+        client.send_input(mask)
+        await asyncio.sleep(period)
+
+
+async def run_loopback(client_count, seconds, seed):
+    """
+    Run a server and several simulated clients in this process, talking over localhost UDP.
+
+    Args:
+        client_count (int): Number of simulated clients
+        seconds (float): How long to run
+        seed (int): Seed for the world and the clients' key presses
+
+    Returns:
+        tuple: (server, clients), the GameServer and GameClient objects, for checking how the run went
+    """
+
+    loop = asyncio.get_running_loop()
+
+    server = GameServer(seed)
+    server_transport, _ = await loop.create_datagram_endpoint(lambda: server, local_addr=(c.SERVER_HOST, 0))
+    server_address = server_transport.get_extra_info("sockname")
+
+    clients = []
+    for _ in range(client_count):
+        client = GameClient()
+        await loop.create_datagram_endpoint(lambda client=client: client, remote_addr=server_address)
+        clients.append(client)
+
+    period = 1 / c.SERVER_TICK_RATE
+    drivers = [asyncio.create_task(drive_client(client, random.Random(seed + index), period)) for index, client in enumerate(clients)]
+
+    try:
+        await server.run(seconds)
+    finally:
+        for driver in drivers:
+            driver.cancel()
+        await asyncio.gather(*drivers, return_exceptions=True)
+
+        print(server.report())
+        for client in clients:
+            print("  " + client.report(seconds))
+            client.close()
+        server_transport.close()
+
+    return server, clients
+
+
+async def serve(port, seed):
+    """
+    Run the server alone until interrupted, printing a report every few seconds.
+
+    Args:
+        port (int): UDP port to listen on
+        seed (int): Seed for the world
+    """
+
+    loop = asyncio.get_running_loop()
+    server = GameServer(seed)
+    transport, _ = await loop.create_datagram_endpoint(lambda: server, local_addr=(c.SERVER_HOST, port))
+    print(f"Serving on {c.SERVER_HOST}:{port} (UDP)")
+
+    ticking = asyncio.create_task(server.run())
+    try:
+        while True:
+            await asyncio.sleep(5)
+            print(server.report())
+    finally:
+        ticking.cancel()
+        transport.close()
+
+
+def main():
+    """
+    Run the loopback demo, or just the server, from the command line.
+    """
+
+    parser = argparse.ArgumentParser(description="Run a local multiplayer Asteroids server.")
+    parser.add_argument("--serve", action="store_true", help="run only the server, until interrupted")
+    parser.add_argument("--port", type=int, default=c.SERVER_PORT, help="UDP port for --serve")
+    parser.add_argument("--clients", type=int, default=4, help="simulated clients in the loopback demo")
+    parser.add_argument("--seconds", type=float, default=5.0, help="length of the loopback demo")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the world and the simulated clients")
+    args = parser.parse_args()
+
+    try:
+        if args.serve:
+            asyncio.run(serve(args.port, args.seed))
+        else:
+            asyncio.run(run_loopback(args.clients, args.seconds, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
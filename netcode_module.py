@@ -0,0 +1,310 @@
+# netcode_module.py:
+# This module handles turning game state into small network packets and back.
+# Every object in a snapshot is one fixed-size record of quantized integers (positions in 1/8 pixels,
+# velocities in 1/4 pixels per second, rotation in 1/65536 turns). Instead of sending every record each
+# tick, the server sends the difference from a snapshot the client already has: which objects were
+# removed, which were added, and, for objects that changed, how much each field changed. Differences
+# are small numbers, so after zigzag encoding and splitting into low and high byte planes, zlib
+# squeezes them down to a few bytes per moving object.
+
+# Standard Library Imports
+import struct # Used to pack packet headers
+import zlib # Used to compress packet bodies
+
+# Third-Party Imports - External libraries
+import numpy as np
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+# Kinds of objects in a snapshot
+KIND_PLAYER = 0
+KIND_ASTEROID = 1
+KIND_SHOT = 2
+
+# One object in a snapshot; records are always sorted by id
+ENTITY_DTYPE = np.dtype([
+    ("id", "<u4"), # Network id, unique for the lifetime of one object
+    ("kind", "<u2"), # KIND_* value
+    ("x", "<i2"), ("y", "<i2"), # Position, in 1/NET_POSITION_SCALE pixels
+    ("vx", "<i2"), ("vy", "<i2"), # Velocity, in 1/NET_VELOCITY_SCALE pixels per second
+    ("radius", "<u2"), # Radius, in whole pixels
+    ("rotation", "<u2"), # Rotation, in 1/65536 of a full turn
+])
+
+# Fields sent as differences for objects that changed
+DELTA_FIELDS = ("kind", "x", "y", "vx", "vy", "radius", "rotation")
+
+# Marks a snapshot that is not based on an earlier one (sent whole)
+NO_BASE = 0xFFFFFFFF
+
+# Packet signatures
+SNAPSHOT_MAGIC = b"ASSN" # Server to client: world state
+INPUT_MAGIC = b"ASIN" # Client to server: key presses
+BYE_MAGIC = b"ASBY" # Client to server: leaving the game
+
+# Snapshot header: magic, tick, base tick, the client's player id, last input sequence applied,
+# and the number of removed, changed, and added objects (all little-endian)
+SNAPSHOT_HEADER = struct.Struct("<4sIIIIHHH")
+
+# Input header: magic, latest snapshot tick received, sequence number of the newest input,
+# number of inputs that follow (one byte each, newest last)
+INPUT_HEADER = struct.Struct("<4sIIB")
+
+
+def empty_snapshot():
+    """
+    Return a snapshot with no objects.
+
+    Returns:
+        numpy.ndarray: An empty ENTITY_DTYPE array
+    """
+
+    return np.zeros(0, dtype=ENTITY_DTYPE)
+
+
+def quantize(ids, kinds, positions, velocities, radii, rotations):
+    """
+    Build a snapshot from full-precision object arrays.
+
+    Args:
+        ids (numpy.ndarray): Network id of each object
+        kinds (numpy.ndarray): KIND_* value of each object
+        positions (numpy.ndarray): (N, 2) positions, in pixels
+        velocities (numpy.ndarray): (N, 2) velocities, in pixels per second
+        radii (numpy.ndarray): Radii, in pixels
+        rotations (numpy.ndarray): Rotations, in degrees
+
+    Returns:
+        numpy.ndarray: ENTITY_DTYPE records sorted by id
+    """
+
+    records = np.zeros(len(ids), dtype=ENTITY_DTYPE)
+    records["id"] = ids
+    records["kind"] = kinds
+
+    # Values past the int16 range (far off screen) are clamped rather than wrapped
+    position_units = np.clip(np.rint(positions * c.NET_POSITION_SCALE), -32768, 32767)
+    velocity_units = np.clip(np.rint(velocities * c.NET_VELOCITY_SCALE), -32768, 32767)
+    records["x"], records["y"] = position_units[:, 0], position_units[:, 1]
+    records["vx"], records["vy"] = velocity_units[:, 0], velocity_units[:, 1]
+    records["radius"] = np.rint(radii)
+    records["rotation"] = np.rint(np.mod(rotations, 360.0) / 360.0 * 65536) % 65536
+
+    return records[np.argsort(records["id"], kind="stable")]
+
+
+def dequantize(record):
+    """
+    Turn one snapshot record back into pixels and degrees.
+
+    Args:
+        record (numpy.void): One ENTITY_DTYPE record
+
+    Returns:
+        tuple: ((x, y), (vx, vy), radius, rotation)
+    """
+
+    position = (int(record["x"]) / c.NET_POSITION_SCALE, int(record["y"]) / c.NET_POSITION_SCALE)
+    velocity = (int(record["vx"]) / c.NET_VELOCITY_SCALE, int(record["vy"]) / c.NET_VELOCITY_SCALE)
+    return position, velocity, int(record["radius"]), int(record["rotation"]) * 360.0 / 65536
+
+
+def zigzag(values):
+    """Map signed 16-bit differences to unsigned ones, keeping small magnitudes small (0, -1, 1, -2 -> 0, 1, 2, 3)."""
+
+    values = values.astype(np.int16)
+    return ((values.astype(np.int32) << 1) ^ (values.astype(np.int32) >> 15)).astype(np.uint16)
+
+
+def unzigzag(values):
+    """Undo zigzag()."""
+
+    values = values.astype(np.int32)
+    return ((values >> 1) ^ -(values & 1)).astype(np.int16)
+
+
+def byte_planes(values):
+    """Store 16-bit values as all of their low bytes followed by all of their high bytes (compresses better)."""
+
+    values = values.astype("<u2")
+    return (values & 0xFF).astype(np.uint8).tobytes() + (values >> 8).astype(np.uint8).tobytes()
+
+
+def from_byte_planes(data, count):
+    """Undo byte_planes() for 'count' values."""
+
+    planes = np.frombuffer(data, dtype=np.uint8, count=count * 2)
+    return planes[:count].astype(np.uint16) | (planes[count:].astype(np.uint16) << 8)
+
+
+def encode_snapshot(current, base=None):
+    """
+    Encode a snapshot as the difference from a base snapshot.
+
+    Args:
+        current (numpy.ndarray): The snapshot to send
+        base (numpy.ndarray): A snapshot the receiver already has (None sends 'current' whole)
+
+    Returns:
+        tuple: (removed count, changed count, added count, compressed body)
+    """
+
+    if base is None:
+        base = empty_snapshot()
+
+    # Match objects by id (both snapshots are sorted by id)
+    _, current_common, base_common = np.intersect1d(current["id"], base["id"], assume_unique=True, return_indices=True)
+    removed_ids = np.setdiff1d(base["id"], current["id"], assume_unique=True)
+    added = current[np.setdiff1d(np.arange(len(current)), current_common, assume_unique=True)]
+
+    # Field differences for objects in both, wrapping around 16 bits so every difference is exact
+    differences = np.stack([
+        (current[field][current_common].astype(np.int32) - base[field][base_common].astype(np.int32)).astype(np.int16)
+        for field in DELTA_FIELDS
+    ]) if len(current_common) else np.zeros((len(DELTA_FIELDS), 0), dtype=np.int16)
+
+    # Objects whose every field is unchanged are left out
+    changed = np.any(differences != 0, axis=0)
+    changed_ids = current["id"][current_common][changed]
+    differences = differences[:, changed]
+
+    # Ids are sent as gaps from the previous id, which are small; each field is sent as its own column
+    body = [
+        removed_ids.astype("<u4").tobytes(),
+        np.diff(changed_ids, prepend=0).astype("<u4").tobytes(),
+    ]
+    body.extend(byte_planes(zigzag(column)) for column in differences)
+    body.append(added.tobytes())
+
+    return len(removed_ids), len(changed_ids), len(added), zlib.compress(b"".join(body), c.NET_COMPRESSION_LEVEL)
+
+
+def decode_snapshot(body, removed_count, changed_count, added_count, base=None):
+    """
+    Rebuild a snapshot from encode_snapshot() output and the same base snapshot.
+
+    Args:
+        body (bytes): The compressed body
+        removed_count (int): Number of objects removed since the base
+        changed_count (int): Number of objects that changed since the base
+        added_count (int): Number of objects added since the base
+        base (numpy.ndarray): The base snapshot (None for a snapshot sent whole)
+
+    Returns:
+        numpy.ndarray: The snapshot, sorted by id
+
+    Raises:
+        ValueError: If the body does not match the counts
+    """
+
+    if base is None:
+        base = empty_snapshot()
+
+    data = zlib.decompress(body)
+    expected = 4 * removed_count + 4 * changed_count + 2 * len(DELTA_FIELDS) * changed_count + ENTITY_DTYPE.itemsize * added_count
+    if len(data) != expected:
+        raise ValueError(f"Snapshot body is {len(data)} bytes, expected {expected}")
+
+    offset = 0
+    removed_ids = np.frombuffer(data, "<u4", removed_count, offset)
+    offset += removed_ids.nbytes
+    changed_ids = np.cumsum(np.frombuffer(data, "<u4", changed_count, offset), dtype=np.uint32)
+    offset += 4 * changed_count
+
+    # Start from the base without the removed objects
+    snapshot = base[~np.isin(base["id"], removed_ids)].copy()
+
+    # Apply field differences to the changed objects, wrapping around 16 bits like the encoder
+    rows = np.searchsorted(snapshot["id"], changed_ids)
+    for field in DELTA_FIELDS:
+        difference = unzigzag(from_byte_planes(data[offset:], changed_count))
+        offset += 2 * changed_count
+        wrapped = (snapshot[field][rows].astype(np.int32) + difference).astype(np.uint16)
+        snapshot[field][rows] = wrapped.view(snapshot.dtype[field])
+
+    added = np.frombuffer(data, ENTITY_DTYPE, added_count, offset)
+    snapshot = np.concatenate([snapshot, added])
+
+    return snapshot[np.argsort(snapshot["id"], kind="stable")]
+
+
+def pack_snapshot(tick, base_tick, player_id, last_input, encoded):
+    """
+    Build a snapshot packet.
+
+    Args:
+        tick (int): Server tick the snapshot was taken on
+        base_tick (int): Tick of the base snapshot (NO_BASE for a snapshot sent whole)
+        player_id (int): Network id of the receiving client's own player
+        last_input (int): Sequence number of the client's last input the server has applied
+        encoded (tuple): Output of encode_snapshot
+
+    Returns:
+        bytes: The packet
+    """
+
+    removed_count, changed_count, added_count, body = encoded
+    return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, tick, base_tick, player_id, last_input, removed_count, changed_count, added_count) + body
+
+
+def unpack_snapshot(packet):
+    """
+    Split a snapshot packet into its header values and compressed body.
+
+    Args:
+        packet (bytes): A packet made by pack_snapshot
+
+    Returns:
+        tuple: (tick, base tick, player id, last input, removed count, changed count, added count, body)
+
+    Raises:
+        ValueError: If the packet is not a snapshot
+    """
+
+    if len(packet) < SNAPSHOT_HEADER.size or packet[:4] != SNAPSHOT_MAGIC:
+        raise ValueError("Not a snapshot packet")
+
+    return SNAPSHOT_HEADER.unpack_from(packet)[1:] + (packet[SNAPSHOT_HEADER.size:],)
+
+
+def pack_input(ack_tick, sequence, masks):
+    """
+    Build an input packet carrying the newest few inputs (repeats cover lost packets).
+
+    Args:
+        ack_tick (int): Tick of the newest snapshot the client has (NO_BASE if none)
+        sequence (int): Sequence number of the newest input
+        masks (sequence): Key bitmasks, oldest first, ending with the newest input
+
+    Returns:
+        bytes: The packet
+    """
+
+    return INPUT_HEADER.pack(INPUT_MAGIC, ack_tick, sequence, len(masks)) + bytes(masks)
+
+
+def unpack_input(packet):
+    """
+    Read an input packet.
+
+    Args:
+        packet (bytes): A packet made by pack_input
+
+    Returns:
+        tuple: (ack tick, sequence number of the newest input, key bitmasks oldest first)
+
+    Raises:
+        ValueError: If the packet is not an input packet
+    """
+
+    if len(packet) < INPUT_HEADER.size or packet[:4] != INPUT_MAGIC:
+        raise ValueError("Not an input packet")
+
+    _, ack_tick, sequence, count = INPUT_HEADER.unpack_from(packet)
+    masks = packet[INPUT_HEADER.size:INPUT_HEADER.size + count]
+    if len(masks) != count:
+        raise ValueError("Input packet is truncated")
+
+    return ack_tick, sequence, list(masks)
@@ -0,0 +1,293 @@
+# particle_module.py:
+# This module handles short-lived visual particles: debris when an asteroid is hit and exhaust
+# while the ship moves. Particles are not sprites. Every particle lives in a slot of a few fixed-size
+# NumPy arrays used as a ring buffer, so emitting writes the next slots (overwriting the oldest
+# particles once the ring is full), and each step moves and ages every particle in a handful of
+# array operations. Drawing writes all of them into the screen's pixels at once. Particles have
+# their own random number source and never touch the game state, so replays and snapshots are
+# unaffected by them.
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class ParticleSystem:
+    """
+    Fixed-capacity particles stored in ring arrays, moved, expired, and drawn in bulk.
+
+    A slot holds a live particle while its age is below its lifetime; expired slots are simply
+    left in place until the ring comes round and overwrites them.
+
+    Attributes:
+        capacity (int): Number of particle slots
+        frame_budget (int): Most particles emitted per simulation step; extra emissions are dropped
+        positions (numpy.ndarray): (capacity, 2) positions, in pixels
+        velocities (numpy.ndarray): (capacity, 2) velocities, in pixels per second
+        ages (numpy.ndarray): Seconds each particle has existed
+        lifetimes (numpy.ndarray): Seconds each particle lasts (0 for slots never used)
+        head (int): Next slot to write
+        emitted_this_step (int): Particles emitted since the last update
+        emitted (int): Particles emitted in total
+        dropped (int): Particles not emitted because the step's budget was used up
+        rng (numpy.random.Generator): Random source for particle directions, speeds, and lifetimes
+    """
+
+    def __init__(self, capacity=c.PARTICLE_CAPACITY, frame_budget=c.PARTICLE_FRAME_BUDGET, seed=None):
+        """
+        Initialize an empty particle system.
+
+        Args:
+            capacity (int): Number of particle slots
+            frame_budget (int): Most particles emitted per simulation step
+            seed (int): Seed for the particles' own random number source (None picks one)
+        """
+
+        self.capacity = capacity
+        self.frame_budget = frame_budget
+
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.ages = np.zeros(capacity)
+        self.lifetimes = np.zeros(capacity)
+        self.head = 0
+
+        self.emitted_this_step = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.thrust_carry = 0.0 # Fraction of a thrust particle owed from earlier steps
+
+        self.rng = np.random.default_rng(seed)
+        self.palettes = {} # Pixel values of the fade colors, per surface pixel format
+        self.dot_images = None # Small images of each fade color, for surfaces without a pixel array
+
+    def emit(self, origin, velocities, lifetimes):
+        """
+        Write new particles into the next slots of the ring, within the step's budget.
+
+        Args:
+            origin (numpy.ndarray): (N, 2) starting positions, or one (2,) position shared by all
+            velocities (numpy.ndarray): (N, 2) velocities, in pixels per second
+            lifetimes (numpy.ndarray): Seconds each particle lasts
+
+        Returns:
+            int: Number of particles emitted (fewer than N once the budget runs out)
+        """
+
+        count = min(len(velocities), self.frame_budget - self.emitted_this_step, self.capacity)
+        self.dropped += len(velocities) - max(count, 0)
+        if count <= 0:
+            return 0
+
+        # Slots wrap around the end of the arrays, overwriting the oldest particles
+        slots = (self.head + np.arange(count)) % self.capacity
+        self.head = int((self.head + count) % self.capacity)
+
+        self.positions[slots] = origin if np.ndim(origin) == 1 else origin[:count]
+        self.velocities[slots] = velocities[:count]
+        self.ages[slots] = 0.0
+        self.lifetimes[slots] = lifetimes[:count]
+
+        self.emitted_this_step += count
+        self.emitted += count
+        return count
+
+    def spray(self, count, position, velocity, heading, spread, speeds, lifetimes):
+        """
+        Emit particles from one point, fanned around a heading with random speeds and lifetimes.
+
+        Args:
+            count (int): Number of particles
+            position (pygame.Vector2): Where they start
+            velocity (pygame.Vector2): Velocity added to every particle (e.g. the source's own)
+            heading (float): Center direction of the fan, in degrees (0 points right, like pygame.Vector2.rotate)
+            spread (float): Largest angle either side of the heading, in degrees
+            speeds (tuple): (lowest, highest) speed, in pixels per second
+            lifetimes (tuple): (shortest, longest) lifetime, in seconds
+
+        Returns:
+            int: Number of particles emitted
+        """
+
+        if count <= 0:
+            return 0
+
+        angles = np.radians(heading + self.rng.uniform(-spread, spread, count))
+        speed = self.rng.uniform(speeds[0], speeds[1], count)
+        velocities = np.column_stack((np.cos(angles) * speed + velocity[0], np.sin(angles) * speed + velocity[1]))
+        return self.emit(np.array((position[0], position[1]), dtype=float), velocities,
+                         self.rng.uniform(lifetimes[0], lifetimes[1], count))
+
+    def burst(self, position, velocity, radius):
+        """
+        Emit debris flying out in every direction from a destroyed asteroid (called by Asteroid.split).
+
+        Args:
+            position (pygame.Vector2): Center of the asteroid
+            velocity (pygame.Vector2): Velocity of the asteroid (half of it carries over to the debris)
+            radius (float): Radius of the asteroid (bigger asteroids make more debris)
+        """
+
+        count = c.PARTICLES_PER_SPLIT * max(1, round(radius / c.ASTEROID_MIN_RADIUS))
+        self.spray(count, position, pygame.Vector2(velocity) * 0.5, 0.0, 180.0,
+                   c.PARTICLE_DEBRIS_SPEED, c.PARTICLE_DEBRIS_LIFETIME)
+
+    def thrust(self, position, forward, radius, dt):
+        """
+        Emit exhaust out of the back of a moving ship (called by Player.move).
+
+        Particles are emitted at 'c.PARTICLE_THRUST_RATE' per second of movement; fractions of a
+        particle carry over to the next step, so the rate is the same at any step length.
+
+        Args:
+            position (pygame.Vector2): Center of the ship
+            forward (pygame.Vector2): Unit vector the ship faces
+            radius (float): Radius of the ship
+            dt (float): Seconds moved this step (negative when moving backward, which blows exhaust out of the front)
+        """
+
+        self.thrust_carry += c.PARTICLE_THRUST_RATE * abs(dt)
+        count = int(self.thrust_carry)
+        self.thrust_carry -= count
+
+        # Exhaust leaves the side of the ship opposite to the direction it moves
+        exhaust = -forward if dt >= 0 else forward
+        heading = pygame.Vector2(1, 0).angle_to(exhaust)
+        self.spray(count, position + exhaust * radius, pygame.Vector2(0, 0), heading, c.PARTICLE_THRUST_SPREAD,
+                   c.PARTICLE_THRUST_SPEED, c.PARTICLE_THRUST_LIFETIME)
+
+    def update(self, dt):
+        """
+        Move, slow, and age every particle in one vectorized step, and start a new emission budget.
+
+        Args:
+            dt (float): Seconds simulated this step
+        """
+
+        self.positions += self.velocities * dt
+        self.velocities *= c.PARTICLE_DRAG ** dt
+        self.ages += dt
+        self.emitted_this_step = 0
+
+    def live_count(self):
+        """Return the number of particles that have not expired."""
+
+        return int(np.count_nonzero(self.ages < self.lifetimes))
+
+    def palette(self, screen):
+        """
+        Get the screen's pixel values for every fade level, from background (level 0) to asset color.
+
+        Args:
+            screen (pygame.Surface): The surface particles are drawn on
+
+        Returns:
+            numpy.ndarray: One mapped pixel value per fade level
+        """
+
+        key = (screen.get_bitsize(), screen.get_masks())
+        palette = self.palettes.get(key)
+        if palette is None:
+            palette = np.array([screen.map_rgb(fade_color(level)) for level in range(c.PARTICLE_FADE_LEVELS)], dtype=np.uint32)
+            self.palettes[key] = palette
+        return palette
+
+    def draw(self, screen, offset=None):
+        """
+        Draw every live particle as a small square that fades out over its lifetime.
+
+        On surfaces with a pixel array (8, 16, and 32 bits per pixel) the squares are written straight
+        into the pixels with a few array assignments; otherwise they are copied in one blits call.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            offset (pygame.Vector2): World position of the screen's top-left corner, in a scrolling world (None for no offset)
+
+        Returns:
+            int: Number of particles drawn
+        """
+
+        live = np.flatnonzero(self.ages < self.lifetimes)
+        if len(live) == 0:
+            return 0
+
+        positions = self.positions[live]
+        if offset is not None:
+            positions = positions - (offset[0], offset[1])
+        xs = positions[:, 0].astype(np.int64)
+        ys = positions[:, 1].astype(np.int64)
+
+        # Skip particles that are off the screen (or too close to its edge to fit)
+        size = c.PARTICLE_SIZE
+        width, height = screen.get_size()
+        on_screen = (xs >= 0) & (xs <= width - size) & (ys >= 0) & (ys <= height - size)
+        xs, ys, live = xs[on_screen], ys[on_screen], live[on_screen]
+        if len(live) == 0:
+            return 0
+
+        # Brightest when new, fading to the background color as the particle reaches its lifetime
+        levels = np.ceil((1.0 - self.ages[live] / self.lifetimes[live]) * (c.PARTICLE_FADE_LEVELS - 1)).astype(np.int64)
+
+        try:
+            pixels = pygame.surfarray.pixels2d(screen)
+        except ValueError:
+            # 24-bit surfaces have no 2D pixel array
+            self.blit_dots(screen, xs, ys, levels)
+            return len(live)
+
+        colors = self.palette(screen)[levels]
+        for dx in range(size):
+            for dy in range(size):
+                pixels[xs + dx, ys + dy] = colors
+        # The surface stays locked while the pixel array exists
+        del pixels
+
+        return len(live)
+
+    def blit_dots(self, screen, xs, ys, levels):
+        """
+        Draw particles by copying a small pre-filled square per particle, in one blits call.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            xs, ys (numpy.ndarray): Top-left corners of the particles on screen
+            levels (numpy.ndarray): Fade level of each particle
+        """
+
+        if self.dot_images is None:
+            self.dot_images = []
+            for level in range(c.PARTICLE_FADE_LEVELS):
+                image = pygame.Surface((c.PARTICLE_SIZE, c.PARTICLE_SIZE))
+                image.fill(fade_color(level))
+                self.dot_images.append(image)
+
+        images = self.dot_images
+        screen.blits([(images[level], (x, y)) for level, x, y in zip(levels.tolist(), xs.tolist(), ys.tolist())], doreturn=False)
+
+    def stats(self):
+        """
+        Return the particle counters.
+
+        Returns:
+            dict: Live particles, capacity, and how many were emitted and dropped
+        """
+
+        return {"live": self.live_count(), "capacity": self.capacity, "emitted": self.emitted, "dropped": self.dropped}
+
+
+def fade_color(level):
+    """
+    Blend from the background color (level 0) to the asset color (the last fade level).
+
+    Args:
+        level (int): Fade level, from 0 to 'c.PARTICLE_FADE_LEVELS' - 1
+
+    Returns:
+        tuple: RGB color
+    """
+
+    weight = level / (c.PARTICLE_FADE_LEVELS - 1)
+    return tuple(round(back + (front - back) * weight) for back, front in zip(c.BACKGROUND_COLOR, c.ASSET_COLOR))
@@ -0,0 +1,226 @@
+# pipeline_module.py:
+# This module handles running the simulation and the drawing of a frame at the same time.
+# After the simulation steps of a frame, everything that is drawn (kind, position, radius, rotation)
+# is copied into a set of NumPy arrays. There are two such sets: while a worker thread simulates the
+# next frame and fills one set, the main thread draws the previous frame from the other, then the two
+# swap. Drawing only ever reads the copied arrays, never the live asteroids, shots, or player, so it
+# cannot see an object half-way through an update. pygame releases the GIL while filling, blitting,
+# and flipping, so on a multi-core machine the simulation really runs alongside the drawing.
+
+# Standard Library Imports
+import concurrent.futures # A one-thread executor runs the simulation
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import asteroid_module as a # Asteroid-related classes and functionality
+import collision_module as col # Gathers object positions and radii into arrays (from the entity store when one is used)
+import player_module as p # Player-related classes and functionality
+
+
+# What each recorded object looks like
+KIND_SHIP = 0 # The player's ship: a triangle at the recorded rotation
+KIND_ASTEROID = 1 # An asteroid: a circle outline
+KIND_SHOT = 2 # A shot: a circle outline
+
+# Maps each drawable class to its kind
+KINDS = {p.Player: KIND_SHIP, a.Asteroid: KIND_ASTEROID, p.Shot: KIND_SHOT}
+
+# Outline color of each circle kind (the same colors Asteroid.draw and Shot.draw use)
+CIRCLE_COLORS = {KIND_ASTEROID: c.BACKGROUND_COLOR, KIND_SHOT: c.ASSET_COLOR}
+
+
+class FrameState:
+    """
+    A copy of everything drawn in one frame, held in NumPy arrays that are reused every frame.
+
+    Attributes:
+        count (int): Number of objects recorded
+        kinds (numpy.ndarray): KIND_* value of each object
+        positions (numpy.ndarray): (capacity, 2) positions after the frame's last simulation step
+        previous (numpy.ndarray): (capacity, 2) positions before that step, for interpolated drawing
+        radii (numpy.ndarray): Radius of each object
+        rotations (numpy.ndarray): Rotation of each object, in degrees (0 for circles)
+        alpha (float): Blend factor between 'previous' and 'positions' to draw at (see FixedStepClock.alpha)
+    """
+
+    def __init__(self, capacity=c.ENTITY_STORE_CAPACITY):
+        """
+        Initialize an empty frame.
+
+        Args:
+            capacity (int): Starting number of objects the arrays can hold (grows automatically)
+        """
+
+        self.count = 0
+        self.alpha = 0.0
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """
+        Replace the arrays with empty ones of a new size.
+
+        Args:
+            capacity (int): Number of objects the arrays can hold
+        """
+
+        self.kinds = np.zeros(capacity, dtype=np.uint8)
+        self.positions = np.zeros((capacity, 2))
+        self.previous = np.zeros((capacity, 2))
+        self.radii = np.zeros(capacity)
+        self.rotations = np.zeros(capacity)
+
+    def capture(self, sprites, previous_positions, alpha):
+        """
+        Record the current state of every drawn object.
+
+        Args:
+            sprites (iterable): Objects to record, e.g. the drawable group
+            previous_positions (dict): Positions from loop_module.snapshot_positions, taken before the last step
+                                       (objects missing from it are drawn at their current position)
+            alpha (float): Blend factor the frame should be drawn at
+        """
+
+        sprites = list(sprites)
+        count = len(sprites)
+        if count > len(self.kinds):
+            self.allocate(max(count, len(self.kinds) * 2))
+
+        self.count = count
+        self.alpha = alpha
+        if count == 0:
+            return
+
+        positions, _, radii = col.circle_arrays(sprites)
+        self.positions[:count] = positions
+        self.radii[:count] = radii
+
+        # Build plain lists first and copy each into its array in one assignment
+        self.kinds[:count] = [KINDS[type(sprite)] for sprite in sprites]
+        self.rotations[:count] = [getattr(sprite, "rotation", 0.0) for sprite in sprites]
+        self.previous[:count] = [previous_positions.get(sprite, position) for sprite, position in zip(sprites, positions.tolist())]
+
+    def draw(self, screen, sprite_cache=None):
+        """
+        Clear the screen and draw the recorded objects, blended between their last two positions.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            sprite_cache (SpriteCache): Pre-rendered images to blit (None draws every shape)
+        """
+
+        screen.fill(c.BACKGROUND_COLOR)
+
+        count = self.count
+        if count == 0:
+            return
+
+        # Interpolate every position in one NumPy operation
+        previous = self.previous[:count]
+        points = (previous + (self.positions[:count] - previous) * self.alpha).tolist()
+        kinds = self.kinds[:count].tolist()
+        radii = self.radii[:count].tolist()
+        rotations = self.rotations[:count].tolist()
+
+        if sprite_cache is None:
+            for kind, (x, y), radius, rotation in zip(kinds, points, radii, rotations):
+                if kind == KIND_SHIP:
+                    pygame.draw.polygon(screen, c.ASSET_COLOR, p.ship_triangle(pygame.Vector2(x, y), rotation, radius), c.OUTLINE_WIDTH)
+                else:
+                    pygame.draw.circle(screen, CIRCLE_COLORS[kind], (x, y), radius, c.OUTLINE_WIDTH)
+            return
+
+        # Copy every cached image onto the screen in a single call
+        blit_list = []
+        for kind, (x, y), radius, rotation in zip(kinds, points, radii, rotations):
+            if kind == KIND_SHIP:
+                image = sprite_cache.ship_at(radius, rotation)
+            else:
+                image = sprite_cache.circle(radius, CIRCLE_COLORS[kind])
+            # Cached images are square and centered on the object, so offset by half the width
+            half_size = image.get_width() // 2
+            blit_list.append((image, (int(x) - half_size, int(y) - half_size)))
+        screen.blits(blit_list, doreturn=False)
+
+
+class RenderPipeline:
+    """
+    Simulates the next frame on a worker thread while the main thread draws the last one.
+
+    Holds two FrameState buffers: 'front' is drawn by the main thread, 'back' is filled by the worker.
+    The caller starts a simulation with start(), draws the front buffer, waits with finish(), and the
+    buffers are swapped. What is on screen is therefore always one frame behind the simulation.
+
+    Attributes:
+        front (FrameState): The completed frame being drawn
+        back (FrameState): The frame the worker fills
+        executor (concurrent.futures.ThreadPoolExecutor): The single simulation thread
+        pending (concurrent.futures.Future): The simulation in progress (None when idle)
+    """
+
+    def __init__(self):
+        """
+        Initialize the pipeline with two empty buffers and a simulation thread.
+        """
+
+        self.front = FrameState()
+        self.back = FrameState()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+        self.pending = None
+
+    def start(self, simulate, *args):
+        """
+        Begin simulating the next frame on the worker thread.
+
+        Args:
+            simulate (callable): Runs the frame's simulation steps and fills the buffer it is given,
+                                 called as simulate(back_buffer, *args)
+            *args: Further arguments for 'simulate'
+        """
+
+        self.pending = self.executor.submit(simulate, self.back, *args)
+
+    def finish(self):
+        """
+        Wait for the simulation to finish, then make its frame the one drawn next.
+
+        Blocks the calling thread (not just the current coroutine), so nothing else can look at the
+        game objects while the worker is still changing them.
+
+        Returns:
+            The value returned by the 'simulate' function (None if no simulation was started)
+        """
+
+        if self.pending is None:
+            return None
+
+        # result() re-raises anything the simulation raised, here on the main thread
+        result = self.pending.result()
+        self.pending = None
+        self.front, self.back = self.back, self.front
+        return result
+
+    def draw(self, screen, sprite_cache=None):
+        """
+        Draw the front buffer (the last completed frame).
+
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            sprite_cache (SpriteCache): Pre-rendered images to blit (None draws every shape)
+        """
+
+        self.front.draw(screen, sprite_cache)
+
+    def close(self):
+        """
+        Wait for any simulation in progress and stop the worker thread.
+        """
+
+        # Errors from an unfinished simulation are not raised here; finish() is where they are reported
+        if self.pending is not None:
+            concurrent.futures.wait([self.pending])
+            self.pending = None
+        self.executor.shutdown(wait=True)
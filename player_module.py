@@ -7,10 +7,47 @@ import pygame
 # Local Module Imports - Game-specific modules
 import constants as c # Game constants and configurations, like colors, sizes, and player settings
 import circleshape as cs # Base class for circular shapes, which the Player class extends
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+
+
+def ship_triangle(center, rotation, radius):
+    """
+    Calculate the three vertices of a ship's triangle.
+
+    Kept apart from Player so a ship can be drawn from recorded values alone
+    (the pipelined renderer draws copies of the game state, never the live player).
+
+    Args:
+        center (pygame.Vector2): Center of the ship
+        rotation (float): Direction the ship faces, in degrees
+        radius (float): Radius of the ship
+
+    Returns:
+        list: The tip, bottom-left, and bottom-right vertices (pygame.Vector2)
+    """
+
+    # Forward direction vector, rotated to match the ship's orientation
+    forward = pygame.Vector2(0, 1).rotate(rotation)
+
+    # Right direction vector, scaled relative to the radius to form the triangle's base
+    right = pygame.Vector2(0, 1).rotate(rotation + 90) * radius / 1.5
+
+    # Vertex 'a': Tip of the triangle, extending forward from the center
+    a = center + forward * radius
+    # Vertex 'b': Bottom-left of the triangle, moving backward and offset by 'right' vector
+    b = center - forward * radius - right
+    # Vertex 'c': Bottom-right of the triangle, moving backward and offset by the inverse 'right' vector
+    c = center - forward * radius + right
+
+    # Return a list of the triangle's vertices
+    return [a, b, c]
 
 
 # Definition of the Player class, which inherits from the CircleShape class
 class Player(cs.CircleShape):
+    # Particle system the ship's exhaust is emitted into (setup_game_objects sets it; None emits nothing)
+    particles = None
+
     def __init__(self, x, y):
         # Initialize the player as a type of CircleShape at position (x, y) with a radius from constants
         super().__init__(x, y, c.PLAYER_RADIUS)
@@ -21,24 +58,23 @@ class Player(cs.CircleShape):
         # Timer to control shooting rate, initialized to a cooldown value from constants
         self.shot_timer = c.PLAYER_SHOOT_COOLDOWN
 
-    def triangle(self):
-        """Calculate the three vertices of the player's triangular representation based on its position and rotation."""
+        # Where the player's key presses come from; headless runs swap in scripted or null input
+        self.input_source = inp.KeyboardInput()
 
-        # Forward direction vector, rotated to match the player's current orientation
-        forward = pygame.Vector2(0, 1).rotate(self.rotation)
+    def triangle(self, center=None, rotation=None):
+        """
+        Calculate the three vertices of the player's triangular representation based on its position and rotation.
 
-        # Right direction vector, scaled relative to the radius to form the triangle's base
-        right = pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5
+        'center' and 'rotation' default to the player's own; the sprite cache passes its own values
+        to draw the ship onto a small pre-rendered image.
+        """
 
-        # Vertex 'a': Tip of the triangle, extending forward from the player's position
-        a = self.position + forward * self.radius
-        # Vertex 'b': Bottom-left of the triangle, moving backward and offset by 'right' vector
-        b = self.position - forward * self.radius - right
-        # Vertex 'c': Bottom-right of the triangle, moving backward and offset by the inverse 'right' vector
-        c = self.position - forward * self.radius + right
+        if center is None:
+            center = self.position
+        if rotation is None:
+            rotation = self.rotation
 
-        # Return a list of the triangle's vertices
-        return [a, b, c]
+        return ship_triangle(center, rotation, self.radius)
 
     def draw(self, screen):
         """Render the player's shape on the screen."""
@@ -51,6 +87,11 @@ class Player(cs.CircleShape):
         # '2': The width (thickness) of the triangle outline.
         pygame.draw.polygon(screen, c.ASSET_COLOR, self.triangle(), 2)
 
+    def cached_image(self, sprite_cache):
+        """Return the pre-rendered ship image for the player's current rotation."""
+
+        return sprite_cache.ship(self)
+
     def rotate(self, dt):
         """Update the player's rotation angle over time."""
 
@@ -65,8 +106,8 @@ class Player(cs.CircleShape):
         # Decrease the shot timer by the elapsed time ('dt'), enabling the cooldown for shooting.
         self.shot_timer -= dt
 
-        # Get the key states to check which keys are currently being pressed.
-        keys = pygame.key.get_pressed()
+        # Get the key states from the input source to check which keys are currently being pressed.
+        keys = self.input_source.get_pressed()
 
         # Rotate counterclockwise when the 'A' key is pressed
         if keys[pygame.K_a]:
@@ -95,6 +136,10 @@ class Player(cs.CircleShape):
         # 'dt': Delta time for smooth and consistent movement.
         self.position += forward * c.PLAYER_SPEED * dt
 
+        # Blow exhaust out of the side of the ship opposite to the movement
+        if self.particles is not None:
+            self.particles.thrust(self.position, forward, self.radius, dt)
+
     def shoot(self, shots_group):
         """Shoot a projectile if the player's shot timer has expired."""
 
@@ -104,7 +149,8 @@ class Player(cs.CircleShape):
             # Create a new 'Shot' object at the player's current position.
             # 'self.position[0]' is the x-coordinate, and 'self.position[1]' is the y-coordinate of the player.
             # 'c.SHOT_RADIUS' is a constant that defines how large the shot (projectile) will be.
-            shot = Shot(self.position[0], self.position[1], c.SHOT_RADIUS)
+            # 'Shot.create' reuses a previously destroyed shot when a pool is set up.
+            shot = Shot.create(self.position[0], self.position[1], c.SHOT_RADIUS)
 
             # Set the velocity of the shot. 
             # The direction of the velocity is calculated based on the player's current rotation ('self.rotation').
@@ -137,6 +183,19 @@ class Shot(cs.CircleShape):
         # Initialize the shot as a type of CircleShape at position (x, y) with a radius from constants
         super().__init__(x, y, radius)
 
+        # Time the shot has been in play, in seconds (used by the despawn policy's lifetime limit)
+        self.age = 0.0
+
+    def reset(self, x, y, radius):
+        """
+        Bring a destroyed shot back into play (used by the shot pool).
+        """
+
+        super().reset(x, y, radius)
+
+        # A reused shot starts its lifetime over
+        self.age = 0.0
+
     def draw(self, screen):
         """
         Render the shot on the screen.
@@ -150,6 +209,13 @@ class Shot(cs.CircleShape):
         # '2' specifies the width (outline thickness) of the circle.
         pygame.draw.circle(screen, c.ASSET_COLOR, self.position, self.radius, 2)
 
+    def cached_image(self, sprite_cache):
+        """
+        Return the pre-rendered image of the shot.
+        """
+
+        return sprite_cache.circle(self.radius, c.ASSET_COLOR)
+
     def update(self, dt):
         """
         Update the state of the shot each frame.
@@ -158,4 +224,8 @@ class Shot(cs.CircleShape):
         # Update the position of the shot based on its velocity and the elapsed time ('dt').
         # 'self.velocity' determines the direction and speed of the shot.
         # Multiplying by 'dt' ensures smooth, frame-independent movement.
-        self.position += self.velocity * dt
\ No newline at end of file
+        # Store-backed shots skip this step because the entity store moves them all at once.
+        self.integrate(dt)
+
+        # Age the shot so it can be removed once it exceeds its lifetime
+        self.age += dt
\ No newline at end of file
@@ -0,0 +1,102 @@
+# pool_module.py:
+# This module handles recycling game objects instead of constructing new ones.
+# Shots and asteroids are created and destroyed constantly; a pool keeps killed objects around
+# and hands them back out (with their state reset) the next time one of that type is needed.
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class ObjectPool:
+    """
+    A store of killed objects of one class, ready to be reset and reused.
+
+    Killed objects are first held as 'pending' and only become reusable once recycle() is called
+    at the end of the frame. Code that runs later in the same frame (like a second Asteroid.split
+    on an asteroid that was already hit) therefore never sees an object that has been reused.
+
+    Attributes:
+        cls (type): The class of object this pool creates (e.g. Asteroid or Shot)
+        max_size (int): Most killed objects kept for reuse; extras are left to the garbage collector
+        free (list): Objects ready to be reused
+        pending (list): Objects killed this frame, waiting for recycle()
+        created (int): Number of objects constructed because the pool was empty
+        reused (int): Number of objects handed out again instead of being constructed
+        released (int): Number of killed objects returned to the pool
+    """
+
+    def __init__(self, cls, max_size=c.POOL_MAX_SIZE):
+        """
+        Initialize an empty pool.
+
+        Args:
+            cls (type): The class of object this pool creates
+            max_size (int): Most killed objects kept for reuse
+        """
+
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.pending = []
+
+        # Allocation and reuse statistics
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self, *args):
+        """
+        Get an object, reusing a killed one if possible.
+
+        Args:
+            *args: The same arguments the class constructor takes (e.g. x, y, radius)
+
+        Returns:
+            An object of the pool's class, already added to its class containers
+        """
+
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+
+        self.created += 1
+        return self.cls(*args)
+
+    def release(self, obj):
+        """
+        Hold a killed object until the end of the frame.
+
+        Args:
+            obj: The object that was just killed
+        """
+
+        self.pending.append(obj)
+        self.released += 1
+
+    def recycle(self):
+        """
+        Make every object killed this frame available for reuse. Call once per frame.
+        """
+
+        room = self.max_size - len(self.free)
+        self.free.extend(self.pending[:max(room, 0)])
+        self.pending.clear()
+
+    def stats(self):
+        """
+        Report how many objects were constructed versus reused.
+
+        Returns:
+            dict: Counts of created, reused, released, and currently free objects, and the reuse rate
+        """
+
+        handed_out = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "free": len(self.free),
+            "reuse_rate": round(self.reused / handed_out, 3) if handed_out else 0.0,
+        }
@@ -0,0 +1,228 @@
+# profiler_module.py:
+# This module handles measuring where each frame's time goes.
+# Named sections of the game loop (events, update, collisions, rendering, display flip) are timed
+# every frame and kept in a rolling history, together with the size of each sprite group.
+# The history can be shown as an in-game overlay or exported to CSV/JSON with p50/p95/p99 summaries.
+
+# Standard Library Imports
+import collections # deque gives a fixed-length rolling history of frames
+import contextlib # nullcontext lets callers skip timing when no profiler is in use
+import csv # Used for CSV export
+import json # Used for JSON export
+import time # perf_counter provides high-resolution timestamps
+
+# Third-Party Imports - External game libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+# Percentiles reported for frame and section times
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, percent):
+    """
+    Find the value below which 'percent' percent of the values fall (nearest-rank method).
+
+    Args:
+        values (list): Numbers to summarize
+        percent (float): Percentile to compute, from 0 to 100
+
+    Returns:
+        float: The percentile value (0.0 for an empty list)
+    """
+
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def section(profiler, name):
+    """
+    Time a block of code if a profiler is in use.
+
+    Example:
+        with section(profiler, "collision"):
+            handle_collisions(...)
+
+    Args:
+        profiler (FrameProfiler): The profiler to record into (None times nothing)
+        name (str): Name of the section
+
+    Returns:
+        A context manager for the 'with' statement
+    """
+
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.section(name)
+
+
+class FrameProfiler:
+    """
+    Records per-section timings and sprite group sizes for each frame.
+
+    Attributes:
+        history (collections.deque): The most recent frame records, oldest first
+        overlay_visible (bool): Whether the in-game overlay is drawn
+        current (dict): Section times (in milliseconds) for the frame in progress
+    """
+
+    def __init__(self, history_length=c.PROFILER_HISTORY):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            history_length (int): Number of frames kept in the rolling history
+        """
+
+        self.history = collections.deque(maxlen=history_length)
+        self.overlay_visible = False
+        self.current = {}
+        self.frame_start = None
+        self.font = None # Created on first use, since pygame.font needs pygame to be initialized
+
+    def begin_frame(self):
+        """Mark the start of a new frame."""
+
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """
+        Time the code inside a 'with' block and add it to the current frame.
+
+        Args:
+            name (str): Name of the section
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.current[name] = self.current.get(name, 0.0) + elapsed_ms
+
+    def end_frame(self, group_sizes=None):
+        """
+        Finish the current frame and store it in the rolling history.
+
+        Args:
+            group_sizes (dict): Sprite group names mapped to their sizes this frame
+        """
+
+        if self.frame_start is None:
+            return
+
+        record = {"frame_ms": (time.perf_counter() - self.frame_start) * 1000}
+        record.update(self.current)
+        record.update(group_sizes or {})
+
+        self.history.append(record)
+        self.frame_start = None
+
+    def toggle_overlay(self):
+        """Show or hide the in-game overlay."""
+
+        self.overlay_visible = not self.overlay_visible
+
+    def summary(self, records=None):
+        """
+        Summarize the rolling history.
+
+        Args:
+            records (list): Frame records to summarize (None uses the current history)
+
+        Returns:
+            dict: For each timed field, its p50/p95/p99 in milliseconds;
+                  for each group, its latest size; plus the number of frames summarized
+        """
+
+        if records is None:
+            records = self.history
+
+        result = {"frames": len(records)}
+        if not records:
+            return result
+
+        # Sections can be missing from some frames, so gather every name seen in the history
+        names = []
+        for record in records:
+            names.extend(name for name in record if name not in names)
+
+        latest = records[-1]
+        for name in names:
+            if name in c.PROFILER_GROUP_NAMES:
+                result[name] = latest.get(name, 0)
+            else:
+                values = [record.get(name, 0.0) for record in records]
+                result[name] = {f"p{p}": round(percentile(values, p), 3) for p in PERCENTILES}
+
+        return result
+
+    def export(self, path, records=None):
+        """
+        Write the rolling history to a file.
+
+        A '.json' path gets the percentile summary plus every frame record;
+        any other path gets a CSV with one row per frame.
+
+        Args:
+            path (str): File to write
+            records (list): Copy of the frame records to write (None copies the current history).
+                            Passing a copy lets the file be written on another thread while frames keep coming.
+        """
+
+        if records is None:
+            records = list(self.history)
+
+        if path.endswith(".json"):
+            with open(path, "w") as file:
+                json.dump({"summary": self.summary(records), "frames": records}, file, indent=2)
+            return
+
+        # Every record may not have every section (e.g. a frame with no collisions), so collect all names
+        fields = []
+        for record in records:
+            fields.extend(name for name in record if name not in fields)
+
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields, restval=0)
+            writer.writeheader()
+            writer.writerows(records)
+
+    def draw_overlay(self, screen):
+        """
+        Draw frame time percentiles, section times, and group sizes in the top-left corner.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on
+        """
+
+        if not self.overlay_visible:
+            return
+
+        if self.font is None:
+            # The font subsystem is only started when the overlay is first shown
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.font = pygame.font.Font(None, c.PROFILER_FONT_SIZE)
+
+        lines = []
+        for name, value in self.summary().items():
+            if isinstance(value, dict):
+                lines.append(f"{name}: " + "  ".join(f"{key} {ms:.2f}ms" for key, ms in value.items()))
+            else:
+                lines.append(f"{name}: {value}")
+
+        y = 4
+        for line in lines:
+            text = self.font.render(line, True, c.ASSET_COLOR)
+            screen.blit(text, (4, y))
+            y += text.get_height()
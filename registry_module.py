@@ -0,0 +1,263 @@
+# registry_module.py:
+# This module handles keeping track of which objects are in the game, as a lighter replacement for
+# the four pygame sprite groups. Every object lives in exactly one typed bucket (players, asteroid
+# fields, asteroids, or shots), so creating or killing an object touches one bucket instead of three
+# groups. The "updatable" and "drawable" groups become views that read across several buckets.
+# Buckets and views can be used anywhere the game used a pygame.sprite.Group.
+
+# Third-Party Imports - External game libraries
+import pygame
+
+
+class EntityBucket:
+    """
+    A collection of sprites of one type, usable as a pygame sprite group.
+
+    Sprites are kept as the keys of a dictionary, so adding and removing are O(1) and sprites are
+    always visited in the order they were added, exactly like a pygame.sprite.Group. Order matters:
+    collisions and splits are resolved in group order and splits draw random numbers, so a bucket
+    that reordered its sprites would play a different game than the sprite groups with the same seed.
+
+    pygame.sprite.Sprite recognizes any object with a '_spritegroup' attribute as a group and
+    calls add_internal and remove_internal on it, so Sprite.add(), kill(), alive(), and groups()
+    all work unchanged.
+
+    Attributes:
+        name (str): Name of the bucket, for reports
+        items (dict): Sprites in the bucket, as keys in the order they were added (values are unused)
+    """
+
+    # Marks this as a sprite group for pygame.sprite.Sprite.add
+    _spritegroup = True
+
+    def __init__(self, name="", *sprites):
+        """
+        Initialize a bucket.
+
+        Args:
+            name (str): Name of the bucket, for reports
+            *sprites: Sprites to add right away
+        """
+
+        self.name = name
+        self.items = {}
+        if sprites:
+            self.add(*sprites)
+
+    # --- Hooks called by pygame.sprite.Sprite ---
+
+    def add_internal(self, sprite, layer=None):
+        """Record a sprite as a member (called by Sprite.add; 'layer' is accepted for compatibility)."""
+
+        self.items[sprite] = None
+
+    def remove_internal(self, sprite):
+        """Forget a member sprite, keeping the others in order (called by Sprite.kill)."""
+
+        del self.items[sprite]
+
+    def has_internal(self, sprite):
+        """Check whether a sprite is a member."""
+
+        return sprite in self.items
+
+    # --- pygame.sprite.Group methods ---
+
+    def sprites(self):
+        """Return a list of the sprites (a copy, so it is safe to kill sprites while looping over it)."""
+
+        return list(self.items)
+
+    def add(self, *sprites):
+        """
+        Add sprites, or any iterables of sprites, to the bucket.
+
+        Args:
+            *sprites: Sprites, lists of sprites, or groups
+        """
+
+        for sprite in sprites:
+            if isinstance(sprite, pygame.sprite.Sprite):
+                if sprite not in self.items:
+                    self.add_internal(sprite)
+                    sprite.add_internal(self)
+            else:
+                self.add(*sprite)
+
+    def remove(self, *sprites):
+        """
+        Remove sprites, or any iterables of sprites, from the bucket.
+
+        Args:
+            *sprites: Sprites, lists of sprites, or groups
+        """
+
+        for sprite in sprites:
+            if isinstance(sprite, pygame.sprite.Sprite):
+                if sprite in self.items:
+                    self.remove_internal(sprite)
+                    sprite.remove_internal(self)
+            else:
+                self.remove(*sprite)
+
+    def has(self, *sprites):
+        """Check whether every given sprite is a member (False if none are given)."""
+
+        return bool(sprites) and all(sprite in self.items for sprite in sprites)
+
+    def update(self, *args, **kwargs):
+        """Call update() on every sprite (sprites added during the loop wait until next time)."""
+
+        for sprite in list(self.items):
+            sprite.update(*args, **kwargs)
+
+    def draw(self, surface):
+        """Blit every sprite's 'image' at its 'rect', like pygame.sprite.Group.draw."""
+
+        surface.blits([(sprite.image, sprite.rect) for sprite in self.items])
+
+    def empty(self):
+        """Remove every sprite from the bucket."""
+
+        self.remove(list(self.items))
+
+    def copy(self):
+        """Return a new bucket with the same name and sprites."""
+
+        return EntityBucket(self.name, self.items)
+
+    def __iter__(self):
+        return iter(list(self.items))
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def __contains__(self, sprite):
+        return sprite in self.items
+
+    def __repr__(self):
+        return f"<EntityBucket {self.name!r} ({len(self.items)} sprites)>"
+
+
+class EntityView:
+    """
+    A read-only group made of several buckets, such as every object that needs updating.
+
+    Sprites are never added to a view directly: they join their own type's bucket and show up
+    in every view that includes it. Removing a sprite through a view removes it from its bucket.
+
+    Attributes:
+        name (str): Name of the view, for reports
+        buckets (tuple): The EntityBucket objects the view reads, in iteration order
+        registry (EntityRegistry): The registry the buckets belong to
+    """
+
+    def __init__(self, name, buckets, registry=None):
+        """
+        Initialize a view.
+
+        Args:
+            name (str): Name of the view, for reports
+            buckets (iterable): EntityBucket objects to read, in iteration order
+            registry (EntityRegistry): The registry the buckets belong to (lets setup code find the buckets)
+        """
+
+        self.name = name
+        self.buckets = tuple(buckets)
+        self.registry = registry
+
+    def sprites(self):
+        """Return a new list of the sprites in every bucket, bucket by bucket."""
+
+        sprites = []
+        for bucket in self.buckets:
+            sprites += bucket.items
+        return sprites
+
+    def remove(self, *sprites):
+        """Remove sprites from whichever of the view's buckets hold them."""
+
+        for bucket in self.buckets:
+            bucket.remove(*sprites)
+
+    def has(self, *sprites):
+        """Check whether every given sprite is in one of the view's buckets (False if none are given)."""
+
+        return bool(sprites) and all(sprite in self for sprite in sprites)
+
+    def update(self, *args, **kwargs):
+        """Call update() on every sprite (sprites added during the loop wait until next time)."""
+
+        for sprite in self.sprites():
+            sprite.update(*args, **kwargs)
+
+    def draw(self, surface):
+        """Blit every sprite's 'image' at its 'rect', like pygame.sprite.Group.draw."""
+
+        for bucket in self.buckets:
+            bucket.draw(surface)
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __len__(self):
+        return sum(len(bucket.items) for bucket in self.buckets)
+
+    def __bool__(self):
+        return any(bucket.items for bucket in self.buckets)
+
+    def __contains__(self, sprite):
+        return any(sprite in bucket.items for bucket in self.buckets)
+
+    def __repr__(self):
+        return f"<EntityView {self.name!r} ({len(self)} sprites)>"
+
+
+class EntityRegistry:
+    """
+    The typed buckets of one game, and the views that stand in for its combined sprite groups.
+
+    Attributes:
+        players (EntityBucket): The player's ship
+        fields (EntityBucket): Asteroid field managers (updated, never drawn)
+        asteroids (EntityBucket): Every asteroid
+        shots (EntityBucket): Every player shot
+        updatable (EntityView): Everything updated each frame: players, fields, asteroids, then shots
+        drawable (EntityView): Everything drawn each frame: players, asteroids, then shots
+    """
+
+    def __init__(self):
+        """
+        Initialize a registry with empty buckets.
+        """
+
+        self.players = EntityBucket("players")
+        self.fields = EntityBucket("fields")
+        self.asteroids = EntityBucket("asteroids")
+        self.shots = EntityBucket("shots")
+
+        self.updatable = EntityView("updatable", (self.players, self.fields, self.asteroids, self.shots), self)
+        self.drawable = EntityView("drawable", (self.players, self.asteroids, self.shots), self)
+
+    def groups(self):
+        """
+        Return the registry's stand-ins for the game's four sprite groups.
+
+        Returns:
+            tuple: (updatable, drawable, asteroids, shots), in the order game_systems.setup returns groups
+        """
+
+        return self.updatable, self.drawable, self.asteroids, self.shots
+
+    def counts(self):
+        """
+        Count the objects in each bucket.
+
+        Returns:
+            dict: Bucket names mapped to their sizes
+        """
+
+        return {bucket.name: len(bucket) for bucket in (self.players, self.fields, self.asteroids, self.shots)}
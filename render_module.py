@@ -0,0 +1,300 @@
+# render_module.py:
+# This module handles pre-rendered images and partial screen updates for fast drawing.
+# Asteroids, shots, and the player's ship are each rasterized once onto small color-keyed surfaces.
+# Every frame, render_screen then copies (blits) those cached images into place in a single
+# Surface.blits call, instead of rasterizing a new circle or polygon for every object.
+# DirtyRectRenderer goes further and only clears and updates the screen areas that changed.
+
+# Standard Library Imports
+import math # ceil sizes the ship image so no corner is clipped
+
+# Third-Party Imports - External game libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import player_module as p # Ship shape shared by the player and its cached images
+
+
+def blank_image(size):
+    """
+    Create a square image filled with the transparent color key, ready to draw on.
+
+    Args:
+        size (int): Width and height of the image, in pixels
+
+    Returns:
+        pygame.Surface: The empty image
+    """
+
+    image = pygame.Surface((size, size))
+    image.fill(c.SPRITE_COLORKEY)
+    return image
+
+
+def finish_image(image):
+    """
+    Prepare a drawn image for fast, repeated copying onto the screen.
+
+    The image is converted to the display's pixel format (when a window exists), and its
+    background is made transparent with a run-length encoded color key. Color-keyed images
+    copy much faster than images with per-pixel alpha.
+
+    Args:
+        image (pygame.Surface): An image drawn on a blank_image
+
+    Returns:
+        pygame.Surface: The finished image
+    """
+
+    if pygame.display.get_surface() is not None:
+        image = image.convert()
+    image.set_colorkey(c.SPRITE_COLORKEY, pygame.RLEACCEL)
+    return image
+
+
+class SpriteCache:
+    """
+    Stores pre-rendered outline images, created the first time each one is needed.
+
+    Attributes:
+        circles (dict): Maps (radius, color) to a pre-rendered circle outline
+        ships (dict): Maps (radius, rotation step) to a pre-rendered ship triangle
+        rotation_steps (int): Number of distinct ship rotations kept (rotation is rounded to the nearest step)
+    """
+
+    def __init__(self, rotation_steps=c.SHIP_ROTATION_STEPS):
+        """
+        Initialize an empty sprite cache.
+
+        Args:
+            rotation_steps (int): Number of distinct ship rotations kept
+        """
+
+        self.circles = {}
+        self.ships = {}
+        self.rotation_steps = rotation_steps
+
+    def circle(self, radius, color):
+        """
+        Get a transparent image of a circle outline, drawing it on first use.
+
+        The circle is centered in an image 'radius + SPRITE_PADDING' pixels from center to edge.
+
+        Args:
+            radius (float): Radius of the circle (asteroid radii are multiples of ASTEROID_MIN_RADIUS)
+            color (tuple): RGB color of the outline
+
+        Returns:
+            pygame.Surface: The cached image
+        """
+
+        key = (radius, color)
+        image = self.circles.get(key)
+
+        if image is None:
+            half_size = round(radius) + c.SPRITE_PADDING
+            image = blank_image(half_size * 2)
+            pygame.draw.circle(image, color, (half_size, half_size), round(radius), c.OUTLINE_WIDTH)
+            image = finish_image(image)
+            self.circles[key] = image
+
+        return image
+
+    def ship(self, player):
+        """
+        Get a transparent image of the player's ship at its current rotation, drawing it on first use.
+
+        Args:
+            player (Player): The player whose ship should be drawn
+
+        Returns:
+            pygame.Surface: The cached image
+        """
+
+        return self.ship_at(player.radius, player.rotation)
+
+    def ship_at(self, radius, rotation):
+        """
+        Get a transparent image of a ship with the given size and rotation, drawing it on first use.
+
+        The rotation is rounded to one of 'rotation_steps' angles, so only that many images are ever made.
+        The ship's back corners reach past its radius, so the image is sized from SHIP_EXTENT instead.
+
+        Args:
+            radius (float): Radius of the ship
+            rotation (float): Direction the ship faces, in degrees
+
+        Returns:
+            pygame.Surface: The cached image
+        """
+
+        step = round(rotation / 360 * self.rotation_steps) % self.rotation_steps
+        key = (round(radius), step)
+        image = self.ships.get(key)
+
+        if image is None:
+            half_size = math.ceil(key[0] * c.SHIP_EXTENT) + c.SPRITE_PADDING
+            center = pygame.Vector2(half_size, half_size)
+            image = blank_image(half_size * 2)
+
+            # Draw the triangle around the image center at the rounded rotation
+            points = p.ship_triangle(center, step * 360 / self.rotation_steps, radius)
+            pygame.draw.polygon(image, c.ASSET_COLOR, points, c.OUTLINE_WIDTH)
+            image = finish_image(image)
+            self.ships[key] = image
+
+        return image
+
+
+def sprite_bounds(sprite):
+    """
+    Get a rectangle that fully contains everything a sprite draws.
+
+    The ship's corners reach past its radius, so every sprite is given the ship's extent plus the
+    outline width. That is slightly generous for circles, which only costs a few extra pixels.
+
+    Args:
+        sprite (CircleShape): The sprite to measure
+
+    Returns:
+        pygame.Rect: The sprite's bounding rectangle on screen
+    """
+
+    half_size = math.ceil(sprite.radius * c.SHIP_EXTENT) + c.SPRITE_PADDING
+    x, y = sprite.position
+    return pygame.Rect(int(x) - half_size, int(y) - half_size, half_size * 2, half_size * 2)
+
+
+def draw_sprites(screen, sprites, sprite_cache=None, return_rects=False):
+    """
+    Draw sprites onto a surface, blitting cached images in one batch where possible.
+
+    Args:
+        screen (pygame.Surface): The surface to draw on
+        sprites (iterable): Sprites to draw, e.g. the drawable group
+        sprite_cache (SpriteCache): Pre-rendered images to blit (None draws every shape)
+        return_rects (bool): If True, collect the screen area covered by each sprite
+
+    Returns:
+        list: The covered rectangles if 'return_rects' is True, otherwise None
+    """
+
+    rects = [] if return_rects else None
+
+    if sprite_cache is None:
+        for sprite in sprites:
+            sprite.draw(screen)
+            if return_rects:
+                rects.append(sprite_bounds(sprite))
+        return rects
+
+    # Collect (image, top-left corner) pairs for every sprite with a cached image
+    blit_list = []
+    for sprite in sprites:
+        image = sprite.cached_image(sprite_cache)
+        if image is None:
+            # No pre-rendered image for this sprite, so draw it the normal way
+            sprite.draw(screen)
+            if return_rects:
+                rects.append(sprite_bounds(sprite))
+        else:
+            # Cached images are square and centered on the sprite, so offset by half the width
+            x, y = sprite.position
+            half_size = image.get_width() // 2
+            blit_list.append((image, (int(x) - half_size, int(y) - half_size)))
+
+    # Copy every cached image onto the screen in a single call
+    blitted = screen.blits(blit_list, doreturn=return_rects)
+    if return_rects:
+        rects.extend(blitted)
+
+    return rects
+
+
+class DirtyRectRenderer:
+    """
+    Redraws and updates only the parts of the screen that changed since the last frame.
+
+    Each frame, the areas covered by sprites in the previous frame are cleared to the background,
+    every sprite is drawn again, and only the old and new sprite areas are sent to the display.
+    When those areas add up to more than a set fraction of the screen, one full flip is used instead,
+    since many small updates would cost more than one big one.
+
+    Attributes:
+        max_fraction (float): Fraction of the screen area above which a full flip is used
+        previous_rects (list): Screen areas covered by sprites in the last frame
+        needs_full_redraw (bool): True until the first full frame has been drawn, and again for the frame after
+                                  a requested full redraw (so whatever was drawn over the whole screen, like the
+                                  profiler overlay, is erased the frame it stops being shown)
+    """
+
+    def __init__(self, max_fraction=c.DIRTY_RECT_MAX_FRACTION):
+        """
+        Initialize the renderer.
+
+        Args:
+            max_fraction (float): Fraction of the screen area above which a full flip is used
+        """
+
+        self.max_fraction = max_fraction
+        self.previous_rects = []
+        self.needs_full_redraw = True
+
+    def render(self, screen, drawable_group, sprite_cache=None, full_redraw=False):
+        """
+        Draw a frame, erasing only what was drawn last frame.
+
+        Args:
+            screen (pygame.Surface): The main display surface to render onto
+            drawable_group (pygame.sprite.Group): Group of all sprites that need to be drawn
+            sprite_cache (SpriteCache): Pre-rendered images to blit (None draws every shape)
+            full_redraw (bool): Clear the whole screen this frame and the next (e.g. while an overlay is shown)
+
+        Returns:
+            list or None: Screen areas to update, or None if the whole display should be flipped
+        """
+
+        # An overlay drawn over this frame is only erased by clearing the whole screen again next frame
+        requested_full_redraw = full_redraw
+        full_redraw = full_redraw or self.needs_full_redraw
+        screen_rect = screen.get_rect()
+
+        if full_redraw:
+            screen.fill(c.BACKGROUND_COLOR)
+        else:
+            # Erase every sprite where it was drawn last frame
+            for rect in self.previous_rects:
+                screen.fill(c.BACKGROUND_COLOR, rect)
+
+        # Redraw every sprite, since erasing may have cut into sprites that did not move
+        current_rects = draw_sprites(screen, drawable_group, sprite_cache, return_rects=True)
+        current_rects = [rect.clip(screen_rect) for rect in current_rects]
+        current_rects = [rect for rect in current_rects if rect.width and rect.height]
+
+        dirty_rects = self.previous_rects + current_rects
+        self.previous_rects = current_rects
+        self.needs_full_redraw = requested_full_redraw
+
+        if full_redraw:
+            return None
+
+        # Fall back to a full flip once the changed area is a large part of the screen
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if dirty_area > self.max_fraction * screen_rect.width * screen_rect.height:
+            return None
+
+        return dirty_rects
+
+    def present(self, dirty_rects):
+        """
+        Send the rendered frame to the display.
+
+        Args:
+            dirty_rects (list or None): Areas returned by render(); None flips the whole display
+        """
+
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
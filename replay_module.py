@@ -0,0 +1,289 @@
+# replay_module.py:
+# This module records and plays back complete games.
+# A game is fully determined by its random seed and the keys held on each simulation step, so a
+# replay stores only the seed, the timestep, the game modes that change how a game plays out,
+# and one byte of key bits per step (zlib-compressed).
+# Run directly to replay a recording headless at full speed: python replay_module.py game.replay
+
+# Standard Library Imports
+import argparse # Used to read command-line options when run directly
+import struct # Used to pack the fixed-size replay header
+import time # Used to measure how fast the replay runs
+import zlib # Used to compress the per-step key bytes
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import startup_module as st # Lazy imports and startup timing
+
+# Only needed for playback (recording from the windowed game never loads it)
+hm = st.lazy_import("headless_module") # Windowless, fixed-timestep game simulation
+es = st.lazy_import("entity_store") # Array-backed storage for object positions, velocities, and radii
+wd = st.lazy_import("world_module") # Scrolling world with chunked asteroids and a following camera
+
+
+# File signature and format version written at the start of every replay
+REPLAY_MAGIC = b"ASTR"
+REPLAY_VERSION = 2
+
+# Header layout: magic, version (u16), mode flags (u16), seed (u64), dt (f64), step count (u32), all little-endian
+HEADER_FORMAT = "<4sHHQdI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Mode flags: settings a game was played with that change how it plays out
+# (a replay only reproduces its game when played back with the same ones)
+FLAG_SCROLLING_WORLD = 1 # Played in a scrolling world
+FLAG_ENTITY_STORE = 2 # Objects kept their state in an entity store
+FLAG_SWEPT_COLLISIONS = 4 # Shots were tested along their path (USE_SWEPT_COLLISIONS)
+FLAG_BATCH_COLLISIONS = 8 # Collisions used the batched NumPy tests rather than the collision grid (USE_BATCH_COLLISIONS)
+
+# Names of the flags, for error messages
+FLAG_NAMES = {
+    FLAG_SCROLLING_WORLD: "scrolling world",
+    FLAG_ENTITY_STORE: "entity store",
+    FLAG_SWEPT_COLLISIONS: "swept collisions",
+    FLAG_BATCH_COLLISIONS: "batched collisions",
+}
+
+
+def mode_flags(world=None, entity_store=None, swept=c.USE_SWEPT_COLLISIONS, batched=c.USE_BATCH_COLLISIONS):
+    """
+    Combine the modes of a game into replay flags.
+
+    Args:
+        world (World): The game's scrolling world (None for a one-screen game)
+        entity_store (EntityStore): The game's entity store (None if objects keep their own state)
+        swept (bool): Whether shots are tested along their path
+        batched (bool): Whether collisions use the batched NumPy tests
+
+    Returns:
+        int: FLAG_* values combined with bitwise or
+    """
+
+    flags = 0
+    if world is not None:
+        flags |= FLAG_SCROLLING_WORLD
+    if entity_store is not None:
+        flags |= FLAG_ENTITY_STORE
+    if swept:
+        flags |= FLAG_SWEPT_COLLISIONS
+    if batched:
+        flags |= FLAG_BATCH_COLLISIONS
+    return flags
+
+
+def describe_flags(flags):
+    """
+    Name the modes set in a combination of replay flags.
+
+    Args:
+        flags (int): FLAG_* values combined with bitwise or
+
+    Returns:
+        str: Comma-separated mode names ("plain" when none are set)
+    """
+
+    names = [name for flag, name in FLAG_NAMES.items() if flags & flag]
+    return ", ".join(names) if names else "plain"
+
+
+class Replay:
+    """
+    The seed, timestep, game modes, and per-step key bits of one recorded game.
+
+    Attributes:
+        seed (int): Seed of the game's random number source
+        dt (float): Seconds simulated per step
+        masks (bytearray): One input_module.to_bitmask value per simulated step
+        flags (int): Modes the game was played with (see mode_flags)
+    """
+
+    def __init__(self, seed, dt, masks=(), flags=0):
+        """
+        Initialize a replay.
+
+        Args:
+            seed (int): Seed of the game's random number source (0 to 2**64 - 1)
+            dt (float): Seconds simulated per step
+            masks (iterable): Key bitmasks, one per step
+            flags (int): Modes the game was played with (see mode_flags)
+        """
+
+        self.seed = seed
+        self.dt = dt
+        self.masks = bytearray(masks)
+        self.flags = flags
+
+    def to_bytes(self):
+        """
+        Encode the replay in its compact binary format.
+
+        Returns:
+            bytes: Header followed by the compressed key bytes
+        """
+
+        header = struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.flags, self.seed, self.dt, len(self.masks))
+        return header + zlib.compress(bytes(self.masks), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode a replay made by to_bytes.
+
+        Args:
+            data (bytes): The encoded replay
+
+        Returns:
+            Replay: The decoded replay
+
+        Raises:
+            ValueError: If the data is not a replay, or its version or length is wrong
+        """
+
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Replay data is too short")
+
+        magic, version = struct.unpack_from("<4sH", data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        # Version 1 replays did not record their game modes, so they cannot be played back safely
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        _, _, flags, seed, dt, step_count = struct.unpack_from(HEADER_FORMAT, data)
+        masks = zlib.decompress(data[HEADER_SIZE:])
+        if len(masks) != step_count:
+            raise ValueError(f"Replay holds {len(masks)} steps, header says {step_count}")
+
+        return cls(seed, dt, masks, flags)
+
+    def save(self, path):
+        """
+        Write the replay to a file.
+
+        Args:
+            path (str): File to write
+        """
+
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay from a file written by save().
+
+        Args:
+            path (str): File to read
+
+        Returns:
+            Replay: The loaded replay
+        """
+
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+
+class RecordingInput:
+    """
+    Passes another input source through unchanged while recording its keys into a replay.
+
+    The keys are read once per step and held until advance(), so the player and the shooting
+    check see the same keys, and exactly one bitmask is stored per step.
+    """
+
+    def __init__(self, source, replay):
+        """
+        Initialize the recorder.
+
+        Args:
+            source: Input source to record (e.g. KeyboardInput)
+            replay (Replay): Replay the key bits are appended to
+        """
+
+        self.source = source
+        self.replay = replay
+        self.current = None
+
+    def get_pressed(self):
+        """Return the keys held this step, reading the wrapped source on first use."""
+
+        if self.current is None:
+            self.current = inp.from_bitmask(inp.to_bitmask(self.source.get_pressed()))
+        return self.current
+
+    def advance(self):
+        """Store this step's keys and move on to the next step."""
+
+        self.replay.masks.append(inp.to_bitmask(self.get_pressed()))
+        self.current = None
+        self.source.advance()
+
+
+def play_replay(replay, entity_store=None, world=None):
+    """
+    Re-run a recorded game headless, as fast as possible.
+
+    The game must be set up with the same modes it was recorded with, or it would play out differently.
+
+    Args:
+        replay (Replay): The recording to play
+        entity_store (EntityStore): Array-backed storage for all objects (needed if the game was recorded with one)
+        world (World): A new scrolling world to play in (needed if the game was recorded in one)
+
+    Returns:
+        HeadlessSimulation: The finished simulation, with its stats and game-over state
+
+    Raises:
+        ValueError: If the playback modes (including the collision settings in constants) differ from the recorded ones
+    """
+
+    flags = mode_flags(world, entity_store)
+    if flags != replay.flags:
+        raise ValueError(f"Replay was recorded with modes ({describe_flags(replay.flags)}), "
+                         f"but playback uses ({describe_flags(flags)})")
+
+    simulation = hm.HeadlessSimulation(
+        input_source=inp.ScriptedInput.from_bitmasks(replay.masks),
+        dt=replay.dt,
+        entity_store=entity_store,
+        seed=replay.seed,
+        world=world,
+    )
+    simulation.run(len(replay.masks))
+
+    return simulation
+
+
+def main():
+    """
+    Play a replay file from the command line and report its result and speed.
+    """
+
+    parser = argparse.ArgumentParser(description="Play back a recorded Asteroids game without a window.")
+    parser.add_argument("path", help="replay file to play")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+
+    # Set up the world and store the game was recorded with (the collision modes come from constants)
+    world = wd.World() if replay.flags & FLAG_SCROLLING_WORLD else None
+    entity_store = es.EntityStore() if replay.flags & FLAG_ENTITY_STORE else None
+
+    start = time.perf_counter()
+    try:
+        simulation = play_replay(replay, entity_store, world)
+    except ValueError as error:
+        parser.exit(1, f"Cannot play replay: {error}\n")
+    elapsed = time.perf_counter() - start
+
+    print(f"Replay: seed {replay.seed}, {len(replay.masks)} steps of {replay.dt:.6f}s ({describe_flags(replay.flags)})")
+    print(f"Simulated {simulation.frame} frames in {elapsed:.3f}s ({simulation.frame / max(elapsed, 1e-9):.0f} frames/s)")
+    print(simulation.stats.as_dict())
+
+    if simulation.game_over:
+        print("Game over!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,498 @@
+# session_module.py:
+# This module runs one windowed game on an asyncio event loop.
+# Each frame is a coroutine, and the time left over between frames is spent awaiting instead of
+# blocking, so background tasks (profile and replay flushing, periodic snapshots, and a local
+# control socket) run alongside the game without stalling it. Slow file writes happen on a worker
+# thread. Closing the window, a 'quit' command, a signal, or a game over all stop the loop the same
+# way, so every task is cancelled and every file is written before pygame shuts down.
+
+# Standard Library Imports
+import asyncio # Drives the frame loop and the background tasks
+import json # Used to format replies on the control socket
+import random # Used to pick and seed the game's own random number source
+import signal # Used to shut down cleanly on Ctrl+C or a termination request
+import time # Used to measure how much of each frame is left to wait
+
+# Third-Party Imports - External game libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import startup_module as st # Lazy imports and startup timing
+import game_systems as gs # Game running functionality
+import lifetime_module as lm # Despawn rules for off-screen and expired objects
+import profiler_module as prof # Per-section frame timing, overlay, and exports
+import render_module as rm # Pre-rendered sprite images for batched drawing
+import loop_module as lp # Fixed-timestep accumulator and interpolated rendering
+import pipeline_module as pl # Simulation on a worker thread, drawn from double-buffered copies
+import stats_module as sm # Per-game counters such as frames survived and asteroids destroyed
+
+# Only needed when their features are switched on, so they are loaded on first use
+es = st.lazy_import("entity_store") # Array-backed storage for object positions, velocities, and radii
+rp = st.lazy_import("replay_module") # Compact recordings of a game's seed and key presses
+snap = st.lazy_import("snapshot_module") # Binary capture and restore of the whole game state
+wd = st.lazy_import("world_module") # Scrolling world with chunked asteroids and a following camera
+pt = st.lazy_import("particle_module") # Ring-buffer particles for asteroid debris and ship exhaust
+
+
+class GameSession:
+    """
+    A windowed game whose frames and background tasks share one asyncio event loop.
+
+    Attributes:
+        screen (pygame.Surface): The game window
+        clock (pygame.time.Clock): Measures real time between frames
+        updatable_group, drawable_group, asteroids_group, shots_group (pygame.sprite.Group): The game's sprite groups
+        player_character (Player): The player's ship object
+        asteroid_field (AsteroidField): Manager object that handles asteroid spawning
+        world (World): The scrolling world the game is played in (None when it fits on one screen)
+        seed (int): Seed of the game's random number source
+        replay (Replay): Recording of this game's key presses (None when not recording)
+        stats (GameStats): Frames survived, asteroids destroyed, and peak object counts
+        profiler (FrameProfiler): Per-section frame timings
+        paused (bool): While True, frames are drawn but the simulation does not advance
+        stop_reason (str): Why the game stopped (None while it is running)
+    """
+
+    def __init__(self):
+        """
+        Initialize pygame, open the window, and create a fresh game.
+        """
+
+        # --- GAME SETUP ---
+        # Initialize the game screen, clock, and sprite groups for game objects
+        # 'gs.setup()' is responsible for setting up everything Pygame needs
+        (self.screen, self.clock, self.updatable_group, self.drawable_group,
+         self.asteroids_group, self.shots_group) = gs.setup()
+        st.timer.mark("pygame and window")
+
+        # Optionally play in a world larger than the screen, simulated in chunks around a following camera
+        self.world = wd.World() if c.USE_SCROLLING_WORLD else None
+
+        # Optionally keep every object's state in shared NumPy arrays for bulk movement, culling, and collisions (pays off with thousands of objects)
+        # (not with a scrolling world, where the store would move every asteroid in the world each step)
+        entity_store = es.EntityStore() if c.USE_ENTITY_STORE and self.world is None else None
+
+        # Give the game its own seeded random number source, so the seed plus the key presses reproduce it exactly
+        self.seed = c.GAME_SEED if c.GAME_SEED is not None else random.getrandbits(64)
+        rng = random.Random(self.seed)
+
+        # Optionally scatter debris from hit asteroids and exhaust behind the moving ship
+        # (particles are drawn over a fully redrawn screen, so not with dirty rects or the pipeline's buffered copies)
+        use_dirty_rects = c.USE_DIRTY_RECTS and not c.PIPELINED_RENDERING and self.world is None
+        use_particles = c.USE_PARTICLES and not use_dirty_rects and not c.PIPELINED_RENDERING
+        self.particles = pt.ParticleSystem() if use_particles else None
+
+        # Create the player character and initial asteroid field
+        # All objects are added to the necessary groups for updates and rendering
+        self.player_character, self.asteroid_field = gs.setup_game_objects(
+            self.updatable_group, self.drawable_group, self.asteroids_group, self.shots_group, entity_store, rng=rng, world=self.world,
+            particles=self.particles
+        )
+
+        # Optionally record the key presses of every step, so this game can be replayed headless later
+        self.replay = None
+        if c.REPLAY_RECORD_PATH is not None:
+            self.replay = rp.Replay(self.seed, c.FIXED_TIMESTEP, flags=rp.mode_flags(self.world, entity_store))
+            self.player_character.input_source = rp.RecordingInput(self.player_character.input_source, self.replay)
+
+        # Remove shots and asteroids once they leave the play area, keeping the sprite groups bounded
+        if self.world is None:
+            self.despawn_policy = lm.DespawnPolicy()
+        else:
+            self.despawn_policy = lm.DespawnPolicy(width=self.world.width, height=self.world.height)
+        self.stats = sm.GameStats()
+
+        # Draw objects by blitting cached, pre-rendered images (None draws every shape each frame)
+        self.sprite_cache = rm.SpriteCache() if c.USE_SPRITE_CACHE else None
+
+        # Optionally update only the screen areas that changed each frame (None fills and flips the whole screen)
+        # (a scrolling view changes the whole screen every frame, so it always redraws everything)
+        self.dirty_renderer = rm.DirtyRectRenderer() if use_dirty_rects else None
+
+        # Optionally simulate each frame on a worker thread while the previous one is drawn (None runs them in turn)
+        # The first frame drawn is a copy of the starting state (the pipeline draws in screen coordinates only)
+        self.pipeline = None
+        if c.PIPELINED_RENDERING and self.world is None:
+            self.pipeline = pl.RenderPipeline()
+            self.pipeline.front.capture(self.drawable_group, {}, 0.0)
+
+        # Time each part of the frame; press F3 in game to show the overlay
+        self.profiler = prof.FrameProfiler()
+
+        # The simulation always advances in fixed steps ('c.FIXED_TIMESTEP'), independent of the frame rate
+        # Real frame time is banked in 'step_clock' and spent one fixed step at a time
+        self.step_clock = lp.FixedStepClock()
+        # Positions before the latest step, used to draw objects part-way between steps
+        self.previous_positions = {}
+        # Number of fixed steps to simulate this frame (none before the first frame has been timed)
+        self.steps = 0
+
+        self.paused = False
+        self.stop_reason = None
+        self.stop_event = None # Created in run(), since it belongs to the running event loop
+        self.background_writes = set() # File writes started by control commands, awaited at shutdown
+        st.timer.mark("game objects")
+
+    def request_stop(self, reason):
+        """
+        Ask the game loop to finish after the current frame.
+
+        Args:
+            reason (str): Message printed when the game stops (only the first request counts)
+        """
+
+        if self.stop_reason is None:
+            self.stop_reason = reason
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    async def frame(self):
+        """
+        Run one frame: handle events, simulate the fixed steps that are due, render, and show the result.
+        """
+
+        profiler = self.profiler
+        profiler.begin_frame()
+
+        # 1. Handles events, specifically the player quitting the game
+        #    This ensures the player can interact with the game properly
+        #    (and lets F3 toggle the profiler overlay)
+        with profiler.section("events"):
+            if gs.handle_events(profiler):
+                self.request_stop("Window closed.")
+                return
+
+        if self.pipeline is not None:
+            self.pipelined_frame(profiler)
+            return
+
+        # 2. Update the game's logic and state, in as many fixed steps as real time calls for
+        #    Every step uses the same 'step_clock.step', so a slow frame means more steps, not a bigger one
+        #    Ends the game once an asteroid hits the player
+        if self.simulate(self.steps):
+            self.request_stop("Game over!")
+            return
+
+        # 3. Render all game objects on the screen
+        #    Drawable objects are blended between their last two simulated positions by 'step_clock.alpha'
+        #    With dirty rects, only areas sprites covered are redrawn (the whole screen while the overlay is shown)
+        #    In a scrolling world, the camera is centered on the player's blended position, so the ship doesn't jitter
+        with profiler.section("render"), lp.interpolated_positions(self.drawable_group, self.previous_positions, self.step_clock.alpha):
+            if self.dirty_renderer is not None:
+                dirty_rects = self.dirty_renderer.render(self.screen, self.drawable_group, self.sprite_cache, profiler.overlay_visible)
+            elif self.world is not None:
+                self.world.camera.follow(self.player_character.position)
+                gs.render_screen(self.screen, self.drawable_group, self.sprite_cache, self.world.camera, self.particles)
+            else:
+                gs.render_screen(self.screen, self.drawable_group, self.sprite_cache, particles=self.particles)
+        profiler.draw_overlay(self.screen)
+
+        # 4. Update the game's display with the most recent rendered frame
+        with profiler.section("flip"):
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.present(dirty_rects)
+            else:
+                pygame.display.flip()
+
+        # Store this frame's timings and group sizes
+        profiler.end_frame(gs.group_sizes(self.updatable_group, self.drawable_group, self.asteroids_group, self.shots_group))
+
+    def pipelined_frame(self, profiler):
+        """
+        Run the rest of a frame with the simulation on the worker thread and the drawing on this one.
+
+        The worker simulates this frame's steps and copies the result into the pipeline's back buffer,
+        while this thread draws the front buffer (the previous frame's copy) and flips the display.
+        The game objects are only ever touched by one thread at a time: the worker, until finish() returns.
+
+        Args:
+            profiler (FrameProfiler): Records the frame's section timings
+        """
+
+        # 2. Start simulating this frame's steps on the worker thread
+        self.pipeline.start(self.simulate_into, self.steps, self.step_clock.alpha)
+
+        # 3. Meanwhile, draw the previous frame from its copied state and show it
+        with profiler.section("render"):
+            self.pipeline.draw(self.screen, self.sprite_cache)
+        profiler.draw_overlay(self.screen)
+        with profiler.section("flip"):
+            pygame.display.flip()
+
+        # 4. Wait for the simulation, and draw its frame next time
+        with profiler.section("wait"):
+            game_over = self.pipeline.finish()
+        if game_over:
+            self.request_stop("Game over!")
+            return
+
+        profiler.end_frame(gs.group_sizes(self.updatable_group, self.drawable_group, self.asteroids_group, self.shots_group))
+
+    def simulate(self, steps):
+        """
+        Advance the game by a number of fixed steps.
+
+        Args:
+            steps (int): Number of fixed steps to run
+
+        Returns:
+            bool: True if an asteroid hit the player (the game is over)
+        """
+
+        for step in range(steps):
+            # Remember where everything was before the last step, for interpolated drawing
+            if step == steps - 1:
+                self.previous_positions = lp.snapshot_positions(self.drawable_group)
+
+            game_over = gs.update_game_state(
+                self.updatable_group, self.asteroids_group, self.shots_group, self.player_character,
+                self.step_clock.step, self.despawn_policy, self.stats, self.profiler
+            )
+            # Move the input source on to the next step (this is where a recording stores the step's keys)
+            self.player_character.input_source.advance()
+
+            # Move and age every particle at once (this also starts the next step's emission budget)
+            if self.particles is not None:
+                self.particles.update(self.step_clock.step)
+
+            if game_over:
+                return True
+
+        return False
+
+    def simulate_into(self, frame_state, steps, alpha):
+        """
+        Advance the game, then copy everything drawn into a pipeline buffer (runs on the worker thread).
+
+        Args:
+            frame_state (FrameState): The buffer to fill
+            steps (int): Number of fixed steps to run
+            alpha (float): Blend factor the frame should be drawn at
+
+        Returns:
+            bool: True if an asteroid hit the player (the game is over)
+        """
+
+        game_over = self.simulate(steps)
+        frame_state.capture(self.drawable_group, self.previous_positions, alpha)
+        return game_over
+
+    async def run(self):
+        """
+        Run frames until the game stops, with the background tasks alongside, then shut everything down.
+
+        Returns:
+            str: Why the game stopped
+        """
+
+        self.stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        # Ctrl+C and termination requests stop the game the same way closing the window does
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signal_number, self.request_stop, "Interrupted.")
+            except (NotImplementedError, RuntimeError):
+                pass # Not supported on this platform (e.g. Windows); Ctrl+C then raises KeyboardInterrupt
+
+        tasks = [asyncio.create_task(self.flush_periodically())]
+        if c.SNAPSHOT_PATH is not None:
+            tasks.append(asyncio.create_task(self.snapshot_periodically()))
+
+        server = None
+        if c.CONTROL_PORT is not None:
+            server = await asyncio.start_server(self.handle_control_client, c.CONTROL_HOST, c.CONTROL_PORT)
+
+        frame_period = 1 / c.FRAME_RATE
+        first_frame = True
+
+        try:
+            # --- GAME LOOP ---
+            while not self.stop_event.is_set():
+                frame_start = time.perf_counter()
+                await self.frame()
+
+                # Tell the spawn scheduler how long the frame's work took (used only with frame-time feedback on)
+                self.asteroid_field.scheduler.record_frame_time(time.perf_counter() - frame_start)
+
+                # Report how long startup took, up to the end of the first frame
+                if first_frame:
+                    first_frame = False
+                    st.timer.mark("first frame")
+                    if c.STARTUP_REPORT:
+                        print(st.timer.report())
+
+                # 5. Wait out the rest of the frame without blocking, so background tasks can run meanwhile,
+                #    then work out how many simulation steps the next frame needs
+                #    - 'clock.tick()' measures the real time since the last frame, in milliseconds
+                #    - 'step_clock.advance' caps catch-up at 'c.MAX_CATCHUP_STEPS' steps per frame
+                await asyncio.sleep(max(0.0, frame_period - (time.perf_counter() - frame_start)))
+                frame_time = self.clock.tick() / 1000
+                self.steps = 0 if self.paused else self.step_clock.advance(frame_time)
+
+        finally:
+            # --- SHUTDOWN ---
+            # Stop accepting commands, cancel the periodic tasks, and finish any writes still in progress
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, *self.background_writes, return_exceptions=True)
+
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(signal_number)
+                except (NotImplementedError, RuntimeError):
+                    pass
+
+            # Let the simulation thread finish, then write the final profile export and replay
+            if self.pipeline is not None:
+                self.pipeline.close()
+            self.flush()
+
+        return self.stop_reason
+
+    def flush(self):
+        """
+        Write the profile export and the replay recording (if enabled) right away.
+        """
+
+        if c.PROFILER_EXPORT_PATH is not None:
+            self.profiler.export(c.PROFILER_EXPORT_PATH)
+        if self.replay is not None:
+            self.replay.save(c.REPLAY_RECORD_PATH)
+
+    async def flush_periodically(self):
+        """
+        Background task: every 'c.BACKGROUND_FLUSH_INTERVAL' seconds, write the profile export and replay.
+
+        The data is copied on the game's thread, and the files are written on a worker thread.
+        """
+
+        while True:
+            await asyncio.sleep(c.BACKGROUND_FLUSH_INTERVAL)
+
+            if c.PROFILER_EXPORT_PATH is not None:
+                records = list(self.profiler.history)
+                await asyncio.to_thread(self.profiler.export, c.PROFILER_EXPORT_PATH, records)
+
+            if self.replay is not None:
+                await asyncio.to_thread(write_file, c.REPLAY_RECORD_PATH, self.replay.to_bytes())
+
+    async def snapshot_periodically(self):
+        """
+        Background task: every 'c.SNAPSHOT_INTERVAL' seconds, save a snapshot of the game to 'c.SNAPSHOT_PATH'.
+        """
+
+        while True:
+            await asyncio.sleep(c.SNAPSHOT_INTERVAL)
+            await self.write_snapshot(c.SNAPSHOT_PATH)
+
+    async def write_snapshot(self, path):
+        """
+        Capture the game between frames and write the snapshot on a worker thread.
+
+        Args:
+            path (str): File to write
+        """
+
+        snapshot = snap.Snapshot.capture(
+            self.player_character, self.asteroid_field, self.asteroids_group, self.shots_group, self.stats, self.world
+        )
+        await asyncio.to_thread(snapshot.save, path)
+
+    async def handle_control_client(self, reader, writer):
+        """
+        Serve one connection to the control socket.
+
+        Each line received is a command, and each gets one line of JSON back:
+        - 'stats': game counters, seed, pause state, the profiler summary, the spawn scheduler's state,
+          and (in a scrolling world) how many asteroids are awake, drowsy, and asleep
+        - 'spawns': the spawn scheduler's recent decisions, oldest first
+        - 'pause' / 'resume': stop or restart the simulation (frames keep drawing)
+        - 'overlay': show or hide the profiler overlay
+        - 'snapshot PATH': save a snapshot of the game to PATH
+        - 'quit': stop the game and shut down cleanly
+
+        Args:
+            reader (asyncio.StreamReader): Incoming data from the client
+            writer (asyncio.StreamWriter): Outgoing data to the client
+        """
+
+        try:
+            while not self.stop_event.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+
+                reply = self.run_command(line.decode(errors="replace").strip())
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass # The client went away mid-command
+        finally:
+            writer.close()
+
+    def run_command(self, command_line):
+        """
+        Carry out one control command.
+
+        Args:
+            command_line (str): The command and its arguments, separated by spaces
+
+        Returns:
+            dict: The reply to send back
+        """
+
+        command, _, argument = command_line.partition(" ")
+
+        if command == "stats":
+            return {
+                "seed": self.seed,
+                "paused": self.paused,
+                "game": self.stats.as_dict(),
+                "profile": self.profiler.summary(list(self.profiler.history)),
+                "spawner": self.asteroid_field.scheduler.as_dict(),
+                "world": self.world.counts() if self.world is not None else None,
+                "particles": self.particles.stats() if self.particles is not None else None,
+            }
+        if command == "spawns":
+            return {"decisions": [decision._asdict() for decision in self.asteroid_field.scheduler.history]}
+        if command == "pause":
+            self.paused = True
+            return {"ok": True, "paused": True}
+        if command == "resume":
+            self.paused = False
+            return {"ok": True, "paused": False}
+        if command == "overlay":
+            self.profiler.toggle_overlay()
+            return {"ok": True, "overlay": self.profiler.overlay_visible}
+        if command == "snapshot":
+            if not argument:
+                return {"error": "usage: snapshot PATH"}
+            # Started as a task so the reply doesn't wait for the disk
+            write = asyncio.create_task(self.write_snapshot(argument))
+            self.background_writes.add(write)
+            write.add_done_callback(self.background_writes.discard)
+            return {"ok": True, "path": argument}
+        if command == "quit":
+            self.request_stop("Quit by control command.")
+            return {"ok": True}
+
+        return {"error": f"unknown command: {command!r}"}
+
+
+def write_file(path, data):
+    """
+    Write bytes to a file (used from worker threads).
+
+    Args:
+        path (str): File to write
+        data (bytes): The file contents
+    """
+
+    with open(path, "wb") as file:
+        file.write(data)
@@ -0,0 +1,286 @@
+# snapshot_module.py:
+# This module handles capturing and restoring the complete state of a game.
+# A snapshot is one flat binary buffer: a fixed-size header (player, asteroid field, stats, and random
+# number state) followed by packed arrays of asteroids and shots, plus, in a scrolling world, the asteroids
+# waiting in its chunks. Nothing is pickled, so a snapshot can be saved to disk and read back through a
+# memory map without copying the object arrays.
+
+# Standard Library Imports
+import math # Used to store a missing gauss_next value as NaN
+import mmap # Used to read saved snapshots without loading them into memory first
+import struct # Used to pack the fixed-size header
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import player_module as p # Player-related classes and functionality
+
+
+# File signature and format version written at the start of every snapshot
+SNAPSHOT_MAGIC = b"ASNP"
+SNAPSHOT_VERSION = 3
+
+# Header layout, all little-endian:
+# magic, version (u16), asteroid count (u32), shot count (u32),
+# player x, y, velocity x, y, radius, rotation, shot timer (7 x f64),
+# asteroid field spawn timer, spawn scheduler elapsed time (2 x f64),
+# stats frames, asteroids destroyed, peak asteroids, peak shots, peak entities (5 x u32),
+# random state version (i32), Mersenne Twister state (625 x u32), gauss_next (f64, NaN when unset),
+# scrolling world flag (bool), awake chunk range (4 x i32), dormant asteroid count (u32), world tick (u32),
+# world woken, slept, culled, and culled shots counters (4 x u32); the world fields are zero without a world
+HEADER_FORMAT = "<4sHII7d2d5Ii625Id?4iII4I"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Per-object record layouts for the packed arrays that follow the header
+ASTEROID_DTYPE = np.dtype([("position", "<f8", 2), ("velocity", "<f8", 2), ("radius", "<f8")])
+SHOT_DTYPE = np.dtype([("position", "<f8", 2), ("velocity", "<f8", 2), ("radius", "<f8"), ("age", "<f8")])
+
+
+class Snapshot:
+    """
+    The complete state of one game, held in a single binary buffer.
+
+    The asteroid and shot arrays are views into the buffer, so loading a memory-mapped
+    snapshot only reads the records that are actually used.
+
+    Attributes:
+        buffer: The encoded snapshot (bytes, bytearray, or a memory map)
+        asteroid_count (int): Number of asteroids in the snapshot
+        shot_count (int): Number of shots in the snapshot
+        asteroids (numpy.ndarray): ASTEROID_DTYPE records, in asteroid group order
+        shots (numpy.ndarray): SHOT_DTYPE records, in shot group order
+        has_world (bool): Whether the game was played in a scrolling world
+        dormant_count (int): Number of drowsy and sleeping asteroids in the world's chunks
+        dormant (numpy.ndarray): ASTEROID_DTYPE records of the world's chunk lists, chunk by chunk
+    """
+
+    def __init__(self, buffer):
+        """
+        Wrap an encoded snapshot.
+
+        Args:
+            buffer: Bytes-like object holding a snapshot made by capture()
+
+        Raises:
+            ValueError: If the buffer is not a snapshot, or its version or length is wrong
+        """
+
+        if len(buffer) < HEADER_SIZE:
+            raise ValueError("Snapshot data is too short")
+
+        self.buffer = buffer
+        self.header = struct.unpack_from(HEADER_FORMAT, buffer)
+
+        magic, version, self.asteroid_count, self.shot_count = self.header[:4]
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a snapshot")
+        # Version 2 snapshots left out the asteroids sleeping in a scrolling world
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        self.has_world = self.header[645]
+        self.dormant_count = self.header[650]
+
+        expected_size = (HEADER_SIZE + (self.asteroid_count + self.dormant_count) * ASTEROID_DTYPE.itemsize
+                         + self.shot_count * SHOT_DTYPE.itemsize)
+        if len(buffer) != expected_size:
+            raise ValueError(f"Snapshot is {len(buffer)} bytes, expected {expected_size}")
+
+        # Zero-copy views of the object records
+        self.asteroids = np.frombuffer(buffer, ASTEROID_DTYPE, self.asteroid_count, HEADER_SIZE)
+        self.shots = np.frombuffer(buffer, SHOT_DTYPE, self.shot_count, HEADER_SIZE + self.asteroids.nbytes)
+        self.dormant = np.frombuffer(buffer, ASTEROID_DTYPE, self.dormant_count, HEADER_SIZE + self.asteroids.nbytes + self.shots.nbytes)
+
+    @classmethod
+    def capture(cls, player_character, asteroid_field, asteroids_group, shots_group, stats=None, world=None):
+        """
+        Record the current state of a game.
+
+        The random number state is taken from the asteroid field, which shares its source with every asteroid.
+        In a scrolling world, the asteroids waiting in its chunks are recorded too, so the whole world is captured.
+
+        Args:
+            player_character (Player): The player's ship object
+            asteroid_field (AsteroidField): Manager object that handles asteroid spawning
+            asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+            shots_group (pygame.sprite.Group): Group of all player shot objects
+            stats (GameStats): Optional game counters to include (zeros are stored if None)
+            world (World): The game's scrolling world (None for a one-screen game)
+
+        Returns:
+            Snapshot: The captured state
+        """
+
+        asteroids = np.array(
+            [(tuple(asteroid.position), tuple(asteroid.velocity), asteroid.radius) for asteroid in asteroids_group],
+            dtype=ASTEROID_DTYPE,
+        )
+        shots = np.array(
+            [(tuple(shot.position), tuple(shot.velocity), shot.radius, shot.age) for shot in shots_group],
+            dtype=SHOT_DTYPE,
+        )
+
+        counters = (0, 0, 0, 0, 0)
+        if stats is not None:
+            counters = (stats.frames, stats.asteroids_destroyed, stats.peak_asteroids, stats.peak_shots, stats.peak_entities)
+
+        rng_version, rng_words, gauss_next = asteroid_field.rng.getstate()
+
+        # Drowsy and sleeping asteroids, chunk by chunk, so restore() rebuilds every chunk list in the same order
+        dormant = np.zeros(0, dtype=ASTEROID_DTYPE)
+        world_state = (False, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        if world is not None:
+            dormant = np.array(
+                [(tuple(asteroid.position), tuple(asteroid.velocity), asteroid.radius)
+                 for asteroids in world.chunks.values() for asteroid in asteroids],
+                dtype=ASTEROID_DTYPE,
+            )
+            world_state = (True, *world.chunk_range, len(dormant), world.tick,
+                           world.woken, world.slept, world.culled, world.culled_shots)
+
+        header = struct.pack(
+            HEADER_FORMAT,
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(asteroids), len(shots),
+            *player_character.position, *player_character.velocity, player_character.radius,
+            player_character.rotation, player_character.shot_timer,
+            asteroid_field.spawn_timer, asteroid_field.scheduler.elapsed,
+            *counters,
+            rng_version, *rng_words, math.nan if gauss_next is None else gauss_next,
+            *world_state,
+        )
+
+        return cls(header + asteroids.tobytes() + shots.tobytes() + dormant.tobytes())
+
+    def restore(self, player_character, asteroid_field, asteroids_group, shots_group, stats=None, world=None):
+        """
+        Put a game back into the captured state.
+
+        Every current asteroid and shot is removed, and the captured ones are recreated in their
+        original group order, so the game continues exactly as it did after the capture.
+        In a scrolling world, the chunk lists are emptied and rebuilt from the captured ones as well.
+
+        Args:
+            player_character (Player): The player's ship object
+            asteroid_field (AsteroidField): Manager object that handles asteroid spawning
+            asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+            shots_group (pygame.sprite.Group): Group of all player shot objects
+            stats (GameStats): Optional game counters to restore
+            world (World): The game's scrolling world (None for a one-screen game)
+
+        Raises:
+            ValueError: If the snapshot was taken in a scrolling world and the game has none, or the other way round
+        """
+
+        if self.has_world != (world is not None):
+            raise ValueError("Snapshot was taken in a scrolling world, but this game has none" if self.has_world
+                             else "Snapshot was taken without a scrolling world, but this game has one")
+
+        (player_x, player_y, player_vx, player_vy, player_radius, rotation, shot_timer,
+         spawn_timer, spawn_elapsed) = self.header[4:13]
+        counters = self.header[13:18]
+        rng_version = self.header[18]
+        rng_words = self.header[19:644]
+        gauss_next = self.header[644]
+
+        # Player and asteroid field
+        player_character.position = pygame.Vector2(player_x, player_y)
+        player_character.velocity = pygame.Vector2(player_vx, player_vy)
+        player_character.radius = player_radius
+        player_character.rotation = rotation
+        player_character.shot_timer = shot_timer
+        asteroid_field.spawn_timer = spawn_timer
+        asteroid_field.scheduler.elapsed = spawn_elapsed # Puts the difficulty curve back where it was
+        asteroid_field.rng.setstate((rng_version, rng_words, None if math.isnan(gauss_next) else gauss_next))
+
+        if stats is not None:
+            (stats.frames, stats.asteroids_destroyed, stats.peak_asteroids,
+             stats.peak_shots, stats.peak_entities) = counters
+
+        # Clear out the current objects; with pools, they are immediately available to rebuild the snapshot
+        for sprite in asteroids_group.sprites() + shots_group.sprites():
+            sprite.kill()
+        for cls in (a.Asteroid, p.Shot):
+            if cls.pool is not None:
+                cls.pool.recycle()
+
+        # tolist() turns each column into plain Python floats in one pass
+        asteroids = self.asteroids
+        for (x, y), velocity, radius in zip(asteroids["position"].tolist(), asteroids["velocity"].tolist(), asteroids["radius"].tolist()):
+            asteroid = a.Asteroid.create(x, y, radius)
+            asteroid.velocity = pygame.Vector2(velocity)
+
+        shots = self.shots
+        for (x, y), velocity, radius, age in zip(shots["position"].tolist(), shots["velocity"].tolist(), shots["radius"].tolist(), shots["age"].tolist()):
+            shot = p.Shot.create(x, y, radius)
+            shot.velocity = pygame.Vector2(velocity)
+            shot.age = age
+            shots_group.add(shot)
+
+        if world is not None:
+            self.restore_world(world)
+
+    def restore_world(self, world):
+        """
+        Replace a scrolling world's chunk lists, awake area, and counters with the captured ones.
+
+        Args:
+            world (World): The game's scrolling world
+        """
+
+        chunk_range = self.header[646:650]
+        world_tick, woken, slept, culled, culled_shots = self.header[651:656]
+
+        # The old dormant asteroids are outside every group and pool, so dropping the lists discards them
+        world.chunks.clear()
+        world.dormant = 0
+        # Every chunk counts as newly awake, but their lists are empty, so nothing is woken
+        world.awake_keys = frozenset()
+        world.set_chunk_range(tuple(chunk_range))
+
+        dormant = self.dormant
+        for (x, y), velocity, radius in zip(dormant["position"].tolist(), dormant["velocity"].tolist(), dormant["radius"].tolist()):
+            asteroid = a.Asteroid.create(x, y, radius)
+            asteroid.velocity = pygame.Vector2(velocity)
+            world.put_to_sleep(asteroid, world.chunk_of(asteroid.position))
+
+        world.tick = world_tick
+        world.woken, world.slept, world.culled, world.culled_shots = woken, slept, culled, culled_shots
+
+    def to_bytes(self):
+        """
+        Return the encoded snapshot.
+
+        Returns:
+            bytes: Header followed by the packed asteroid, shot, and dormant asteroid records
+        """
+
+        return bytes(self.buffer)
+
+    def save(self, path):
+        """
+        Write the snapshot to a file.
+
+        Args:
+            path (str): File to write
+        """
+
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(self.buffer)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Open a snapshot file written by save() through a read-only memory map.
+
+        Args:
+            path (str): File to read
+
+        Returns:
+            Snapshot: The snapshot, backed by the mapped file
+        """
+
+        with open(path, "rb") as snapshot_file:
+            # The map stays valid after the file is closed
+            return cls(mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ))
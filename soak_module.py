@@ -0,0 +1,338 @@
+# soak_module.py:
+# This module runs the game for a long stretch of simulated time to catch slow degradation:
+# memory that keeps growing, groups that keep filling up, or frames that keep getting slower.
+# Headless games are played back to back with seeded, scripted key presses (a new game starts
+# whenever the player is hit). At regular intervals the harness records Python's traced memory
+# (tracemalloc), the size of every sprite group, and the step times since the last sample. Once
+# the warm-up is over, the first sample becomes the baseline; if memory grows, or the median step
+# time drifts, beyond the configured limits, the test fails and shows which allocation sites grew.
+# Run directly: python soak_module.py --minutes 30
+
+# Standard Library Imports
+import argparse # Used to read command-line options when run directly
+import collections # namedtuple describes one sample
+import gc # Garbage is collected before each memory reading, so only live objects are counted
+import random # Seeds each game and its scripted key presses
+import sys # Used to return a failing exit code
+import time # perf_counter times every step
+import traceback # Errors during the soak are reported with their full traceback
+import tracemalloc # Tracks memory allocated by Python code, and where
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import startup_module as st # Lazy imports and startup timing
+import game_systems as gs # Game running functionality
+import headless_module as hm # Windowless, fixed-timestep game simulation
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import profiler_module as prof # Percentiles of the step times
+
+# Only needed for a soak in the scrolling world, so it is loaded on first use
+wd = st.lazy_import("world_module") # Scrolling world with chunked asteroids and a following camera
+
+
+# One sample of a soak test:
+# - time: simulated seconds since the soak started
+# - frames: steps simulated so far, over every game
+# - games: games started so far
+# - memory: bytes of Python memory in use (traced by tracemalloc, after a garbage collection)
+# - frame_time_p50, frame_time_p95: median and 95th percentile step time since the last sample, in seconds
+# - groups: sizes of the current game's sprite groups (see game_systems.group_sizes)
+SoakSample = collections.namedtuple("SoakSample", "time frames games memory frame_time_p50 frame_time_p95 groups")
+
+
+def scripted_masks(rng, length):
+    """
+    Make a script of random key presses that changes every quarter to one and a half seconds.
+
+    Args:
+        rng (random.Random): Source of the key choices
+        length (int): Number of steps in the script
+
+    Returns:
+        list: One input_module.to_bitmask value per step
+    """
+
+    masks = []
+    while len(masks) < length:
+        mask = rng.randrange(1 << len(inp.ACTION_KEYS))
+        masks.extend([mask] * rng.randint(c.SIMULATION_RATE // 4, c.SIMULATION_RATE * 3 // 2))
+    return masks[:length]
+
+
+class SoakTest:
+    """
+    Plays headless games back to back for a long time, sampling memory, group sizes, and step times.
+
+    Attributes:
+        duration (float): Simulated seconds to run
+        sample_interval (float): Simulated seconds between samples
+        warmup (float): Simulated seconds before the baseline sample is taken
+        memory_limit (int): Bytes traced memory may grow above the baseline before the test fails
+        drift_limit (float): Largest allowed ratio of a sample's median step time to the baseline's
+        use_world (bool): If True, games are played in a scrolling world
+        rng (random.Random): Seeds every game and script, so a soak can be repeated exactly
+        samples (list): Every SoakSample taken, oldest first
+        baseline (SoakSample): The first sample after the warm-up (None until then)
+        failures (list): Reasons the test failed (empty while it passes)
+        games (int): Number of games started
+        frames (int): Number of steps simulated, over every game
+    """
+
+    def __init__(self, duration=c.SOAK_DURATION, sample_interval=c.SOAK_SAMPLE_INTERVAL, warmup=c.SOAK_WARMUP,
+                 memory_limit=c.SOAK_MEMORY_GROWTH_LIMIT, drift_limit=c.SOAK_FRAME_TIME_DRIFT_LIMIT, seed=0, use_world=False):
+        """
+        Initialize a soak test (nothing runs until run() is called).
+
+        Args:
+            duration (float): Simulated seconds to run
+            sample_interval (float): Simulated seconds between samples
+            warmup (float): Simulated seconds before the baseline sample is taken
+            memory_limit (int): Bytes traced memory may grow above the baseline before the test fails
+            drift_limit (float): Largest allowed ratio of a sample's median step time to the baseline's
+            seed (int): Seed for every game and script
+            use_world (bool): If True, games are played in a scrolling world
+        """
+
+        self.duration = duration
+        self.sample_interval = sample_interval
+        self.warmup = warmup
+        self.memory_limit = memory_limit
+        self.drift_limit = drift_limit
+        self.use_world = use_world
+        self.rng = random.Random(seed)
+
+        self.samples = []
+        self.baseline = None
+        self.baseline_snapshot = None # tracemalloc snapshot taken with the baseline sample
+        self.latest_snapshot = None # tracemalloc snapshot taken with the latest sample
+        self.failures = []
+        self.games = 0
+        self.frames = 0
+        self.simulation = None
+
+    def new_game(self):
+        """
+        Start a fresh headless game with its own seed and key-press script.
+
+        Returns:
+            HeadlessSimulation: The new game
+        """
+
+        self.games += 1
+        script = inp.ScriptedInput.from_bitmasks(scripted_masks(self.rng, c.SIMULATION_RATE * 60), loop=True)
+        world = wd.World() if self.use_world else None
+        return hm.HeadlessSimulation(input_source=script, dt=c.FIXED_TIMESTEP, seed=self.rng.getrandbits(32), world=world)
+
+    def take_sample(self, simulated_time, frame_times):
+        """
+        Record memory, group sizes, and step times, and keep a tracemalloc snapshot for later comparison.
+
+        Args:
+            simulated_time (float): Simulated seconds since the soak started
+            frame_times (list): Seconds each step took since the last sample
+
+        Returns:
+            SoakSample: The new sample
+        """
+
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+        self.latest_snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+
+        simulation = self.simulation
+        sample = SoakSample(
+            simulated_time, self.frames, self.games, memory,
+            prof.percentile(frame_times, 50), prof.percentile(frame_times, 95),
+            gs.group_sizes(simulation.updatable_group, simulation.drawable_group, simulation.asteroids_group, simulation.shots_group),
+        )
+        self.samples.append(sample)
+        return sample
+
+    def check(self, sample):
+        """
+        Compare a sample with the baseline, recording a failure for each limit it breaks.
+
+        Args:
+            sample (SoakSample): A sample taken after the baseline
+
+        Returns:
+            bool: True if the sample is within every limit
+        """
+
+        failures = []
+
+        growth = sample.memory - self.baseline.memory
+        if growth > self.memory_limit:
+            failures.append(
+                f"memory grew {format_bytes(growth)} above the baseline by {format_time(sample.time)} "
+                f"(limit {format_bytes(self.memory_limit)})"
+            )
+
+        if self.baseline.frame_time_p50 > 0:
+            drift = sample.frame_time_p50 / self.baseline.frame_time_p50
+            if drift > self.drift_limit:
+                failures.append(
+                    f"median step time drifted to {drift:.2f}x the baseline by {format_time(sample.time)} "
+                    f"(limit {self.drift_limit:.2f}x)"
+                )
+
+        self.failures.extend(failures)
+        return not failures
+
+    def allocation_diff(self, top=c.SOAK_TOP_ALLOCATIONS):
+        """
+        Describe the allocation sites whose memory grew the most between the baseline and the latest sample.
+
+        Args:
+            top (int): Number of sites to list
+
+        Returns:
+            list: One line per site, largest growth first
+        """
+
+        if self.baseline_snapshot is None or self.latest_snapshot is None:
+            return []
+
+        differences = self.latest_snapshot.compare_to(self.baseline_snapshot, "lineno")
+        return [str(difference) for difference in differences[:top]]
+
+    def run(self, report=print):
+        """
+        Play games until the duration is reached or a limit is broken.
+
+        Args:
+            report (callable): Called with each line of progress (print by default; None stays quiet)
+
+        Returns:
+            bool: True if the soak passed
+        """
+
+        report = report or (lambda line: None)
+        steps_per_sample = max(1, round(self.sample_interval / c.FIXED_TIMESTEP))
+        total_steps = round(self.duration / c.FIXED_TIMESTEP)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(c.SOAK_TRACE_DEPTH)
+
+        try:
+            self.simulation = self.new_game()
+            frame_times = []
+
+            while self.frames < total_steps:
+                step_start = time.perf_counter()
+                game_over = self.simulation.step()
+                frame_times.append(time.perf_counter() - step_start)
+                self.frames += 1
+
+                # A hit ends the game, as it would for a player; the next game starts right away
+                if game_over:
+                    self.simulation = self.new_game()
+
+                if self.frames % steps_per_sample and self.frames < total_steps:
+                    continue
+
+                sample = self.take_sample(self.frames * c.FIXED_TIMESTEP, frame_times)
+                frame_times = []
+                report(format_sample(sample, self.baseline))
+
+                if self.baseline is None:
+                    # Pools, caches, and lazily loaded modules fill up during the warm-up, so it is never judged
+                    if sample.time >= self.warmup:
+                        self.baseline = sample
+                        self.baseline_snapshot = self.latest_snapshot
+                        report("  (baseline)")
+                elif not self.check(sample):
+                    break
+
+        except Exception:
+            self.failures.append("the game raised an exception:\n" + traceback.format_exc())
+
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        if self.baseline is None and not self.failures:
+            self.failures.append(f"the soak ended before the {format_time(self.warmup)} warm-up, so nothing was compared")
+
+        if self.failures:
+            report("FAILED:")
+            for failure in self.failures:
+                report(f"  {failure}")
+            diff = self.allocation_diff()
+            if diff:
+                report("Allocation sites that grew the most since the baseline:")
+                for line in diff:
+                    report(f"  {line}")
+            return False
+
+        report(f"PASSED: {self.games} games, {self.frames} steps, {format_time(self.frames * c.FIXED_TIMESTEP)} simulated")
+        return True
+
+
+def format_bytes(size):
+    """Format a byte count in KiB or MiB."""
+
+    if abs(size) >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MiB"
+    return f"{size / 1024:.1f} KiB"
+
+
+def format_time(seconds):
+    """Format simulated seconds as hours, minutes, and seconds."""
+
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}"
+
+
+def format_sample(sample, baseline=None):
+    """
+    Describe a sample on one line, with memory growth once there is a baseline.
+
+    Args:
+        sample (SoakSample): The sample
+        baseline (SoakSample): The baseline to compare memory with (None before the warm-up ends)
+
+    Returns:
+        str: The description
+    """
+
+    memory = format_bytes(sample.memory)
+    if baseline is not None:
+        memory += f" ({'+' if sample.memory >= baseline.memory else '-'}{format_bytes(abs(sample.memory - baseline.memory))})"
+    groups = " ".join(f"{name}={size}" for name, size in sample.groups.items())
+
+    return (
+        f"{format_time(sample.time)}  games={sample.games}  memory={memory}  "
+        f"step p50={sample.frame_time_p50 * 1000:.3f}ms p95={sample.frame_time_p95 * 1000:.3f}ms  {groups}"
+    )
+
+
+def main():
+    """
+    Run a soak test from the command line, exiting with an error code if it fails.
+    """
+
+    parser = argparse.ArgumentParser(description="Play the game headless for a long time and check for memory growth and slowdowns.")
+    parser.add_argument("--minutes", type=float, default=c.SOAK_DURATION / 60, help="simulated minutes to run")
+    parser.add_argument("--interval", type=float, default=c.SOAK_SAMPLE_INTERVAL, help="simulated seconds between samples")
+    parser.add_argument("--warmup", type=float, default=c.SOAK_WARMUP, help="simulated seconds before the baseline sample")
+    parser.add_argument("--memory-limit", type=float, default=c.SOAK_MEMORY_GROWTH_LIMIT / (1024 * 1024), help="MiB memory may grow above the baseline")
+    parser.add_argument("--drift-limit", type=float, default=c.SOAK_FRAME_TIME_DRIFT_LIMIT, help="largest ratio of median step time to the baseline")
+    parser.add_argument("--seed", type=int, default=0, help="seed for every game and script")
+    parser.add_argument("--world", action="store_true", help="play in the scrolling world")
+    args = parser.parse_args()
+
+    soak = SoakTest(
+        duration=args.minutes * 60, sample_interval=args.interval, warmup=args.warmup,
+        memory_limit=int(args.memory_limit * 1024 * 1024), drift_limit=args.drift_limit, seed=args.seed, use_world=args.world,
+    )
+    sys.exit(0 if soak.run() else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# spawn_module.py:
+# This module handles deciding when, and how big, new asteroids should spawn.
+# The time between spawns follows a difficulty curve over the length of a game, and spawning is held
+# back as the number of live objects approaches an entity budget: close to the budget only smaller
+# asteroids spawn (they split into fewer pieces), and at the budget spawns are skipped entirely.
+# Optionally, slow frames stretch the time between spawns, so a struggling machine gets fewer new
+# objects instead of a death spiral of ever more work. Every decision is kept for inspection.
+
+# Standard Library Imports
+import collections # deque keeps a bounded history of recent decisions; namedtuple describes one decision
+import math # Used for the exponential difficulty curve
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+# One spawn decision:
+# - time: seconds into the game when it was made
+# - interval: seconds between spawns at that moment (after any frame-time throttling)
+# - entity_count: live objects when it was made
+# - max_kind: largest asteroid size allowed (0 means the spawn was skipped)
+# - throttle: frame-time multiplier applied to the interval (1.0 means no throttling)
+SpawnDecision = collections.namedtuple("SpawnDecision", "time interval entity_count max_kind throttle")
+
+
+def curve_progress(curve, elapsed, ramp_time):
+    """
+    How far a difficulty curve has moved from the starting spawn interval towards the fastest one.
+
+    Args:
+        curve (str or callable): "constant", "linear", "exponential", or a function taking
+                                 seconds elapsed and returning progress from 0.0 to 1.0
+        elapsed (float): Seconds since the game started
+        ramp_time (float): Seconds a "linear" curve takes to reach the fastest interval
+                           (an "exponential" curve covers about 63% of the way in this time)
+
+    Returns:
+        float: 0.0 at the starting interval, 1.0 at the fastest interval
+
+    Raises:
+        ValueError: If 'curve' is not a known curve name or a function
+    """
+
+    if callable(curve):
+        return min(max(curve(elapsed), 0.0), 1.0)
+    if curve == "constant":
+        return 0.0
+    if curve == "linear":
+        return min(elapsed / ramp_time, 1.0)
+    if curve == "exponential":
+        return 1.0 - math.exp(-elapsed / ramp_time)
+
+    raise ValueError(f"Unknown difficulty curve {curve!r}")
+
+
+def descendants(kind):
+    """
+    Number of objects one asteroid of the given size can turn into, counting itself and every split.
+
+    Args:
+        kind (int): Asteroid size, from 1 (smallest) to 'c.ASTEROID_KINDS'
+
+    Returns:
+        int: 1 for the smallest size, 3 for the next, 7 for the next, and so on
+    """
+
+    return (1 << kind) - 1
+
+
+class SpawnScheduler:
+    """
+    Decides the spawn interval and the largest asteroid size allowed for each spawn.
+
+    The scheduler only uses game time and entity counts, so with frame-time feedback off a game still
+    plays out the same way every time from its seed (replays and snapshots stay exact).
+
+    Attributes:
+        entity_budget (int or None): Most live objects spawning is allowed to lead to (None means no limit)
+        curve (str or callable): Difficulty curve for the spawn interval (see curve_progress)
+        base_interval (float): Seconds between spawns at the start of a game
+        min_interval (float): Seconds between spawns once the curve is complete
+        ramp_time (float): Seconds the difficulty curve takes to ramp up
+        frame_time_budget (float or None): Frame work time, in seconds, above which spawning slows down
+                                           (None turns frame-time feedback off)
+        max_throttle (float): Largest multiplier slow frames can apply to the spawn interval
+        elapsed (float): Seconds of game time seen so far
+        throttle (float): Current frame-time multiplier on the spawn interval
+        average_frame_time (float or None): Smoothed frame work time, in seconds (None until the first report)
+        spawned (int): Number of spawns allowed
+        reduced (int): Number of spawns limited to smaller sizes because the budget was close
+        skipped (int): Number of spawns skipped because the budget was reached
+        history (collections.deque): The most recent SpawnDecision records, oldest first
+    """
+
+    def __init__(self, entity_budget=c.SPAWN_ENTITY_BUDGET, curve=c.SPAWN_DIFFICULTY_CURVE,
+                 base_interval=c.ASTEROID_SPAWN_RATE, min_interval=c.SPAWN_MIN_INTERVAL, ramp_time=c.SPAWN_RAMP_TIME,
+                 frame_time_budget=c.SPAWN_FRAME_TIME_BUDGET if c.SPAWN_FRAME_FEEDBACK else None,
+                 max_throttle=c.SPAWN_MAX_THROTTLE, history_length=c.SPAWN_HISTORY):
+        """
+        Initialize a scheduler at the start of a game.
+
+        Args:
+            entity_budget (int or None): Most live objects spawning is allowed to lead to (None means no limit)
+            curve (str or callable): Difficulty curve for the spawn interval
+            base_interval (float): Seconds between spawns at the start of a game
+            min_interval (float): Seconds between spawns once the curve is complete
+            ramp_time (float): Seconds the difficulty curve takes to ramp up
+            frame_time_budget (float or None): Frame work time, in seconds, above which spawning slows down
+                                               (None turns frame-time feedback off)
+            max_throttle (float): Largest multiplier slow frames can apply to the spawn interval
+            history_length (int): Number of recent decisions kept in 'history'
+        """
+
+        # Fail early on a misspelled curve name rather than at the first spawn
+        curve_progress(curve, 0.0, ramp_time)
+
+        self.entity_budget = entity_budget
+        self.curve = curve
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.ramp_time = ramp_time
+        self.frame_time_budget = frame_time_budget
+        self.max_throttle = max_throttle
+
+        self.elapsed = 0.0
+        self.throttle = 1.0
+        self.average_frame_time = None
+
+        # Counters and recent decisions, for inspection
+        self.spawned = 0
+        self.reduced = 0
+        self.skipped = 0
+        self.history = collections.deque(maxlen=history_length)
+
+    def advance(self, dt):
+        """
+        Move the difficulty curve forward by one step of game time.
+
+        Args:
+            dt (float): Seconds simulated this step
+        """
+
+        self.elapsed += dt
+
+    def interval(self):
+        """
+        Seconds between spawns right now, following the difficulty curve and any frame-time throttling.
+
+        Returns:
+            float: The current spawn interval
+        """
+
+        progress = curve_progress(self.curve, self.elapsed, self.ramp_time)
+        return (self.base_interval + (self.min_interval - self.base_interval) * progress) * self.throttle
+
+    def record_frame_time(self, seconds):
+        """
+        Report how long a frame's work took, so slow frames can slow spawning down.
+
+        Does nothing while frame-time feedback is off. The throttle follows a smoothed average,
+        so a single slow frame (e.g. a hiccup while loading) barely changes it.
+
+        Args:
+            seconds (float): Time the frame spent simulating and drawing (not waiting), in seconds
+        """
+
+        if self.frame_time_budget is None:
+            return
+
+        if self.average_frame_time is None:
+            self.average_frame_time = seconds
+        else:
+            self.average_frame_time += (seconds - self.average_frame_time) * c.SPAWN_FRAME_TIME_SMOOTHING
+
+        self.throttle = min(max(self.average_frame_time / self.frame_time_budget, 1.0), self.max_throttle)
+
+    def decide(self, entity_count):
+        """
+        Decide whether the spawn that is due goes ahead, and how big the asteroid may be.
+
+        Each asteroid size can split into a known number of pieces (see descendants), so the largest
+        size allowed is the biggest whose pieces still fit in the room left in the budget.
+
+        Args:
+            entity_count (int): Number of live objects
+
+        Returns:
+            int: Largest asteroid size allowed, from 1 to 'c.ASTEROID_KINDS' (0 means skip this spawn)
+        """
+
+        max_kind = c.ASTEROID_KINDS
+        if self.entity_budget is not None:
+            headroom = self.entity_budget - entity_count
+            while max_kind > 0 and descendants(max_kind) > headroom:
+                max_kind -= 1
+
+        if max_kind == 0:
+            self.skipped += 1
+        else:
+            self.spawned += 1
+            if max_kind < c.ASTEROID_KINDS:
+                self.reduced += 1
+
+        self.history.append(SpawnDecision(self.elapsed, self.interval(), entity_count, max_kind, self.throttle))
+        return max_kind
+
+    def as_dict(self):
+        """
+        Return the scheduler's current state and counters as a plain dictionary.
+
+        Returns:
+            dict: Settings, current interval and throttle, counters, and the latest decision
+        """
+
+        return {
+            "curve": self.curve if isinstance(self.curve, str) else getattr(self.curve, "__name__", "custom"),
+            "entity_budget": self.entity_budget,
+            "elapsed": self.elapsed,
+            "interval": self.interval(),
+            "throttle": self.throttle,
+            "average_frame_time": self.average_frame_time,
+            "spawned": self.spawned,
+            "reduced": self.reduced,
+            "skipped": self.skipped,
+            "last_decision": self.history[-1]._asdict() if self.history else None,
+        }
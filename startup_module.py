@@ -0,0 +1,94 @@
+# startup_module.py:
+# This module handles making the game start quickly and measuring how quickly it starts.
+# Modules that are only needed for optional features can be imported lazily (loaded on first use),
+# and a startup timer records how long each phase of startup took for an optional report.
+
+# Standard Library Imports
+import importlib # Used for ordinary imports when fast startup is off
+import importlib.util # Used to build lazily loaded modules
+import sys # Used to register lazily loaded modules so later imports share them
+import time # Used to time each startup phase
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+
+
+class StartupTimer:
+    """
+    Records how long each phase of startup took.
+
+    Attributes:
+        start (float): perf_counter() time the timer was created (when this module was first imported)
+        phases (list): (name, seconds since the previous mark) pairs, in order
+    """
+
+    def __init__(self):
+        """
+        Start timing from now.
+        """
+
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, name):
+        """
+        End the current phase and give it a name.
+
+        Args:
+            name (str): Name of the phase that just finished
+        """
+
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def report(self):
+        """
+        Describe every phase and the total, one line each.
+
+        Returns:
+            str: The startup timing report
+        """
+
+        lines = ["Startup timing:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<20} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'total':<20} {(self.last - self.start) * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Shared timer, started as soon as anything imports this module
+timer = StartupTimer()
+
+
+def lazy_import(name):
+    """
+    Import a module, but only load its code the first time one of its attributes is used.
+
+    Used in place of a top-level import for modules that only optional features need,
+    so starting the game doesn't pay for features that are switched off.
+    With 'c.FAST_STARTUP' off, the module is imported right away instead.
+
+    Args:
+        name (str): Full module name, e.g. "snapshot_module"
+
+    Returns:
+        module: The module (already loaded if something imported it earlier)
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    if not c.FAST_STARTUP:
+        return importlib.import_module(name)
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
@@ -0,0 +1,58 @@
+# stats_module.py:
+# This module handles counting what happens during a game, such as how many frames the player
+# survived, how many asteroids were shot, and the largest number of objects alive at once.
+
+
+class GameStats:
+    """
+    Running totals and peaks for a single game.
+
+    Attributes:
+        frames (int): Number of frames simulated
+        asteroids_destroyed (int): Number of asteroid hits by shots (each hit splits or destroys an asteroid)
+        peak_asteroids (int): Most asteroids alive at the same time
+        peak_shots (int): Most shots alive at the same time
+        peak_entities (int): Most objects in the updatable group at the same time
+    """
+
+    def __init__(self):
+        """
+        Initialize all counters to zero.
+        """
+
+        self.frames = 0
+        self.asteroids_destroyed = 0
+        self.peak_asteroids = 0
+        self.peak_shots = 0
+        self.peak_entities = 0
+
+    def record_frame(self, updatable_group, asteroids_group, shots_group):
+        """
+        Count a finished frame and update the peak group sizes.
+
+        Args:
+            updatable_group (pygame.sprite.Group): Group of all objects that need updating each frame
+            asteroids_group (pygame.sprite.Group): Group of all asteroid objects
+            shots_group (pygame.sprite.Group): Group of all player shot objects
+        """
+
+        self.frames += 1
+        self.peak_asteroids = max(self.peak_asteroids, len(asteroids_group))
+        self.peak_shots = max(self.peak_shots, len(shots_group))
+        self.peak_entities = max(self.peak_entities, len(updatable_group))
+
+    def as_dict(self):
+        """
+        Return the stats as a plain dictionary (easy to print, save, or send between processes).
+
+        Returns:
+            dict: Counter names mapped to their values
+        """
+
+        return {
+            "frames": self.frames,
+            "asteroids_destroyed": self.asteroids_destroyed,
+            "peak_asteroids": self.peak_asteroids,
+            "peak_shots": self.peak_shots,
+            "peak_entities": self.peak_entities,
+        }
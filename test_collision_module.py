@@ -0,0 +1,161 @@
+# test_collision_module.py:
+# Tests for the collision grid and the batched collision tests: both must find exactly the
+# pairs a plain nested loop finds, in the same order, so every collision path plays the same game.
+
+# Standard Library Imports
+import functools # Pins the collision path used by whole games
+import random # Seeded scenes of circles
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import collision_module as col # Collision grid and batched collision tests
+import game_systems as gs # Game running functionality
+import player_module as p # Player-related classes and functionality
+
+
+def random_circles(rng, count):
+    """Make (positions, velocities, radii) arrays for circles scattered over the screen."""
+
+    positions = np.array([(rng.uniform(0, 1280), rng.uniform(0, 720)) for _ in range(count)])
+    velocities = np.array([(rng.uniform(-300, 300), rng.uniform(-300, 300)) for _ in range(count)])
+    radii = np.array([rng.choice((5.0, 20.0, 40.0, 60.0)) for _ in range(count)])
+    return positions, velocities, radii
+
+
+def brute_force_pairs(circles_a, circles_b):
+    """Every overlapping (row, column) pair, found one pair at a time."""
+
+    pairs = []
+    for row, (position_a, radius_a) in enumerate(zip(circles_a[0], circles_a[2])):
+        for column, (position_b, radius_b) in enumerate(zip(circles_b[0], circles_b[2])):
+            if np.hypot(*(position_a - position_b)) <= radius_a + radius_b:
+                pairs.append((row, column))
+    return pairs
+
+
+def test_colliding_pairs_matches_brute_force_in_order():
+    rng = random.Random(3)
+    asteroids = random_circles(rng, 120)
+    shots = random_circles(rng, 90)
+
+    # A small chunk size splits the pair matrix into many chunks, which must not change the result
+    for chunk_pairs in (64, 1 << 16):
+        rows, columns = col.colliding_pairs(asteroids, shots, chunk_pairs=chunk_pairs)
+        assert list(zip(rows.tolist(), columns.tolist())) == brute_force_pairs(asteroids, shots)
+
+
+def test_colliding_pairs_with_nothing_to_test():
+    rng = random.Random(4)
+    rows, columns = col.colliding_pairs(random_circles(rng, 5), random_circles(rng, 0))
+    assert len(rows) == 0 and len(columns) == 0
+
+
+def test_spatial_hash_returns_each_nearby_item_once_in_insertion_order():
+    grid = col.SpatialHash(cell_size=50)
+    # The first item spans several cells, so a query overlapping them all must not repeat it
+    grid.insert("big", pygame.Vector2(100, 100), 80)
+    grid.insert("near", pygame.Vector2(120, 100), 5)
+    grid.insert("far", pygame.Vector2(1000, 600), 5)
+
+    assert grid.query(pygame.Vector2(110, 100), 30) == ["big", "near"]
+    assert grid.query(pygame.Vector2(1000, 600), 1) == ["far"]
+    assert grid.query(pygame.Vector2(600, 400), 1) == []
+
+
+def crowded_scene(new_game, seed):
+    """A game with the player out of the way and a crowd of asteroids and shots on screen."""
+
+    simulation = new_game(seed)
+    simulation.player_character.position = pygame.Vector2(-1000, -1000)
+
+    rng = random.Random(seed)
+    for _ in range(150):
+        asteroid = a.Asteroid(rng.uniform(0, 1280), rng.uniform(0, 720), 20 * rng.randint(1, 3))
+        asteroid.velocity = pygame.Vector2(rng.uniform(-80, 80), rng.uniform(-80, 80))
+    for _ in range(300):
+        shot = p.Shot(rng.uniform(0, 1280), rng.uniform(0, 720), 5)
+        shot.velocity = pygame.Vector2(0, 500).rotate(rng.uniform(0, 360))
+        simulation.shots_group.add(shot)
+    return simulation
+
+
+def scene_state(simulation):
+    """Positions, radii, and velocities of every asteroid, plus the number of shots left."""
+
+    asteroids = [(round(asteroid.position.x, 6), round(asteroid.position.y, 6), asteroid.radius, round(asteroid.velocity.x, 6))
+                 for asteroid in simulation.asteroids_group]
+    return asteroids, len(simulation.shots_group)
+
+
+def test_batched_and_grid_collisions_destroy_the_same_objects(new_game):
+    for seed in range(3):
+        results = []
+        for batched in (True, False):
+            simulation = crowded_scene(new_game, seed)
+            # Splits draw from the game's random number source, so both paths must split in the same order
+            gs.handle_collisions(simulation.asteroids_group, simulation.shots_group, simulation.player_character,
+                                 simulation.stats, batched=batched)
+            results.append((scene_state(simulation), simulation.stats.asteroids_destroyed))
+
+        assert results[0] == results[1]
+        assert results[0][1] > 0
+
+
+def test_games_with_batched_and_grid_collisions_play_out_the_same(play_game, monkeypatch):
+    # update_game_state looks handle_collisions up on each call, so pinning 'batched' here switches whole games
+    handle_collisions = gs.handle_collisions
+    for seed in range(3):
+        outcomes = []
+        for batched in (True, False):
+            monkeypatch.setattr(gs, "handle_collisions", functools.partial(handle_collisions, batched=batched))
+            outcomes.append(play_game(seed, 2500))
+
+        assert outcomes[0] == outcomes[1]
+        assert outcomes[0][1]["asteroids_destroyed"] > 0
+
+
+def shot_and_asteroid(new_game, shot_x, age):
+    """A game holding one shot flying right at 500 px/s and one asteroid at x = 460, with the player out of the way."""
+
+    simulation = new_game()
+    simulation.player_character.position = pygame.Vector2(-1000, -1000)
+
+    shot = p.Shot(shot_x, 300, 5)
+    shot.velocity = pygame.Vector2(500, 0)
+    shot.age = age
+    simulation.shots_group.add(shot)
+    a.Asteroid(460, 300, 20)
+    return simulation, shot
+
+
+def test_swept_collisions_catch_a_shot_that_passed_through_an_asteroid(new_game):
+    for batched in (True, False):
+        # After a 0.1 s step the shot is 40 px past the asteroid's center: it flew straight through it
+        simulation, shot = shot_and_asteroid(new_game, 500, age=0.1)
+        gs.handle_collisions(simulation.asteroids_group, simulation.shots_group, simulation.player_character, swept_dt=0.0, batched=batched)
+        assert shot.alive()
+
+        gs.handle_collisions(simulation.asteroids_group, simulation.shots_group, simulation.player_character, swept_dt=0.1, batched=batched)
+        assert not shot.alive()
+
+
+def test_shots_fired_this_step_are_not_swept_back(new_game):
+    for batched in (True, False):
+        # The same shot, but fired during this step: it was never anywhere near the asteroid behind it
+        simulation, shot = shot_and_asteroid(new_game, 500, age=0.0)
+        gs.handle_collisions(simulation.asteroids_group, simulation.shots_group, simulation.player_character, swept_dt=0.1, batched=batched)
+        assert shot.alive()
+
+
+def test_sweep_time_is_limited_by_age():
+    shot = p.Shot(0, 0, 5)
+    shot.age = 0.02
+    assert col.sweep_time(shot, 0.1) == 0.02
+    shot.age = 1.0
+    assert col.sweep_time(shot, 0.1) == 0.1
+    # Objects without an age are swept over the whole step
+    assert col.sweep_time(a.Asteroid(0, 0, 20), 0.1) == 0.1
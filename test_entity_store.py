@@ -0,0 +1,113 @@
+# test_entity_store.py:
+# Tests for the array-backed entity store: slot bookkeeping, batched movement, and games that
+# play out exactly the same whether objects keep their state in the store or on themselves.
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import conftest # Scripted player and game summaries shared by the tests
+import entity_store as es # Array-backed storage for object positions, velocities, and radii
+import lifetime_module as lm # Despawn rules for off-screen and expired objects
+
+
+def test_released_slots_are_reused_lowest_first():
+    store = es.EntityStore(capacity=4)
+    slots = [store.allocate(None, 0, 0, 1) for _ in range(3)]
+    assert slots == [0, 1, 2]
+
+    store.release(1)
+    store.release(0)
+    assert store.count == 1
+    assert not store.alive[0] and not store.alive[1]
+    assert store.allocate(None, 5, 5, 1) == 0
+
+
+def test_grow_keeps_rows_and_clears_new_ones():
+    store = es.EntityStore(capacity=2)
+    for index in range(2):
+        slot = store.allocate(None, index, index, 10)
+        store.velocities[slot] = (1, 2)
+
+    # The third object doesn't fit, so the arrays double
+    slot = store.allocate(None, 7, 8, 3)
+    assert store.capacity == 4
+    assert slot == 2
+    assert store.positions[:3].tolist() == [[0, 0], [1, 1], [7, 8]]
+    assert store.velocities[2:].tolist() == [[0, 0], [0, 0]]
+    assert not store.alive[3]
+
+
+def test_integrate_moves_only_live_objects():
+    store = es.EntityStore(capacity=4)
+    moving = store.allocate(None, 10, 10, 1)
+    store.velocities[moving] = (60, -30)
+    freed = store.allocate(None, 0, 0, 1)
+    store.velocities[freed] = (100, 100)
+    store.release(freed)
+
+    store.integrate(0.5)
+    assert store.positions[moving].tolist() == [40, -5]
+    assert store.positions[freed].tolist() == [0, 0]
+
+
+def test_killed_objects_keep_their_last_state(new_game):
+    new_game(entity_store=es.EntityStore())
+    asteroid = a.Asteroid(100, 200, 40)
+    asteroid.velocity = pygame.Vector2(3, 4)
+    slot = asteroid.slot
+
+    asteroid.kill()
+    assert asteroid.slot is None
+    assert (asteroid.position, asteroid.velocity, asteroid.radius) == (pygame.Vector2(100, 200), pygame.Vector2(3, 4), 40)
+    assert not asteroid.store.alive[slot]
+
+
+def test_despawn_flags_match_per_object_checks(new_game):
+    new_game(entity_store=es.EntityStore())
+    policy = lm.DespawnPolicy()
+    asteroids = [a.Asteroid(x, y, 20) for x, y in ((-500, 300), (640, 360), (1280 + 200, 100), (640, 2000), (-140, -140))]
+
+    outside = policy.outside_slots(asteroids[0].store)
+    assert [bool(outside[asteroid.slot]) for asteroid in asteroids] == [policy.is_outside(asteroid) for asteroid in asteroids]
+    # Free slots are never flagged
+    assert not np.any(outside[~asteroids[0].store.alive])
+
+
+def test_games_with_and_without_a_store_play_out_the_same(play_game):
+    for seed in range(3):
+        assert play_game(seed, 2500) == play_game(seed, 2500, entity_store=es.EntityStore(capacity=16))
+
+
+def test_two_games_with_stores_keep_to_their_own_arrays(new_game):
+    first = new_game(1, entity_store=es.EntityStore())
+    first.run(120)
+    asteroid = next(iter(first.asteroids_group))
+    position, player_position = asteroid.position, first.player_character.position
+
+    # Creating a second game points the classes at its store; the first game's objects must not follow
+    second = new_game(2, entity_store=es.EntityStore())
+    assert asteroid.store is first.player_character.store is not second.player_character.store
+    assert (asteroid.position, first.player_character.position) == (position, player_position)
+
+    # Writes and kills outside step() touch only the first game's store
+    second_positions = second.player_character.store.positions.copy()
+    asteroid.position = pygame.Vector2(5, 5)
+    assert asteroid.store.positions[asteroid.slot].tolist() == [5, 5]
+    slot = asteroid.slot
+    asteroid.kill()
+    assert not first.player_character.store.alive[slot]
+    assert np.array_equal(second.player_character.store.positions, second_positions)
+    assert second.player_character.store.count == len(second.drawable_group)
+
+
+def test_games_taking_turns_play_out_like_games_run_alone(new_game, play_game):
+    alone = [play_game(seed, 600, entity_store=es.EntityStore(capacity=16)) for seed in (1, 2)]
+
+    games = [new_game(seed, entity_store=es.EntityStore(capacity=16)) for seed in (1, 2)]
+    for _ in range(6):
+        for game in games:
+            game.run(100)
+    assert [conftest.game_outcome(game) for game in games] == alone
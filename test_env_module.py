@@ -0,0 +1,45 @@
+# test_env_module.py:
+# Tests for the agent environments: seeds given as NumPy integers or arrays reproduce the same games
+# as Python ints, and batched environments match single ones stepped by hand.
+
+# Third-Party Imports - External libraries
+import numpy as np
+
+# Local Module Imports - Game-specific modules
+import env_module as env # Single and batched agent environments
+
+
+def play(environment, seed, actions):
+    """Reset with a seed, apply the actions, and return every observation and reward."""
+
+    observations = [environment.reset(seed)]
+    rewards = []
+    for action in actions:
+        observation, reward, _, _, _ = environment.step(action)
+        observations.append(observation)
+        rewards.append(reward)
+    return np.array(observations), np.array(rewards)
+
+
+def test_numpy_seeds_play_the_same_game_as_python_ints():
+    actions = np.random.default_rng(0).integers(0, env.ACTION_COUNT, size=120)
+    expected = play(env.AsteroidsEnv(), 7, actions)
+
+    for seed in (np.int64(7), np.uint32(7), np.arange(10)[7]):
+        observations, rewards = play(env.AsteroidsEnv(), seed, actions)
+        assert np.array_equal(observations, expected[0]) and np.array_equal(rewards, expected[1])
+
+
+def test_batched_seeds_match_single_environments():
+    actions = np.random.default_rng(1).integers(0, env.ACTION_COUNT, size=(60, 3))
+    single = [play(env.AsteroidsEnv(), seed, actions[:, index]) for index, seed in enumerate((4, 5, 6))]
+
+    # A single NumPy seed (environment i uses seed + i) and an array of seeds give the same games
+    for seed in (np.int32(4), np.array([4, 5, 6])):
+        batched = env.BatchedAsteroidsEnv(3)
+        first = batched.reset(seed)
+        steps = [batched.step(action_batch) for action_batch in actions]
+        for index in range(3):
+            assert np.array_equal(first[index], single[index][0][0])
+            assert np.array_equal(steps[-1][0][index], single[index][0][-1])
+            assert np.array_equal([step[1][index] for step in steps], single[index][1].astype(np.float32))
@@ -0,0 +1,29 @@
+# test_multiplayer_module.py:
+# An end-to-end test of the multiplayer demo: a server and a few simulated clients play for a
+# second over localhost UDP, and every client must decode every snapshot, mostly as deltas,
+# while its predicted ship stays close to where the server puts it.
+
+# Standard Library Imports
+import asyncio # Runs the server and clients in one event loop
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import multiplayer_module as mp # Server, clients, and the loopback demo
+
+
+def test_loopback_clients_decode_every_snapshot_and_predict_closely():
+    server, clients = asyncio.run(mp.run_loopback(client_count=3, seconds=1.0, seed=0))
+
+    # Ships that get hit respawn at the center, which is a correction no prediction could avoid
+    assert server.world.deaths == 0
+    assert server.world.tick >= c.SERVER_TICK_RATE // 2
+
+    # An input that reaches the server a tick late costs at most one tick of ship movement;
+    # two are allowed so a busy test machine doesn't fail the test
+    max_error = 2 * c.PLAYER_SPEED / c.SERVER_TICK_RATE
+
+    for client in clients:
+        assert client.player_id is not None
+        assert client.dropped == 0
+        assert client.snapshots - client.full_snapshots > client.full_snapshots
+        assert client.corrections and max(client.corrections) <= max_error
@@ -0,0 +1,98 @@
+# test_netcode_module.py:
+# Tests for snapshot packets: quantizing keeps the precision the network promises, and a snapshot
+# encoded as the difference from a base decodes back to exactly the same records.
+
+# Standard Library Imports
+import random # Seeded worlds of objects
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pytest
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import netcode_module as nc # Snapshot and input packet encoding
+
+
+def random_world(rng, ids):
+    """Quantize a snapshot of objects with the given ids at random places on (and a little off) the screen."""
+
+    count = len(ids)
+    positions = np.array([(rng.uniform(-200, 1480), rng.uniform(-200, 920)) for _ in range(count)])
+    velocities = np.array([(rng.uniform(-400, 400), rng.uniform(-400, 400)) for _ in range(count)])
+    radii = np.array([rng.choice((20, 40, 60)) for _ in range(count)])
+    rotations = np.array([rng.uniform(-720, 720) for _ in range(count)])
+    kinds = np.array([rng.choice((nc.KIND_PLAYER, nc.KIND_ASTEROID, nc.KIND_SHOT)) for _ in range(count)])
+    return nc.quantize(np.array(ids), kinds, positions, velocities, radii, rotations)
+
+
+def test_quantize_keeps_network_precision():
+    positions = np.array([[100.06, 200.5], [-3.3, 719.9]])
+    velocities = np.array([[-150.1, 0.13], [80.0, -299.9]])
+    snapshot = nc.quantize(np.array([7, 2]), np.array([nc.KIND_SHOT, nc.KIND_PLAYER]), positions, velocities,
+                           np.array([5, 20]), np.array([90.0, -90.0]))
+
+    # Records come out sorted by id
+    assert snapshot["id"].tolist() == [2, 7]
+    for row, original in ((0, 1), (1, 0)):
+        position, velocity, radius, rotation = nc.dequantize(snapshot[row])
+        assert np.allclose(position, positions[original], atol=0.5 / c.NET_POSITION_SCALE)
+        assert np.allclose(velocity, velocities[original], atol=0.5 / c.NET_VELOCITY_SCALE)
+    assert nc.dequantize(snapshot[0])[3] == 270.0 and nc.dequantize(snapshot[1])[3] == 90.0
+
+
+def test_positions_far_off_screen_are_clamped_not_wrapped():
+    snapshot = nc.quantize(np.array([1]), np.array([nc.KIND_ASTEROID]), np.array([[1e6, -1e6]]),
+                           np.zeros((1, 2)), np.array([60]), np.array([0.0]))
+    assert (snapshot["x"][0], snapshot["y"][0]) == (32767, -32768)
+
+
+def test_delta_round_trip_with_removed_changed_and_added_objects():
+    rng = random.Random(5)
+    base = random_world(rng, range(1, 41))
+
+    # Drop every third object, move some of the rest (including big jumps that wrap around 16 bits), and add new ones
+    current = base[np.arange(len(base)) % 3 != 0].copy()
+    current["x"][::2] += 37
+    current["vy"][1::4] -= 1200
+    current["y"][5] = -current["y"][5]
+    current["rotation"][3] += 40000
+    current["kind"][7] = nc.KIND_SHOT if current["kind"][7] != nc.KIND_SHOT else nc.KIND_ASTEROID
+    current = np.concatenate([current, random_world(rng, range(41, 51))])
+
+    removed, changed, added, body = nc.encode_snapshot(current, base)
+    assert (removed, added) == (14, 10)
+    assert 0 < changed < len(base) - removed
+
+    decoded = nc.decode_snapshot(body, removed, changed, added, base)
+    assert decoded.tobytes() == current.tobytes()
+
+
+def test_unchanged_world_sends_no_records():
+    base = random_world(random.Random(6), range(1, 21))
+    removed, changed, added, body = nc.encode_snapshot(base.copy(), base)
+    assert (removed, changed, added) == (0, 0, 0)
+    assert nc.decode_snapshot(body, 0, 0, 0, base).tobytes() == base.tobytes()
+
+
+def test_whole_snapshot_through_a_packet():
+    snapshot = random_world(random.Random(7), [3, 9, 12])
+    packet = nc.pack_snapshot(44, nc.NO_BASE, 9, 17, nc.encode_snapshot(snapshot))
+
+    tick, base_tick, player_id, last_input, removed, changed, added, body = nc.unpack_snapshot(packet)
+    assert (tick, base_tick, player_id, last_input, removed, changed, added) == (44, nc.NO_BASE, 9, 17, 0, 0, 3)
+    assert nc.decode_snapshot(body, removed, changed, added).tobytes() == snapshot.tobytes()
+
+
+def test_decoding_against_the_wrong_counts_is_refused():
+    snapshot = random_world(random.Random(8), [1, 2])
+    _, _, added, body = nc.encode_snapshot(snapshot)
+    with pytest.raises(ValueError):
+        nc.decode_snapshot(body, 0, 0, added + 1)
+
+
+def test_input_packet_round_trip():
+    packet = nc.pack_input(12, 30, [1, 0, 5, 9])
+    assert nc.unpack_input(packet) == (12, 30, [1, 0, 5, 9])
+    with pytest.raises(ValueError):
+        nc.unpack_input(nc.BYE_MAGIC)
@@ -0,0 +1,80 @@
+# test_particle_module.py:
+# Tests for particles: the ring overwrites the oldest particles, each step's emission budget is kept,
+# particles expire after their lifetime, both drawing paths draw the same squares, and debris never
+# changes how a game plays out.
+
+# Third-Party Imports - External libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import conftest # Scripted player and game summaries shared by the tests
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import particle_module as pt # Debris and exhaust particles
+import player_module as p # Player-related classes and functionality
+
+
+def emit_still(particles, count, lifetime=1.0, position=(50.0, 40.0)):
+    """Emit 'count' motionless particles at one position."""
+
+    return particles.emit(np.array(position), np.zeros((count, 2)), np.full(count, lifetime))
+
+
+def test_budget_drops_extra_particles_until_the_next_step():
+    particles = pt.ParticleSystem(capacity=100, frame_budget=10)
+    assert emit_still(particles, 6) == 6
+    assert emit_still(particles, 6) == 4
+    assert particles.stats() == {"live": 10, "capacity": 100, "emitted": 10, "dropped": 2}
+
+    particles.update(0.01)
+    assert emit_still(particles, 6) == 6
+
+
+def test_ring_overwrites_the_oldest_particles():
+    particles = pt.ParticleSystem(capacity=8, frame_budget=100)
+    emit_still(particles, 6, position=(1.0, 1.0))
+    emit_still(particles, 4, position=(2.0, 2.0))
+
+    assert particles.live_count() == 8
+    # The two oldest slots now hold the newest particles
+    assert particles.positions[:, 0].tolist() == [2.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0]
+
+
+def test_particles_move_slow_down_and_expire():
+    particles = pt.ParticleSystem(capacity=4)
+    particles.emit(np.array((0.0, 0.0)), np.array([[100.0, 0.0], [0.0, 50.0]]), np.array([0.5, 2.0]))
+
+    particles.update(0.25)
+    assert particles.positions[:2].tolist() == [[25.0, 0.0], [0.0, 12.5]]
+    assert particles.velocities[0, 0] == 100.0 * c.PARTICLE_DRAG ** 0.25
+
+    particles.update(0.25)
+    assert particles.live_count() == 1
+
+
+def test_pixel_array_and_blits_drawing_match():
+    particles = pt.ParticleSystem(capacity=64, seed=3)
+    particles.burst(pygame.Vector2(60, 50), pygame.Vector2(10, 0), 40)
+    particles.update(0.2)
+
+    # A 32-bit surface is drawn through its pixel array, a 24-bit one with blits
+    screens = [pygame.Surface((120, 100), depth=depth) for depth in (32, 24)]
+    for screen in screens:
+        screen.fill(c.BACKGROUND_COLOR)
+    drawn = [particles.draw(screen) for screen in screens]
+
+    assert drawn[0] == drawn[1] > 0
+    assert np.array_equal(pygame.surfarray.array3d(screens[0]), pygame.surfarray.array3d(screens[1]))
+
+
+def test_particles_do_not_change_the_game(new_game, play_game):
+    simulation = new_game(1)
+    particles = pt.ParticleSystem(seed=0)
+    # Headless games emit no particles, so this one is given a particle system the way setup_game_objects would
+    for cls in (a.Asteroid, p.Player):
+        simulation.bindings[(cls, "particles")] = particles
+    simulation.run(1200)
+
+    assert particles.emitted > 0
+    assert conftest.game_outcome(simulation) == play_game(1, 1200)
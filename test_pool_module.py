@@ -0,0 +1,49 @@
+# test_pool_module.py:
+# Tests for object pools: killed objects only become reusable at the end of the frame,
+# and reused objects come back reset and in their groups.
+
+# Third-Party Imports - External libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import pool_module as pm # Recycling of destroyed objects
+
+
+def test_killed_objects_are_reused_only_after_recycle(new_game):
+    simulation = new_game()
+    pool = a.Asteroid.pool
+    asteroid = a.Asteroid.create(100, 100, 40)
+    asteroid.velocity = pygame.Vector2(5, 5)
+
+    asteroid.kill()
+    assert pool.pending == [asteroid]
+
+    # Still the same frame: the killed asteroid must not be handed out again yet
+    other = a.Asteroid.create(200, 200, 20)
+    assert other is not asteroid
+
+    pool.recycle()
+    reused = a.Asteroid.create(300, 400, 60)
+    assert reused is asteroid
+    assert (reused.position, reused.velocity, reused.radius) == (pygame.Vector2(300, 400), pygame.Vector2(0, 0), 60)
+    assert reused in simulation.asteroids_group
+    assert pool.stats()["reused"] == 1
+
+
+def test_an_object_killed_twice_is_released_once(new_game):
+    new_game()
+    asteroid = a.Asteroid.create(100, 100, 40)
+    asteroid.kill()
+    asteroid.kill()
+    assert a.Asteroid.pool.pending == [asteroid]
+
+
+def test_recycle_keeps_at_most_max_size_objects():
+    pool = pm.ObjectPool(object, max_size=2)
+    for _ in range(3):
+        pool.release(object())
+
+    pool.recycle()
+    assert len(pool.free) == 2
+    assert pool.pending == []
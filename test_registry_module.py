@@ -0,0 +1,74 @@
+# test_registry_module.py:
+# Tests for the entity registry: buckets behave like pygame sprite groups (including their order),
+# views read across buckets, and a game plays out the same with the registry or with sprite groups.
+
+# Third-Party Imports - External libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import registry_module as rm # Typed entity buckets and the views that replace sprite groups
+
+
+def test_removal_keeps_the_remaining_order_like_a_sprite_group():
+    bucket = rm.EntityBucket("asteroids")
+    group = pygame.sprite.Group()
+    sprites = [pygame.sprite.Sprite() for _ in range(6)]
+    for sprite in sprites:
+        sprite.add(bucket, group)
+
+    # Kill from the front, the middle, and the end, then bring one back
+    for index in (0, 3, 5):
+        sprites[index].kill()
+    sprites[0].add(bucket, group)
+
+    assert bucket.sprites() == group.sprites() == [sprites[1], sprites[2], sprites[4], sprites[0]]
+    assert len(bucket) == 4
+    assert sprites[3] not in bucket and not sprites[3].alive()
+
+
+def test_sprites_know_their_buckets():
+    bucket = rm.EntityBucket("shots")
+    sprite = pygame.sprite.Sprite(bucket)
+    assert sprite.alive() and sprite.groups() == [bucket]
+
+    bucket.remove(sprite)
+    assert not sprite.alive() and sprite not in bucket
+
+    # Killing a sprite twice, or removing one that was never added, is harmless
+    sprite.kill()
+    bucket.remove(pygame.sprite.Sprite())
+    assert len(bucket) == 0
+
+
+def test_iterating_is_safe_while_killing():
+    bucket = rm.EntityBucket("asteroids", [pygame.sprite.Sprite() for _ in range(5)])
+    for sprite in bucket:
+        sprite.kill()
+    assert not bucket
+
+
+def test_views_read_every_bucket_in_order():
+    registry = rm.EntityRegistry()
+    player = pygame.sprite.Sprite(registry.players)
+    field = pygame.sprite.Sprite(registry.fields)
+    asteroids = [pygame.sprite.Sprite(registry.asteroids) for _ in range(2)]
+    shot = pygame.sprite.Sprite(registry.shots)
+
+    assert registry.updatable.sprites() == [player, field, *asteroids, shot]
+    # Asteroid fields are updated but never drawn
+    assert registry.drawable.sprites() == [player, *asteroids, shot]
+    assert field in registry.updatable and field not in registry.drawable
+
+    # Removing through a view removes the sprite from its bucket
+    registry.drawable.remove(asteroids[0])
+    assert not asteroids[0].alive()
+    assert registry.counts() == {"players": 1, "fields": 1, "asteroids": 1, "shots": 1}
+
+
+def test_games_with_the_registry_and_with_sprite_groups_play_out_the_same(play_game, monkeypatch):
+    for seed in range(3):
+        monkeypatch.setattr(c, "USE_ENTITY_REGISTRY", True)
+        with_registry = play_game(seed, 2500)
+        monkeypatch.setattr(c, "USE_ENTITY_REGISTRY", False)
+        assert play_game(seed, 2500) == with_registry
@@ -0,0 +1,64 @@
+# test_render_module.py:
+# Tests for partial screen updates: the renderer erases exactly what it drew, and anything drawn over a
+# full-redraw frame (like the profiler overlay) is gone the frame after it stops being shown.
+
+# Third-Party Imports - External libraries
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import render_module as rm # Pre-rendered images and partial screen updates
+
+
+class Dot(pygame.sprite.Sprite):
+    """A small filled circle, standing in for a game object."""
+
+    def __init__(self, x, y):
+        super().__init__()
+        self.position = pygame.Vector2(x, y)
+        self.radius = 5
+
+    def draw(self, screen):
+        pygame.draw.circle(screen, (255, 255, 255), self.position, self.radius)
+
+
+def only_background(screen, rect=None):
+    """Check that a screen area (the whole screen by default) holds nothing but the background color."""
+
+    area = screen.subsurface(rect) if rect is not None else screen
+    matching = pygame.mask.from_threshold(area, c.BACKGROUND_COLOR, (1, 1, 1, 255)).count()
+    return matching == area.get_width() * area.get_height()
+
+
+def test_first_frame_is_full_and_later_frames_update_only_what_moved():
+    screen = pygame.Surface((400, 300))
+    renderer = rm.DirtyRectRenderer(max_fraction=1.0)
+    dot = Dot(100, 100)
+
+    assert renderer.render(screen, [dot]) is None
+    old_rect = rm.sprite_bounds(dot)
+
+    dot.position.update(300, 200)
+    dirty_rects = renderer.render(screen, [dot])
+    assert dirty_rects == [old_rect, rm.sprite_bounds(dot)]
+
+    # The dot is gone from where it was, and drawn where it is
+    assert only_background(screen, old_rect)
+    assert not only_background(screen, rm.sprite_bounds(dot))
+
+
+def test_overlay_is_erased_the_frame_after_it_is_hidden():
+    screen = pygame.Surface((400, 300))
+    renderer = rm.DirtyRectRenderer(max_fraction=1.0)
+    renderer.render(screen, [])
+
+    # A frame with the overlay: drawn over the whole screen after the sprites, then presented whole
+    assert renderer.render(screen, [], full_redraw=True) is None
+    screen.fill((200, 0, 0), pygame.Rect(10, 10, 150, 40))
+
+    # The overlay is hidden: this frame must still clear (and present) the whole screen
+    assert renderer.render(screen, []) is None
+    assert only_background(screen)
+
+    # After that, nothing is left to update
+    assert renderer.render(screen, []) == []
@@ -0,0 +1,62 @@
+# test_replay_module.py:
+# Tests for replays: a recorded game survives saving and loading, plays back to exactly the same
+# result, and is refused when the playback modes differ from the ones it was recorded with.
+
+# Third-Party Imports - External libraries
+import pytest
+
+# Local Module Imports - Game-specific modules
+import conftest # Scripted player and game summaries shared by the tests
+import entity_store as es # Array-backed storage for object positions, velocities, and radii
+import headless_module as hm # Windowless, fixed-timestep game simulation
+import input_module as inp # Sources of key presses (keyboard, scripted, or none)
+import replay_module as rp # Recording and playback of complete games
+
+
+def record_game(seed, steps, entity_store=None):
+    """Play a headless game with the scripted player, recording its keys, and return (replay, outcome)."""
+
+    replay = rp.Replay(seed, 1 / 60, flags=rp.mode_flags(entity_store=entity_store))
+    recorder = rp.RecordingInput(inp.ScriptedInput(conftest.PLAYER_SCRIPT, loop=True), replay)
+    simulation = hm.HeadlessSimulation(input_source=recorder, dt=replay.dt, entity_store=entity_store, seed=seed)
+    simulation.run(steps)
+    return replay, conftest.game_outcome(simulation)
+
+
+def test_recorded_game_plays_back_the_same(tmp_path):
+    replay, outcome = record_game(seed=4, steps=1500)
+    # One key byte per step played (the game may end early when the player is hit)
+    frames = outcome[0]
+    assert 0 < frames <= 1500 and len(replay.masks) == frames
+
+    path = tmp_path / "game.replay"
+    replay.save(path)
+    loaded = rp.Replay.load(path)
+    assert (loaded.seed, loaded.dt, loaded.masks, loaded.flags) == (replay.seed, replay.dt, replay.masks, replay.flags)
+
+    assert conftest.game_outcome(rp.play_replay(loaded)) == outcome
+
+
+def test_replay_with_a_store_plays_back_with_a_store():
+    replay, outcome = record_game(seed=5, steps=800, entity_store=es.EntityStore())
+    assert replay.flags & rp.FLAG_ENTITY_STORE
+
+    assert conftest.game_outcome(rp.play_replay(replay, entity_store=es.EntityStore())) == outcome
+
+
+def test_playback_in_other_modes_is_refused():
+    replay, _ = record_game(seed=6, steps=10, entity_store=es.EntityStore())
+    with pytest.raises(ValueError, match="entity store"):
+        rp.play_replay(replay)
+
+
+def test_damaged_replays_are_refused():
+    data = rp.Replay(1, 1 / 60, [1, 2, 3]).to_bytes()
+
+    with pytest.raises(ValueError, match="Not a replay"):
+        rp.Replay.from_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="too short"):
+        rp.Replay.from_bytes(data[:rp.HEADER_SIZE - 1])
+    # An older version, which did not record its game modes
+    with pytest.raises(ValueError, match="version"):
+        rp.Replay.from_bytes(data[:4] + (1).to_bytes(2, "little") + data[6:])
@@ -0,0 +1,98 @@
+# test_snapshot_module.py:
+# Tests for game snapshots: a game restored from a snapshot (in memory or from a file) carries
+# on exactly like the game it was captured from, down to its stats and random numbers.
+
+# Third-Party Imports - External libraries
+import pytest
+
+# Local Module Imports - Game-specific modules
+import conftest # Scripted player and game summaries shared by the tests
+import entity_store as es # Array-backed storage for object positions, velocities, and radii
+import snapshot_module as snap # Capturing and restoring complete game state
+import world_module as wm # Scrolling world, chunks, and camera
+
+# The scripted player repeats every len(PLAYER_SCRIPT) steps; checkpoints fall on a repeat so a new
+# game's script (which starts from its beginning) lines up with the captured game's
+CHECKPOINT = len(conftest.PLAYER_SCRIPT) * 10
+
+
+@pytest.mark.parametrize("use_store", [False, True])
+def test_restored_game_carries_on_the_same(new_game, tmp_path, use_store):
+    # Each game needs its own store
+    new_store = es.EntityStore if use_store else lambda: None
+
+    original = new_game(5, entity_store=new_store())
+    original.run(CHECKPOINT)
+    assert not original.game_over and original.asteroids_group
+
+    path = tmp_path / "checkpoint.snap"
+    original.snapshot().save(path)
+    original.run(CHECKPOINT)
+
+    # Restore into a fresh game with a different seed: everything must come from the snapshot
+    restored = new_game(99, entity_store=new_store())
+    restored.restore(snap.Snapshot.load(path))
+    assert restored.frame == CHECKPOINT
+    restored.run(CHECKPOINT)
+
+    assert conftest.game_outcome(restored) == conftest.game_outcome(original)
+
+
+def test_restoring_rolls_a_game_back(new_game):
+    simulation = new_game(5)
+    simulation.run(CHECKPOINT)
+    checkpoint = simulation.snapshot()
+    stats = simulation.stats.as_dict()
+    outcome = conftest.game_outcome(simulation)
+
+    simulation.run(CHECKPOINT)
+    assert simulation.stats.as_dict() != stats
+
+    simulation.restore(snap.Snapshot(checkpoint.to_bytes()))
+    assert simulation.stats.as_dict() == stats
+    assert conftest.game_outcome(simulation) == outcome
+
+
+def test_other_data_is_refused():
+    with pytest.raises(ValueError):
+        snap.Snapshot(b"ASTR" + bytes(64))
+
+
+def world_state(simulation):
+    """The game's outcome, plus every dormant asteroid chunk by chunk and the world's counters."""
+
+    world = simulation.world
+    dormant = [(key, [(round(asteroid.position.x, 6), round(asteroid.position.y, 6), asteroid.radius) for asteroid in asteroids])
+               for key, asteroids in world.chunks.items()]
+    return conftest.game_outcome(simulation), dormant, world.counts(), world.tick, len(world)
+
+
+def test_restoring_a_scrolling_world_restores_every_chunk(new_game):
+    simulation = new_game(5, world=wm.World())
+    # Shorter runs than the other tests: this game ends a little after frame 700
+    stretch = len(conftest.PLAYER_SCRIPT) * 4
+    simulation.run(stretch)
+    checkpoint = snap.Snapshot(simulation.snapshot().to_bytes())
+    at_checkpoint = world_state(simulation)
+
+    simulation.run(stretch)
+    assert not simulation.game_over
+    after = world_state(simulation)
+    assert after[3:] != at_checkpoint[3:]
+
+    # Asteroids that fell asleep after the checkpoint must not survive the restore
+    simulation.restore(checkpoint)
+    assert world_state(simulation) == at_checkpoint
+    simulation.run(stretch)
+    assert world_state(simulation) == after
+
+
+def test_snapshots_only_restore_into_the_same_kind_of_game(new_game):
+    flat = new_game(5)
+    scrolling = new_game(5, world=wm.World())
+    flat_snapshot, world_snapshot = flat.snapshot(), scrolling.snapshot()
+
+    with pytest.raises(ValueError, match="has none"):
+        flat.restore(world_snapshot)
+    with pytest.raises(ValueError, match="has one"):
+        scrolling.restore(flat_snapshot)
@@ -0,0 +1,79 @@
+# test_spawn_module.py:
+# Tests for the spawn scheduler: the piece count it budgets for matches what splitting really
+# produces, the largest size allowed shrinks as the entity budget fills up, and the difficulty curves.
+
+# Third-Party Imports - External libraries
+import pytest
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import spawn_module as sp # Spawn interval and entity budget decisions
+
+
+def split_completely(simulation, kind):
+    """Shoot an asteroid of the given size and all of its pieces, and return how many asteroids there were in all."""
+
+    asteroid = a.Asteroid(640, 360, kind * c.ASTEROID_MIN_RADIUS)
+    asteroid.velocity.update(0, 50)
+    waiting = [asteroid]
+    count = 0
+
+    while waiting:
+        before = set(simulation.asteroids_group)
+        waiting.pop().split()
+        waiting += [piece for piece in simulation.asteroids_group if piece not in before]
+        count += 1
+
+    return count
+
+
+@pytest.mark.parametrize("kind", range(1, c.ASTEROID_KINDS + 1))
+def test_descendants_counts_every_piece_a_split_makes(new_game, kind):
+    simulation = new_game()
+    simulation.asteroids_group.empty()
+    assert split_completely(simulation, kind) == sp.descendants(kind)
+    assert not simulation.asteroids_group
+
+
+def test_largest_size_shrinks_as_the_budget_fills():
+    scheduler = sp.SpawnScheduler(entity_budget=10)
+    # descendants: size 1 -> 1 object, size 2 -> 3, size 3 -> 7
+    assert [scheduler.decide(count) for count in (0, 3, 4, 7, 8, 9, 10, 12)] == [3, 3, 2, 2, 1, 1, 0, 0]
+    assert (scheduler.spawned, scheduler.reduced, scheduler.skipped) == (6, 4, 2)
+    assert scheduler.history[-1].max_kind == 0 and scheduler.history[-1].entity_count == 12
+
+
+def test_no_budget_always_allows_the_largest_size():
+    scheduler = sp.SpawnScheduler(entity_budget=None)
+    assert scheduler.decide(10 ** 6) == c.ASTEROID_KINDS
+
+
+def test_difficulty_curves():
+    assert sp.curve_progress("constant", 500.0, 100.0) == 0.0
+    assert sp.curve_progress("linear", 50.0, 100.0) == 0.5
+    assert sp.curve_progress("linear", 500.0, 100.0) == 1.0
+    assert sp.curve_progress("exponential", 100.0, 100.0) == pytest.approx(0.632, abs=1e-3)
+    # Custom curves are clamped to the 0 to 1 range
+    assert sp.curve_progress(lambda elapsed: elapsed, 5.0, 100.0) == 1.0
+    with pytest.raises(ValueError):
+        sp.SpawnScheduler(curve="quadratic")
+
+
+def test_interval_follows_the_curve_and_frame_time_throttle():
+    scheduler = sp.SpawnScheduler(curve="linear", base_interval=1.0, min_interval=0.5, ramp_time=10.0,
+                                  frame_time_budget=0.01, max_throttle=3.0)
+    scheduler.advance(5.0)
+    assert scheduler.interval() == pytest.approx(0.75)
+
+    # Frames twice as slow as the budget double the interval; far slower ones stop at max_throttle
+    scheduler.record_frame_time(0.02)
+    assert scheduler.interval() == pytest.approx(1.5)
+    scheduler.average_frame_time = None
+    scheduler.record_frame_time(1.0)
+    assert scheduler.throttle == 3.0
+
+    # Without a frame time budget, frame times are ignored
+    steady = sp.SpawnScheduler(frame_time_budget=None)
+    steady.record_frame_time(1.0)
+    assert steady.throttle == 1.0
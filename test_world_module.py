@@ -0,0 +1,102 @@
+# test_world_module.py:
+# Tests for the scrolling world: asteroids wake when the camera reaches their chunk and go back to
+# sleep when it leaves, drowsy chunks move in long steps, and no asteroid is lost or counted twice.
+
+# Third-Party Imports - External libraries
+import pygame
+import pytest
+
+# Local Module Imports - Game-specific modules
+import asteroid_module as a # Asteroid-related classes and functionality
+import world_module as wm # Scrolling world, chunks, and camera
+
+
+@pytest.fixture
+def world_game(new_game):
+    """A scripted game in a scrolling world, without its starting asteroids, and its world."""
+
+    simulation = new_game(world=wm.World())
+    world = simulation.world
+    world.asteroids_group.empty()
+    world.chunks.clear()
+    world.dormant = 0
+    return simulation, world
+
+
+def far_chunk_center(world, chunks_right):
+    """The center of the chunk 'chunks_right' chunks to the right of the player's."""
+
+    column, row = world.chunk_of(world.player.position)
+    return pygame.Vector2((column + chunks_right + 0.5) * world.chunk_size, (row + 0.5) * world.chunk_size)
+
+
+def test_asteroids_wake_and_sleep_with_the_camera(world_game):
+    simulation, world = world_game
+    player = world.player
+    start = pygame.Vector2(player.position)
+
+    # An asteroid far past the drowsy ring sleeps in its chunk, outside every group
+    position = far_chunk_center(world, 6)
+    asteroid = a.Asteroid.create(position.x, position.y, 40)
+    world.put_to_sleep(asteroid, world.chunk_of(position))
+    assert not asteroid.alive() and len(world) == 1
+    assert world.counts()["asleep"] == 1
+
+    # Fly the camera over it: the asteroid joins the asteroid group without moving
+    player.position = pygame.Vector2(position)
+    world.update(1 / 60)
+    assert asteroid in simulation.asteroids_group and asteroid.position == position
+    assert (world.woken, world.dormant, len(world)) == (1, 0, 1)
+
+    # Fly back: it goes to sleep again, without being handed back to its pool
+    player.position = start
+    world.update(1 / 60)
+    assert not asteroid.alive() and asteroid in world.chunks[world.chunk_of(position)]
+    assert (world.slept, world.dormant, len(world)) == (1, 1, 1)
+    assert a.Asteroid.pool is None or asteroid not in a.Asteroid.pool.pending
+
+
+def test_drowsy_chunks_move_in_long_steps(world_game):
+    _, world = world_game
+    key = next(iter(world.drowsy_keys))
+    position = pygame.Vector2((key[0] + 0.5) * world.chunk_size, (key[1] + 0.5) * world.chunk_size)
+    asteroid = a.Asteroid.create(position.x, position.y, 20)
+    asteroid.velocity = pygame.Vector2(6, 0)
+    world.put_to_sleep(asteroid, key)
+    assert world.counts()["drowsy"] == 1
+
+    # Frozen until the drowsy update, which covers every step since the last one
+    for _ in range(world.drowsy_interval - 1):
+        world.update(1 / 60)
+        assert asteroid.position == position
+    world.update(1 / 60)
+    assert tuple(asteroid.position) == pytest.approx(tuple(position + pygame.Vector2(6 * world.drowsy_interval / 60, 0)))
+
+
+def test_drowsy_asteroids_leaving_the_world_are_culled(world_game):
+    _, world = world_game
+    key = next(iter(world.drowsy_keys))
+    asteroid = a.Asteroid.create((key[0] + 0.5) * world.chunk_size, (key[1] + 0.5) * world.chunk_size, 20)
+    # Fast enough to cross the whole world in one drowsy step
+    asteroid.velocity = pygame.Vector2(-2 * world.width * 60 / world.drowsy_interval, 0)
+    world.put_to_sleep(asteroid, key)
+
+    for _ in range(world.drowsy_interval):
+        world.update(1 / 60)
+    assert world.culled == 1 and len(world) == 0 and not world.chunks
+
+
+def test_every_asteroid_is_awake_or_in_its_own_chunk(new_game):
+    simulation = new_game(world=wm.World())
+    world = simulation.world
+    simulation.run(600)
+
+    asleep = [asteroid for asteroids in world.chunks.values() for asteroid in asteroids]
+    assert len(asleep) == world.dormant and len(world) == len(asleep) + len(simulation.asteroids_group)
+    assert world.woken > 0 and world.slept > 0
+
+    # Dormant asteroids are outside every group, and no asteroid is both awake and dormant
+    assert not any(asteroid.alive() for asteroid in asleep)
+    assert not set(asleep) & set(simulation.asteroids_group)
+    assert all(world.chunk_of(asteroid.position) == key for key, asteroids in world.chunks.items() for asteroid in asteroids)
+    assert not set(world.chunks) & world.awake_keys
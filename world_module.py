@@ -0,0 +1,424 @@
+# world_module.py:
+# This module handles playing in a world much larger than the screen.
+# The world is divided into square chunks, and a camera follows the player. Only asteroids in the
+# chunks around the camera are "awake": they are in the asteroid group, so they move every step,
+# collide, and can be drawn. Further out, a ring of "drowsy" chunks moves its asteroids only every
+# few steps (in one bigger step), and everything beyond that is asleep and frozen in place. Sleeping
+# and drowsy asteroids wait in per-chunk lists outside every sprite group, so the work done each
+# frame depends on what is near the player, not on how many asteroids the whole world holds.
+
+# Standard Library Imports
+import contextlib # Used to build the temporary screen-position context manager
+
+# Third-Party Imports - External game libraries
+import numpy as np
+import pygame
+
+# Local Module Imports - Game-specific modules
+import constants as c # Game constants and configurations, like colors, sizes, and player settings
+import asteroid_module as a # Asteroid-related classes and functionality
+import collision_module as col # Gathers object positions and radii into arrays
+
+
+class Camera:
+    """
+    The part of the world shown on screen, centered on a target but never past the world's edges.
+
+    Attributes:
+        world_width (float): Width of the world, in pixels
+        world_height (float): Height of the world, in pixels
+        width (int): Width of the view, in pixels
+        height (int): Height of the view, in pixels
+        offset (pygame.Vector2): World position of the view's top-left corner
+    """
+
+    def __init__(self, world_width, world_height, width=c.SCREEN_WIDTH, height=c.SCREEN_HEIGHT):
+        """
+        Initialize a camera at the top-left corner of the world.
+
+        Args:
+            world_width (float): Width of the world, in pixels
+            world_height (float): Height of the world, in pixels
+            width (int): Width of the view, in pixels
+            height (int): Height of the view, in pixels
+        """
+
+        self.world_width = world_width
+        self.world_height = world_height
+        self.width = width
+        self.height = height
+        self.offset = pygame.Vector2(0, 0)
+
+    def follow(self, target):
+        """
+        Center the view on a world position, stopping at the world's edges.
+
+        Args:
+            target (pygame.Vector2): World position to center on, e.g. the player's position
+        """
+
+        self.offset.update(
+            min(max(target[0] - self.width / 2, 0), self.world_width - self.width),
+            min(max(target[1] - self.height / 2, 0), self.world_height - self.height),
+        )
+
+    def bounds(self, margin=0.0):
+        """
+        Get the world area the view covers.
+
+        Args:
+            margin (float): Distance to grow the area by on every side, in pixels
+
+        Returns:
+            tuple: (left, top, right, bottom) world coordinates
+        """
+
+        x, y = self.offset
+        return x - margin, y - margin, x + self.width + margin, y + self.height + margin
+
+    def visible(self, sprites):
+        """
+        Pick out the sprites that overlap the view.
+
+        Every sprite is given the ship's extent plus padding, like render_module.sprite_bounds,
+        so nothing partly on screen is left out.
+
+        Args:
+            sprites (iterable): Sprites to check, e.g. the drawable group
+
+        Returns:
+            list: The sprites that can be seen, in their original order
+        """
+
+        sprites = list(sprites)
+        if not sprites:
+            return sprites
+
+        positions, _, radii = col.circle_arrays(sprites)
+        reach = radii * c.SHIP_EXTENT + c.SPRITE_PADDING
+        left, top, right, bottom = self.bounds()
+
+        # One vectorized overlap test for every sprite
+        inside = ((positions[:, 0] + reach > left) & (positions[:, 0] - reach < right)
+                  & (positions[:, 1] + reach > top) & (positions[:, 1] - reach < bottom))
+        return [sprites[index] for index in np.flatnonzero(inside).tolist()]
+
+    @contextlib.contextmanager
+    def screen_positions(self, sprites):
+        """
+        Temporarily move sprites from world to screen coordinates for drawing.
+
+        Drawing code (Sprite.draw, render_module.draw_sprites) reads each sprite's position directly,
+        so, like loop_module.interpolated_positions, the sprites are moved for the 'with' block
+        and put back at their world positions when it ends.
+
+        Args:
+            sprites (list): Sprites about to be drawn
+        """
+
+        offset = pygame.Vector2(self.offset)
+        world_positions = [sprite.position for sprite in sprites]
+        for sprite, position in zip(sprites, world_positions):
+            sprite.position = position - offset
+
+        try:
+            yield
+        finally:
+            for sprite, position in zip(sprites, world_positions):
+                sprite.position = position
+
+
+class World(pygame.sprite.Sprite):
+    """
+    A large scrolling world whose asteroids are stored in chunks, simulated only near the camera.
+
+    The World is updated with the other updatable objects, before the asteroid field and the asteroids:
+    it moves the camera to the player, then moves asteroids between the asteroid group (awake) and the
+    chunk lists (drowsy or asleep) as the camera and the asteroids move.
+
+    Attributes:
+        width (float): Width of the world, in pixels
+        height (float): Height of the world, in pixels
+        chunk_size (float): Width and height of a chunk, in pixels
+        awake_margin (float): Distance past the view, in pixels, whose chunks are fully simulated
+        drowsy_chunks (int): Rings of chunks beyond the awake area that are simulated less often
+        drowsy_interval (int): Steps between updates of drowsy chunks
+        camera (Camera): The view that follows the player
+        chunks (dict): Maps (column, row) chunk keys to lists of asteroids that are not awake
+        awake_keys (frozenset): Keys of the chunks being fully simulated
+        drowsy_keys (frozenset): Keys of the chunks simulated every 'drowsy_interval' steps
+        dormant (int): Number of asteroids in the chunk lists
+        tick (int): Number of steps the world has been updated
+        woken (int): Number of times an asteroid joined the awake area
+        slept (int): Number of times an asteroid left the awake area
+        culled (int): Number of drowsy asteroids removed for leaving the world
+        culled_shots (int): Number of shots removed for leaving the awake area
+    """
+
+    def __init__(self, width=c.WORLD_WIDTH, height=c.WORLD_HEIGHT, chunk_size=c.WORLD_CHUNK_SIZE,
+                 awake_margin=c.WORLD_AWAKE_MARGIN, drowsy_chunks=c.WORLD_DROWSY_CHUNKS, drowsy_interval=c.WORLD_DROWSY_INTERVAL):
+        """
+        Initialize an empty world (setup_game_objects attaches it to a game).
+
+        Args:
+            width (float): Width of the world, in pixels
+            height (float): Height of the world, in pixels
+            chunk_size (float): Width and height of a chunk, in pixels
+            awake_margin (float): Distance past the view, in pixels, whose chunks are fully simulated
+            drowsy_chunks (int): Rings of chunks beyond the awake area that are simulated less often
+            drowsy_interval (int): Steps between updates of drowsy chunks
+        """
+
+        super().__init__()
+
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.awake_margin = awake_margin
+        self.drowsy_chunks = drowsy_chunks
+        self.drowsy_interval = drowsy_interval
+
+        self.camera = Camera(width, height)
+        self.chunks = {}
+        self.awake_keys = frozenset()
+        self.drowsy_keys = frozenset()
+        self.chunk_range = None # Chunk columns and rows the awake area covered at the last refresh
+        self.dormant = 0
+        self.tick = 0
+
+        # Set by attach()
+        self.player = None
+        self.asteroids_group = None
+        self.shots_group = None
+
+        # Counters, for inspection
+        self.woken = 0
+        self.slept = 0
+        self.culled = 0
+        self.culled_shots = 0
+
+    def attach(self, player, asteroids_group, shots_group, containers):
+        """
+        Join a game: follow its player and manage its asteroids and shots.
+
+        Args:
+            player (Player): The ship the camera follows
+            asteroids_group (pygame.sprite.Group): Group of the awake asteroids
+            shots_group (pygame.sprite.Group): Group of all player shot objects
+            containers: Groups the world itself is updated with (like AsteroidField.containers)
+        """
+
+        self.player = player
+        self.asteroids_group = asteroids_group
+        self.shots_group = shots_group
+        self.add(containers)
+
+        self.camera.follow(player.position)
+        self.refresh_chunks()
+
+    def chunk_of(self, position):
+        """
+        Get the key of the chunk a world position is in.
+
+        Args:
+            position (pygame.Vector2): World position
+
+        Returns:
+            tuple: (column, row) of the chunk
+        """
+
+        return int(position[0] // self.chunk_size), int(position[1] // self.chunk_size)
+
+    def contains(self, position, radius=0.0):
+        """
+        Check whether any part of a circle is inside the world.
+
+        Args:
+            position (pygame.Vector2): Center of the circle
+            radius (float): Radius of the circle
+
+        Returns:
+            bool: False once the whole circle is past an edge of the world
+        """
+
+        x, y = position
+        return -radius <= x <= self.width + radius and -radius <= y <= self.height + radius
+
+    def refresh_chunks(self):
+        """
+        Work out which chunks are awake and drowsy around the camera, waking asteroids in newly awake chunks.
+
+        Nothing is recalculated while the camera stays within the same chunks.
+        """
+
+        left, top, right, bottom = self.camera.bounds(self.awake_margin)
+        chunk_range = (int(left // self.chunk_size), int(top // self.chunk_size),
+                       int(right // self.chunk_size), int(bottom // self.chunk_size))
+        if chunk_range != self.chunk_range:
+            self.set_chunk_range(chunk_range)
+
+    def set_chunk_range(self, chunk_range):
+        """
+        Make a block of chunks awake and the rings around it drowsy, waking asteroids in newly awake chunks.
+
+        Args:
+            chunk_range (tuple): (first column, first row, last column, last row) of the awake chunks
+        """
+
+        self.chunk_range = chunk_range
+        first_column, first_row, last_column, last_row = chunk_range
+        ring = self.drowsy_chunks
+
+        awake_keys = frozenset(
+            (column, row) for column in range(first_column, last_column + 1) for row in range(first_row, last_row + 1)
+        )
+        self.drowsy_keys = frozenset(
+            (column, row)
+            for column in range(first_column - ring, last_column + ring + 1)
+            for row in range(first_row - ring, last_row + ring + 1)
+        ) - awake_keys
+
+        newly_awake = awake_keys - self.awake_keys
+        self.awake_keys = awake_keys
+        for key in newly_awake:
+            self.wake_chunk(key)
+
+    def wake_chunk(self, key):
+        """
+        Move every asteroid waiting in a chunk into the asteroid group.
+
+        Args:
+            key (tuple): (column, row) of the chunk
+        """
+
+        asteroids = self.chunks.pop(key, ())
+        for asteroid in asteroids:
+            asteroid.add(a.Asteroid.containers)
+        self.dormant -= len(asteroids)
+        self.woken += len(asteroids)
+
+    def put_to_sleep(self, asteroid, key):
+        """
+        Take an asteroid out of every sprite group and keep it in its chunk's list.
+
+        Args:
+            asteroid (Asteroid): The asteroid
+            key (tuple): (column, row) of the chunk it is in
+        """
+
+        # remove() rather than kill(), so the asteroid is not handed back to its pool
+        asteroid.remove(*asteroid.groups())
+        self.chunks.setdefault(key, []).append(asteroid)
+        self.dormant += 1
+
+    def populate(self, count, rng):
+        """
+        Scatter sleeping asteroids over the world, outside the area the game starts in.
+
+        Args:
+            count (int): Number of asteroids to create
+            rng: Random number source for their positions, sizes, and velocities
+        """
+
+        for _ in range(count):
+            # Asteroids only start in chunks that are not awake, so none appear on top of the player
+            position = pygame.Vector2(rng.uniform(0, self.width), rng.uniform(0, self.height))
+            key = self.chunk_of(position)
+            if key in self.awake_keys:
+                continue
+
+            asteroid = a.Asteroid.create(position.x, position.y, c.ASTEROID_MIN_RADIUS * rng.randint(1, c.ASTEROID_KINDS))
+            asteroid.velocity = pygame.Vector2(rng.randint(40, 100), 0).rotate(rng.uniform(0, 360))
+            self.put_to_sleep(asteroid, key)
+
+    def update(self, dt):
+        """
+        Follow the player and move asteroids between the awake area and the chunk lists.
+
+        Args:
+            dt (float): Delta time - seconds elapsed since last frame
+        """
+
+        self.tick += 1
+
+        # Keep the player inside the world, then center the view on it
+        radius = self.player.radius
+        x, y = self.player.position
+        if not (radius <= x <= self.width - radius and radius <= y <= self.height - radius):
+            self.player.position = pygame.Vector2(
+                min(max(x, radius), self.width - radius), min(max(y, radius), self.height - radius)
+            )
+        self.camera.follow(self.player.position)
+        self.refresh_chunks()
+
+        # Awake asteroids that drifted out of the awake area go to sleep in their new chunk
+        awake_keys = self.awake_keys
+        for asteroid in self.asteroids_group.sprites():
+            key = self.chunk_of(asteroid.position)
+            if key not in awake_keys:
+                self.put_to_sleep(asteroid, key)
+                self.slept += 1
+
+        # Shots can only hit awake asteroids, so they are removed once they leave the awake area
+        for shot in self.shots_group.sprites():
+            if self.chunk_of(shot.position) not in awake_keys:
+                shot.kill()
+                self.culled_shots += 1
+
+        if self.tick % self.drowsy_interval == 0:
+            self.update_drowsy(dt * self.drowsy_interval)
+
+    def update_drowsy(self, dt):
+        """
+        Move every asteroid in the drowsy chunks by one long step, and put each in its new chunk.
+
+        Args:
+            dt (float): Seconds to move them by (every step since their last update)
+        """
+
+        # Take all of them out first, so an asteroid moving into another drowsy chunk is not moved twice
+        moving = []
+        for key in self.drowsy_keys:
+            moving.extend(self.chunks.pop(key, ()))
+        self.dormant -= len(moving)
+
+        for asteroid in moving:
+            asteroid.update(dt)
+
+            if not self.contains(asteroid.position, asteroid.radius):
+                self.culled += 1
+                continue
+
+            key = self.chunk_of(asteroid.position)
+            if key in self.awake_keys:
+                asteroid.add(a.Asteroid.containers)
+                self.woken += 1
+            else:
+                self.chunks.setdefault(key, []).append(asteroid)
+                self.dormant += 1
+
+    def counts(self):
+        """
+        Count the world's asteroids by state.
+
+        Returns:
+            dict: Awake, drowsy, and asleep asteroids, plus the counters
+        """
+
+        drowsy = sum(len(self.chunks.get(key, ())) for key in self.drowsy_keys)
+        return {
+            "awake": len(self.asteroids_group) if self.asteroids_group is not None else 0,
+            "drowsy": drowsy,
+            "asleep": self.dormant - drowsy,
+            "chunks": len(self.chunks),
+            "woken": self.woken,
+            "slept": self.slept,
+            "culled": self.culled,
+            "culled_shots": self.culled_shots,
+        }
+
+    def __len__(self):
+        """Number of asteroids in the whole world, awake or not (what the spawn budget counts in a world game)."""
+
+        awake = len(self.asteroids_group) if self.asteroids_group is not None else 0
+        return awake + self.dormant